@@ -0,0 +1,67 @@
+"""
+Memory held by a day of MLB/NHL boxscores, with the slotted PlayerBoxscore and
+Play records versus the same classes backed by a per-instance __dict__.
+
+The feeds are fetched first (through the response cache, or from a
+record/replay archive for offline runs) so only the parsed records are measured.
+
+    python bench-records.py mlb 10/16/2019
+    python bench-records.py nhl 10/02/2019 archive.zip
+"""
+import gc
+import sys
+import tracemalloc
+from sportsdata.client import configure, get_json
+from sportsdata.mlb import boxscore as mlb_boxscore, playbyplay as mlb_playbyplay
+from sportsdata.mlb.constants import MLB_SCHEDULE_URL
+from sportsdata.mlb.util import get_final_game_ids
+from sportsdata.nhl import boxscore as nhl_boxscore, playbyplay as nhl_playbyplay
+from sportsdata.nhl.constants import NHL_LINESCORE_SCHEDULE_URL
+from datetime import datetime
+
+SPORTS = {
+    'mlb': (mlb_boxscore, mlb_playbyplay, MLB_SCHEDULE_URL, get_final_game_ids),
+    'nhl': (nhl_boxscore, nhl_playbyplay, NHL_LINESCORE_SCHEDULE_URL, nhl_boxscore.get_game_ids)
+}
+
+
+def without_slots(cls):
+    # Same methods, but attributes live in a per-instance __dict__ again.
+    namespace = {name: value for name, value in vars(cls).items()
+                 if name not in cls.__slots__ and name not in ('__slots__', '__dict__', '__weakref__')}
+    return type(cls.__name__, (), namespace)
+
+
+def measure(boxscore_module, games):
+    gc.collect()
+    tracemalloc.start()
+    boxscores = boxscore_module.GameBoxscores(games=games)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    players = sum(len(game._away_players._boxscores) + len(game._home_players._boxscores) for game in boxscores)
+    plays = sum(len(game._play_by_play._plays) for game in boxscores)
+    return size, players, plays
+
+
+sport, date = sys.argv[1], sys.argv[2]
+if len(sys.argv) > 3:
+    configure(archive_path=sys.argv[3], archive_mode='replay')
+else:
+    configure(cache_directory='cache')
+
+boxscore_module, playbyplay_module, schedule_url, get_game_ids = SPORTS[sport]
+date = datetime.strftime(datetime.strptime(date, '%m/%d/%Y'), '%Y-%m-%d')
+game_ids = get_game_ids(get_json(schedule_url.format(start_date=date, end_date=date)))
+games = [boxscore_module.get_game_feed(game_id) for game_id in game_ids]
+
+slotted_size, players, plays = measure(boxscore_module, games)
+
+player_class, play_class = boxscore_module.PlayerBoxscore, playbyplay_module.Play
+boxscore_module.PlayerBoxscore = without_slots(player_class)
+playbyplay_module.Play = without_slots(play_class)
+dict_size, _, _ = measure(boxscore_module, games)
+boxscore_module.PlayerBoxscore, playbyplay_module.Play = player_class, play_class
+
+print(f'{len(games)} games, {players} player boxscores, {plays} plays')
+print(f'__dict__ records: {dict_size / 1024:.0f} KiB')
+print(f'__slots__ records: {slotted_size / 1024:.0f} KiB ({1 - slotted_size / dict_size:.0%} less)')
@@ -1,8 +1,7 @@
 import pandas as pd
-import requests
-from datetime import datetime, timedelta
+from sportsdata.backfill import Backfill, CsvSink, PostSink
+from sportsdata.client import configure
 #from sportsdata.mlb.boxscore import Boxscore, Boxscores
-from sportsdata.mlb.boxscore import GameBoxscore, GameBoxscores
 # from sportsdata.mlb.game import Game, Games
 #from sportsdata.mlb.gameboxscore import GameBoxscore, GameBoxscores
 #from sportsdata.mlb.injury import Injury
@@ -33,43 +32,18 @@ from sportsdata.mlb.team import Team, Teams
 
 BASE_URL = 'https://localhost:44374/api/'
 
-season = '2019'
+# Re-runs over the same dates are served from disk instead of the network.
+configure(cache_directory='cache')
 
-#start_date = datetime.strptime('03/28/2019', '%m/%d/%Y')
-start_date = datetime.strptime('10/16/2019', '%m/%d/%Y')
-end_date = datetime.strptime('10/30/2019', '%m/%d/%Y')
-#end_date = datetime.strptime('3/30/2019', '%m/%d/%Y')
+#start_date = '03/28/2019'
+start_date = '10/16/2019'
+end_date = '10/30/2019'
+#end_date = '3/30/2019'
 
-loop_date = start_date
-
-while loop_date <= end_date:
-
-    date_str = datetime.strftime(loop_date, '%m/%d/%Y')
-    game_boxscores = GameBoxscores(date=date_str)
-
-    if len(game_boxscores._boxscores) == 0:
-        print('No games on ' + date_str)
-        loop_date = loop_date + timedelta(days=1)
-        continue
-
-    filename_date = datetime.strftime(loop_date, '%Y-%m-%d')
-
-    game_boxscores_path = f'csv/mlb/2019/game_boxscores/{filename_date}_game_boxscores.csv'
-    game_boxscores.dataframes.to_csv(game_boxscores_path)
-
-    player_boxscores_path = f'csv/mlb/2019/player_boxscores/{filename_date}_player_boxscores.csv'
-    player_dataframes = game_boxscores.player_dataframes
-    player_dataframes.to_csv(player_boxscores_path, index=False)
-    # print(player_dataframes)
-
-    pbps_path = f'csv/mlb/2019/play_by_plays/{filename_date}_pbp.csv'
-    pbp_dataframes = game_boxscores.pbp_dataframes
-    pbp_dataframes.to_csv(pbps_path, index=False)
-    # print(pbp_dataframes)
-
-    response = requests.post(url=BASE_URL + 'mlb/boxscores', json=game_boxscores.to_dicts, verify=False).json()
-
-    loop_date = loop_date + timedelta(days=1)
+# Re-running picks up where the last run stopped (see sportsdata/backfill.py).
+backfill = Backfill('mlb', start_date, end_date, [CsvSink('csv'), PostSink(BASE_URL, verify=False)])
+failed_games = backfill.run()
+print(failed_games)
 
 # players = Players(2019)
 # player_dicts = players.to_dicts
@@ -18,5 +18,18 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    # 3.9 for Executor.shutdown(cancel_futures=...). The checkpoint and change index files
+    # also need SQLite 3.24+ (UPSERT), which the python.org builds of 3.9 and later ship.
+    python_requires='>=3.9',
+    install_requires=[
+        'numpy',
+        'pandas>=2.0',
+        'requests',
+    ],
+    extras_require={
+        'async': ['aiohttp>=3.8'],
+        'parquet': ['pyarrow>=14'],
+        'orjson': ['orjson'],
+        'all': ['aiohttp>=3.8', 'pyarrow>=14', 'orjson'],
+    },
 )
\ No newline at end of file
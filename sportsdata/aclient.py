@@ -0,0 +1,303 @@
+import asyncio
+import json
+import re
+from .cache import ResponseCache, get_conditional_headers
+from .constants import VERIFY_REQUESTS, HTTP_POOL_MAXSIZE, HTTP_TIMEOUT, HTTP_TIMEOUTS, ASYNC_MAX_CONCURRENCY
+from .constants import HTTP_RATE_LIMITS, HTTP_RETRIES, HTTP_BACKOFF, HTTP_BACKOFF_MAX, HTTP_RETRY_STATUSES
+from .constants import CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_RESET
+from .constants import CACHE_DIRECTORY, CACHE_MAX_SIZE, CACHE_TTLS, CACHE_FOREVER, ARCHIVE_PATH, ARCHIVE_MODE
+from .ratelimit import AsyncRateLimiter, get_host_limiter
+from .replay import REPLAY, open_archive, get_request_body
+from .retry import RetryPolicy, CircuitBreaker
+from urllib.parse import urlsplit
+
+
+class AsyncClient:
+    """
+    asyncio counterpart of client.Client, built on aiohttp.
+
+    An aiohttp.ClientSession per event loop keeps connections alive per
+    host, and a semaphore caps how many requests are in flight at once so
+    that hundreds of games can be gathered on one event loop. A loop's
+    session is closed when asyncio.run shuts the loop down, so repeated
+    asyncio.run(X.afetch(...)) calls do not leak sessions.
+
+    Requests follow the same rate limit, retry and circuit breaker settings
+    and use the same on-disk response cache as the blocking client, but the
+    rate limiters and circuit breakers are the async client's own. Using
+    both clients at once can therefore send up to twice a host's rate limit,
+    and a host that is failing in one client is not tripped in the other.
+
+    Parameters
+    ----------
+    max_concurrency : int
+        Maximum number of requests in flight at once, across all hosts.
+
+    pool_maxsize : int
+        Maximum number of open connections per host.
+
+    timeout : float or tuple
+        Default (connect, read) timeout in seconds for every request.
+
+    timeouts : list (tuple)
+        (URL regex, timeout) pairs that override the default timeout.
+
+    verify : bool
+        Whether or not to verify TLS certificates.
+
+    rate_limits : dict
+        Host -> (requests per second, burst).
+
+    retry_policy : RetryPolicy
+        Retries for connection errors, timeouts and retryable statuses.
+
+    breaker_threshold : int
+        Consecutive failures after which requests to a host fail fast.
+
+    breaker_reset : float
+        Seconds before a host with an open circuit is tried again.
+
+    cache_directory : string
+        Directory for the on-disk response cache. None disables caching.
+
+    cache_max_size : int
+        Maximum size of the response cache in bytes.
+
+    cache_ttls : list (tuple)
+        (URL regex, seconds) pairs that decide how long a GET response stays cached.
+
+    archive_path : string
+        Path of a record/replay archive, shared with the blocking client.
+
+    archive_mode : string
+        'record' or 'replay' (see client.Client).
+    """
+
+    def __init__(self, max_concurrency=ASYNC_MAX_CONCURRENCY, pool_maxsize=HTTP_POOL_MAXSIZE,
+                 timeout=HTTP_TIMEOUT, timeouts=HTTP_TIMEOUTS, verify=VERIFY_REQUESTS, rate_limits=HTTP_RATE_LIMITS,
+                 retry_policy=None, breaker_threshold=CIRCUIT_BREAKER_THRESHOLD, breaker_reset=CIRCUIT_BREAKER_RESET,
+                 cache_directory=CACHE_DIRECTORY, cache_max_size=CACHE_MAX_SIZE, cache_ttls=CACHE_TTLS,
+                 archive_path=ARCHIVE_PATH, archive_mode=ARCHIVE_MODE):
+        self._max_concurrency = max_concurrency
+        self._pool_maxsize = pool_maxsize
+        self._timeout = timeout
+        self._timeouts = [(re.compile(pattern), t) for pattern, t in timeouts]
+        self._verify = verify
+        self._limiters = {domain: AsyncRateLimiter(rate, burst) for domain, (rate, burst) in rate_limits.items()}
+        self._retry_policy = retry_policy or RetryPolicy(HTTP_RETRIES, HTTP_BACKOFF, HTTP_BACKOFF_MAX,
+                                                         HTTP_RETRY_STATUSES)
+        self._breaker_threshold = breaker_threshold
+        self._breaker_reset = breaker_reset
+        self._breakers = {}
+        self._cache = None
+        self._archive = None
+        self._sessions = {}
+
+        if cache_directory is not None:
+            setattr(self, '_cache', ResponseCache(cache_directory, cache_max_size, cache_ttls))
+        if archive_path is not None:
+            setattr(self, '_archive', open_archive(archive_path, archive_mode))
+
+    async def _get_session(self):
+        # aiohttp sessions and semaphores belong to the loop they were created on,
+        # so every loop gets its own (session, semaphore, closer).
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None:
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=self._max_concurrency, limit_per_host=self._pool_maxsize,
+                                             ssl=None if self._verify else False)
+            client_session = aiohttp.ClientSession(connector=connector)
+            closer = self._close_on_shutdown(loop, client_session)
+            session = (client_session, asyncio.Semaphore(self._max_concurrency), closer)
+            self._sessions[loop] = session
+            await closer.__anext__()
+        return session
+
+    async def _close_on_shutdown(self, loop, session):
+        # Started once per loop. asyncio.run finalizes the async generators of its loop before
+        # closing it, which runs this finally on the session's own loop.
+        try:
+            yield
+        finally:
+            self._sessions.pop(loop, None)
+            await session.close()
+
+    def _get_timeout(self, url):
+        import aiohttp
+        timeout = self._timeout
+        for pattern, t in self._timeouts:
+            if pattern.search(url):
+                timeout = t
+                break
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+    def _get_breaker(self, host):
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers.setdefault(
+                host, CircuitBreaker(host, self._breaker_threshold, self._breaker_reset))
+        return breaker
+
+    async def request(self, method, url, **kwargs):
+        """
+        Sends a request and returns (content, content_type). Raises
+        aiohttp.ClientResponseError for 4xx/5xx responses that are not retried.
+        """
+        if self._archive is not None and self._archive.mode == REPLAY:
+            return self._archive.replay(method, url, get_request_body(kwargs))
+
+        _, content, headers = await self._send(method, url, **kwargs)
+        content_type = headers.get('Content-Type')
+        if self._archive is not None:
+            self._archive.record(method, url, get_request_body(kwargs), content, content_type)
+        return content, content_type
+
+    async def _send(self, method, url, **kwargs):
+        # Returns (status, content, headers) after retries.
+        import aiohttp
+        session, semaphore, _ = await self._get_session()
+        parts = urlsplit(url)
+        limiter = get_host_limiter(self._limiters, parts.hostname or '')
+        breaker = self._get_breaker(parts.netloc)
+        kwargs.setdefault('timeout', self._get_timeout(url))
+        attempt = 0
+        while True:
+            breaker.check()
+            try:
+                if limiter is not None:
+                    await limiter.acquire()
+                async with semaphore:
+                    async with session.request(method, url, **kwargs) as response:
+                        if response.status >= 500:
+                            breaker.record_failure()
+                        else:
+                            breaker.record_success()
+                        retry = response.status >= 400 and self._retry_policy.should_retry(method, attempt,
+                                                                                            response.status)
+                        if not retry:
+                            response.raise_for_status()
+                            content = await response.read()
+                        status, headers = response.status, response.headers
+                        retry_after = headers.get('Retry-After')
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                breaker.record_failure()
+                if not self._retry_policy.should_retry(method, attempt):
+                    raise
+                retry, retry_after = True, None
+            except BaseException:
+                # Anything else (ClientPayloadError, TooManyRedirects, cancellation) must not leave a trial open.
+                breaker.release_trial()
+                raise
+
+            if not retry:
+                break
+            # Sleep outside the semaphore so waiting retries do not hold slots.
+            await asyncio.sleep(self._retry_policy.get_delay(attempt, retry_after))
+            attempt += 1
+        return status, content, headers
+
+    async def get(self, url, ttl=None, **kwargs):
+        """
+        GET a URL, serving it from the response cache when a fresh copy exists,
+        or revalidating an expired one with a conditional request.
+        Returns (content, content_type).
+        """
+        if ttl is None and self._cache is not None:
+            ttl = self._cache.get_ttl(url)
+        if ttl is None or self._cache is None or self._archive is not None:
+            return await self.request('GET', url, **kwargs)
+
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
+
+        validators = self._cache.get_validators(url)
+        if validators is not None:
+            headers = get_conditional_headers(kwargs.get('headers'), validators)
+            status, content, response_headers = await self._send('GET', url, **dict(kwargs, headers=headers))
+            if status == 304:
+                cached = self._cache.revalidate(url, ttl)
+                if cached is not None:
+                    return cached
+                status, content, response_headers = await self._send('GET', url, **kwargs)
+        else:
+            status, content, response_headers = await self._send('GET', url, **kwargs)
+        content_type = response_headers.get('Content-Type')
+        self._cache.set(url, content, content_type, ttl,
+                        response_headers.get('ETag'), response_headers.get('Last-Modified'))
+        return content, content_type
+
+    def cache_forever(self, url):
+        if self._cache is not None:
+            self._cache.set_ttl(url, CACHE_FOREVER)
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+    async def close(self):
+        # Sessions of other loops are closed when those loops shut down.
+        session = self._sessions.get(asyncio.get_running_loop())
+        if session is not None:
+            await session[2].aclose()
+        if self._cache is not None:
+            self._cache.close()
+            setattr(self, '_cache', None)
+
+
+_client = None
+
+
+def get_async_client():
+    """
+    Returns the shared async client, creating it with the default settings on first use.
+    """
+    global _client
+    if _client is None:
+        _client = AsyncClient()
+    return _client
+
+
+async def configure_async(**kwargs):
+    """
+    Replaces the shared async client with one built from the given AsyncClient
+    parameters, e.g. await configure_async(max_concurrency=200).
+    """
+    global _client
+    if _client is not None:
+        await _client.close()
+    _client = AsyncClient(**kwargs)
+    return _client
+
+
+async def aget(url, **kwargs):
+    return await get_async_client().get(url, **kwargs)
+
+
+async def aget_json(url, **kwargs):
+    content, _ = await get_async_client().get(url, **kwargs)
+    return json.loads(content)
+
+
+async def aget_text(url, encoding='utf-8', **kwargs):
+    content, _ = await get_async_client().get(url, **kwargs)
+    return content.decode(encoding, errors='replace')
+
+
+def acache_forever(url):
+    get_async_client().cache_forever(url)
+
+
+async def apost(url, **kwargs):
+    return await get_async_client().post(url, **kwargs)
+
+
+async def aclose():
+    """
+    Closes the shared async client's session. Call before the event loop shuts down.
+    """
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
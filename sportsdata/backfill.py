@@ -0,0 +1,504 @@
+import multiprocessing
+import os
+import shutil
+import sqlite3
+from .bulk import BulkPoster
+from .changes import ChangeIndex
+from .client import configure, get_config
+from .constants import BACKFILL_CHECKPOINT_PATH, BACKFILL_SHARDS_PER_PROCESS, HTTP_RATE_LIMITS
+from .constants import BULK_BATCH_SIZE, BULK_MAX_IN_FLIGHT, BULK_COMPRESS_LEVEL
+from .export import merge_game_boxscores
+from .mlb import boxscore as mlb_boxscore
+from .mlb.constants import MLB_SEASONS
+from .nhl import boxscore as nhl_boxscore
+from .nhl.constants import NHL_SEASONS
+from .replay import RECORD
+from .util import iter_map
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from threading import Lock
+from time import time
+from uuid import uuid4
+
+DONE = 'done'
+FAILED = 'failed'
+
+# Boxscore module of each sport that has per-game feeds: get_game_ids_by_dates,
+# GameBoxscore and GameBoxscores.
+BACKFILL_SPORTS = {
+    'mlb': mlb_boxscore,
+    'nhl': nhl_boxscore
+}
+
+# Game and player ID columns of each sport's to_dict, for PostSink's change index.
+BACKFILL_ID_COLUMNS = {
+    'mlb': ('MlbGameId', 'MlbPlayerId'),
+    'nhl': ('NhlGameId', 'NhlPlayerId')
+}
+
+BACKFILL_SEASONS = {
+    'mlb': MLB_SEASONS,
+    'nhl': NHL_SEASONS
+}
+
+# Directory under a ParquetSink's path where the shards of a sharded backfill are staged.
+STAGING_DIRECTORY = '_shards'
+
+
+class CheckpointStore:
+    """
+    SQLite file that records the progress of backfills: which dates are
+    complete, and the status of every game ('done' once it has been written to
+    every sink, 'failed' with the error otherwise).
+
+    Parameters
+    ----------
+    path : string
+        Path of the checkpoint file. Created if it does not exist.
+    """
+
+    def __init__(self, path):
+        self._lock = Lock()
+        self._conn = None
+
+        self._open(path)
+
+    def _open(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        # WAL lets the processes of a sharded backfill read while one writes.
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS dates ('
+                     'sport TEXT NOT NULL, '
+                     'date TEXT NOT NULL, '
+                     'completed_at REAL NOT NULL, '
+                     'PRIMARY KEY (sport, date))')
+        conn.execute('CREATE TABLE IF NOT EXISTS games ('
+                     'sport TEXT NOT NULL, '
+                     'game_id INTEGER NOT NULL, '
+                     'date TEXT NOT NULL, '
+                     'status TEXT NOT NULL, '
+                     'attempts INTEGER NOT NULL, '
+                     'error TEXT, '
+                     'updated_at REAL NOT NULL, '
+                     'PRIMARY KEY (sport, game_id))')
+        conn.execute('CREATE INDEX IF NOT EXISTS games_status ON games (sport, status)')
+        conn.commit()
+        setattr(self, '_conn', conn)
+
+    def get_completed_dates(self, sport):
+        with self._lock:
+            rows = self._conn.execute('SELECT date FROM dates WHERE sport = ?', (sport,)).fetchall()
+        return {row[0] for row in rows}
+
+    def get_failed_games(self, sport):
+        """
+        Returns (date, game_id, attempts, error) for every game whose last attempt failed.
+        """
+        with self._lock:
+            return self._conn.execute('SELECT date, game_id, attempts, error FROM games '
+                                      'WHERE sport = ? AND status = ? ORDER BY date, game_id',
+                                      (sport, FAILED)).fetchall()
+
+    def get_game_statuses(self, sport, date):
+        with self._lock:
+            rows = self._conn.execute('SELECT game_id, status FROM games WHERE sport = ? AND date = ?',
+                                      (sport, date)).fetchall()
+        return dict(rows)
+
+    def record_failure(self, sport, date, game_id, error):
+        with self._lock:
+            self._conn.execute('INSERT INTO games (sport, game_id, date, status, attempts, error, updated_at) '
+                               'VALUES (?, ?, ?, ?, 1, ?, ?) '
+                               'ON CONFLICT (sport, game_id) DO UPDATE SET '
+                               'status = excluded.status, attempts = attempts + 1, error = excluded.error, '
+                               'updated_at = excluded.updated_at',
+                               (sport, game_id, date, FAILED, error, time()))
+            self._conn.commit()
+
+    def record_date(self, sport, date, game_ids, complete):
+        """
+        Marks games as done, and the date as complete if complete is True, in
+        one transaction.
+        """
+        now = time()
+        with self._lock:
+            self._conn.executemany('INSERT INTO games (sport, game_id, date, status, attempts, error, updated_at) '
+                                   'VALUES (?, ?, ?, ?, 1, NULL, ?) '
+                                   'ON CONFLICT (sport, game_id) DO UPDATE SET '
+                                   'status = excluded.status, error = NULL, updated_at = excluded.updated_at',
+                                   [(sport, game_id, date, DONE, now) for game_id in game_ids])
+            if complete:
+                self._conn.execute('INSERT OR REPLACE INTO dates (sport, date, completed_at) VALUES (?, ?, ?)',
+                                   (sport, date, now))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class CsvSink:
+    """
+    Writes each date's games to CSV files, one per table and date:
+    directory/{sport}/{season}/game_boxscores/{date}_game_boxscores.csv, and
+    likewise player_boxscores/{date}_player_boxscores.csv and
+    play_by_plays/{date}_pbp.csv. Files are replaced whole, so re-running a
+    date never duplicates rows.
+
+    Parameters
+    ----------
+    directory : string
+        Root directory of the CSV files.
+    """
+
+    def __init__(self, directory):
+        self._directory = directory
+
+    def write(self, sport, date, game_boxscores):
+        season = next(iter(game_boxscores))._season
+        directory = os.path.join(self._directory, sport, str(season))
+        _write_csv(game_boxscores.dataframes, True,
+                   os.path.join(directory, 'game_boxscores', f'{date}_game_boxscores.csv'))
+        _write_csv(game_boxscores.player_dataframes, False,
+                   os.path.join(directory, 'player_boxscores', f'{date}_player_boxscores.csv'))
+        _write_csv(game_boxscores.pbp_dataframes, False,
+                   os.path.join(directory, 'play_by_plays', f'{date}_pbp.csv'))
+
+
+class ParquetSink:
+    """
+    Appends each date's games to the Parquet datasets under path/{sport}/ (see
+    GameBoxscores.to_parquet). A re-run game replaces that game's rows.
+    """
+
+    def __init__(self, path):
+        self._path = path
+
+    def write(self, sport, date, game_boxscores):
+        game_boxscores.to_parquet(self._path)
+
+    def shard(self, index):
+        # Processes of a sharded backfill would race on each dataset's shared schema, so
+        # every shard writes to its own staging datasets instead.
+        return ParquetSink(os.path.join(self._path, STAGING_DIRECTORY, f'{index:05d}'))
+
+    def merge(self):
+        """
+        Moves the staged shards into the datasets, in shard (i.e. date)
+        order, so the result does not depend on which process finished first.
+        """
+        staging = os.path.join(self._path, STAGING_DIRECTORY)
+        if not os.path.isdir(staging):
+            return
+        for shard in sorted(os.listdir(staging)):
+            merge_game_boxscores(self._path, os.path.join(staging, shard),
+                                 {sport: game_key for sport, (game_key, _) in BACKFILL_ID_COLUMNS.items()})
+        shutil.rmtree(staging)
+
+
+class PostSink:
+    """
+    POSTs each date's games (GameBoxscore.to_dict) as JSON to
+    base_url/{sport}/boxscores, in gzip-compressed batches of batch_size
+    games with a few batches in flight (see bulk.BulkPoster). write()
+    returns once every batch of the date is acknowledged, so a date is only
+    checkpointed after the API has all of its games. When a date is run
+    again to retry its failed games, only the games that were not sent yet
+    are posted.
+
+    With a change_index_path, only new or changed games, player boxscores
+    and plays are sent (see changes.ChangeIndex), so re-running a date range
+    sends only stat corrections and the API has to upsert.
+
+    Parameters
+    ----------
+    base_url : string
+        e.g. 'https://localhost:44374/api/'.
+
+    batch_size, max_in_flight, compress_level
+        Passed to BulkPoster.
+
+    change_index_path : string
+        Path of the ChangeIndex of what was sent. None sends every game.
+
+    kwargs
+        Passed to client.post, e.g. verify=False.
+    """
+
+    def __init__(self, base_url, batch_size=BULK_BATCH_SIZE, max_in_flight=BULK_MAX_IN_FLIGHT,
+                 compress_level=BULK_COMPRESS_LEVEL, change_index_path=None, **kwargs):
+        self._base_url = base_url
+        self._batch_size = batch_size
+        self._max_in_flight = max_in_flight
+        self._compress_level = compress_level
+        self._change_index_path = change_index_path
+        self._kwargs = kwargs
+        self._posters = {}
+        self._change_index = None
+
+    writes_whole_dates = False
+
+    def __getstate__(self):
+        # Posters (threads) and the index connection are created again by each process of a sharded backfill.
+        return dict(self.__dict__, _posters={}, _change_index=None)
+
+    def write(self, sport, date, game_boxscores):
+        poster = self._posters.get(sport)
+        if poster is None:
+            poster = BulkPoster(f'{self._base_url}{sport}/boxscores', self._batch_size, self._max_in_flight,
+                                self._compress_level, **self._kwargs)
+            self._posters[sport] = poster
+        if self._change_index_path is None:
+            poster.send_all(boxscore.to_dict for boxscore in game_boxscores)
+            poster.flush()
+            return
+        if self._change_index is None:
+            self._change_index = ChangeIndex(self._change_index_path)
+        game_key, player_key = BACKFILL_ID_COLUMNS[sport]
+        changes, hashes = self._change_index.get_changes(sport, game_boxscores.to_dicts, game_key, player_key)
+        poster.send_all(changes)
+        poster.flush()
+        self._change_index.save(sport, hashes)
+
+    def close(self):
+        """
+        Shuts down the posters' threads and closes the change index.
+        Backfill.run calls it when it is done; a later write() opens them again.
+        """
+        posters, self._posters = self._posters, {}
+        change_index, self._change_index = self._change_index, None
+        try:
+            for poster in posters.values():
+                poster.close()
+        finally:
+            if change_index is not None:
+                change_index.close()
+
+
+class Backfill:
+    """
+    Fetches every game of a sport in a date range, one date at a time, and
+    writes each date to the sinks. Progress is kept in a checkpoint file, so a
+    run that stops (crash, Ctrl+C, network outage) can be started again with
+    the same arguments and picks up where it left off:
+
+    - Completed dates are skipped without any request.
+    - A date that was interrupted is run again. Its games that were already
+      fetched are served by the response cache (final game feeds are cached
+      forever), so configure the client with a cache_directory.
+    - Games that failed are recorded with their error and retried on the next
+      run. Only the dates that have failed games are revisited, and the sinks
+      rewrite such a date only when a retry succeeds (PostSink only sends
+      the retried games).
+
+    Dates from today on are never marked complete, since their games may not
+    be final yet.
+
+    With processes > 1 the dates left to do are split into contiguous shards
+    that run in a pool of worker processes, so parsing and building frames
+    is not limited to one core. Each worker configures the client like
+    client.configure was called in this process, with every host's rate
+    limit split between the workers. Sinks with a shard(index) method (e.g.
+    ParquetSink) write each shard separately, and their merge() combines
+    the shards in date order once the pool is done. Scripts that use
+    processes need an `if __name__ == '__main__':` guard.
+
+    Parameters
+    ----------
+    sport : string
+        'mlb' or 'nhl'.
+
+    start_date, end_date : string
+        Date range (inclusive) to backfill ('MM/DD/YYYY' format).
+
+    sinks : list
+        Objects with a write(sport, date, game_boxscores) method, e.g.
+        CsvSink, ParquetSink or PostSink. date is 'YYYY-MM-DD'. Sinks with a
+        close() method are closed when the run is done.
+
+    checkpoint_path : string
+        Path of the checkpoint file. Use a separate file for each set of sinks.
+
+    max_workers : int
+        Number of games of a date to fetch concurrently.
+
+    processes : int
+        Number of worker processes (default 1, i.e. run in this process).
+    """
+
+    def __init__(self, sport, start_date, end_date, sinks, checkpoint_path=BACKFILL_CHECKPOINT_PATH,
+                 max_workers=1, processes=1):
+        if sport not in BACKFILL_SPORTS:
+            raise ValueError(f'Backfills are not supported for {sport!r} (supported: {", ".join(BACKFILL_SPORTS)})')
+        self._sport = sport
+        self._module = BACKFILL_SPORTS[sport]
+        self._start_date = datetime.strptime(start_date, '%m/%d/%Y').date()
+        self._end_date = datetime.strptime(end_date, '%m/%d/%Y').date()
+        self._sinks = sinks
+        self._checkpoint_path = checkpoint_path
+        self._max_workers = max_workers
+        self._processes = processes
+
+    @classmethod
+    def for_season(cls, sport, season, sinks, **kwargs):
+        """
+        Backfill of a whole season, with its dates from MLB_SEASONS or
+        NHL_SEASONS, e.g. Backfill.for_season('mlb', 2019, sinks, processes=8).
+        """
+        for dates in BACKFILL_SEASONS.get(sport, []):
+            if dates['season'] == season:
+                return cls(sport, dates['start_date'], dates['end_date'], sinks, **kwargs)
+        raise ValueError(f'Unknown {sport} season: {season}')
+
+    def run(self):
+        """
+        Runs the backfill. Returns the (date, game_id, attempts, error) of the
+        games that are still failing.
+        """
+        checkpoint = CheckpointStore(self._checkpoint_path)
+        try:
+            # Shards staged by a sharded run that stopped before it could merge them.
+            _merge_sinks(self._sinks)
+            days = self._get_days(checkpoint)
+            if self._processes > 1 and len(days) > 1:
+                self._run_shards(days)
+                _merge_sinks(self._sinks)
+            else:
+                self._run_days(checkpoint, days, self._sinks)
+            return checkpoint.get_failed_games(self._sport)
+        finally:
+            checkpoint.close()
+            _close_sinks(self._sinks)
+
+    def _get_days(self, checkpoint):
+        # (date, is_retry) of the dates that are not complete or have failed games.
+        completed = checkpoint.get_completed_dates(self._sport)
+        failed = {row[0] for row in checkpoint.get_failed_games(self._sport)}
+        days = []
+        day = self._start_date
+        while day <= self._end_date:
+            key = day.isoformat()
+            if key not in completed or key in failed:
+                days.append((day, key in completed))
+            day += timedelta(days=1)
+        return days
+
+    def _run_days(self, checkpoint, days, sinks):
+        for day, is_retry in days:
+            self._run_date(checkpoint, day, is_retry, sinks)
+
+    def _run_shards(self, days):
+        config = get_config()
+        if config.get('archive_mode') == RECORD:
+            raise ValueError('A sharded backfill cannot record an archive; use processes=1')
+        # Every worker has its own token buckets, so each host's rate is split between them.
+        rate_limits = config.get('rate_limits', HTTP_RATE_LIMITS)
+        config['rate_limits'] = {host: (rate / self._processes, max(1, burst // self._processes))
+                                 for host, (rate, burst) in rate_limits.items()}
+
+        shard_count = min(len(days), self._processes * BACKFILL_SHARDS_PER_PROCESS)
+        shards = [days[len(days) * i // shard_count:len(days) * (i + 1) // shard_count] for i in range(shard_count)]
+        # spawn rather than fork: forked workers would share this process's sockets and SQLite connections.
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(self._processes, mp_context=context, initializer=_configure_worker,
+                                 initargs=(config,)) as executor:
+            futures = [executor.submit(_run_shard, self._sport, shard, [_shard_sink(sink, i) for sink in self._sinks],
+                                       self._checkpoint_path, self._max_workers)
+                       for i, shard in enumerate(shards)]
+            for future in futures:
+                future.result()
+
+    def _run_date(self, checkpoint, day, is_retry, sinks):
+        key = day.isoformat()
+        date_string = day.strftime('%m/%d/%Y')
+        game_ids = self._module.get_game_ids_by_dates(date_string, date_string)
+        statuses = checkpoint.get_game_statuses(self._sport, key)
+
+        done_ids = [game_id for game_id in game_ids if statuses.get(game_id) == DONE]
+        boxscores = self._get_games(checkpoint, key, [game_id for game_id in game_ids if game_id not in done_ids])
+        new_ids = set(boxscores)
+        if len(game_ids) == 0:
+            print(f'No {self._sport} games on {date_string}')
+        elif len(new_ids) > 0 or not is_retry:
+            # Most sinks write whole dates, so the games that are already done are read again
+            # (from the response cache) only when the date has something new to write.
+            if any(_writes_whole_dates(sink) for sink in sinks):
+                boxscores.update(self._get_games(checkpoint, key, done_ids))
+            games = {}
+            for sink in sinks:
+                whole = _writes_whole_dates(sink)
+                if whole not in games:
+                    games[whole] = [boxscores[game_id] for game_id in game_ids
+                                    if game_id in boxscores and (whole or game_id in new_ids)]
+                if len(games[whole]) > 0:
+                    sink.write(self._sport, key, self._module.GameBoxscores(boxscores=games[whole]))
+        # Games only count as done once every sink has them.
+        checkpoint.record_date(self._sport, key, list(boxscores), day < date.today())
+
+    def _get_games(self, checkpoint, key, game_ids):
+        # {game_id: boxscore} of the games that could be fetched and parsed. One game's
+        # failure is recorded and does not stop the rest of the date.
+        boxscores = {}
+        for game_id, boxscore, error in iter_map(self._get_game, game_ids, self._max_workers):
+            if error is None:
+                boxscores[game_id] = boxscore
+            else:
+                print(f'Failed to get {self._sport} game {game_id}: {error}')
+                checkpoint.record_failure(self._sport, key, game_id, error)
+        return boxscores
+
+    def _get_game(self, game_id):
+        try:
+            return game_id, self._module.GameBoxscore(game_id), None
+        except Exception as e:
+            return game_id, None, f'{type(e).__name__}: {e}'
+
+
+def _configure_worker(config):
+    configure(**config)
+
+
+def _run_shard(sport, days, sinks, checkpoint_path, max_workers):
+    # Runs in a worker process of a sharded backfill.
+    start_date, end_date = days[0][0].strftime('%m/%d/%Y'), days[-1][0].strftime('%m/%d/%Y')
+    backfill = Backfill(sport, start_date, end_date, sinks, checkpoint_path, max_workers)
+    checkpoint = CheckpointStore(checkpoint_path)
+    try:
+        backfill._run_days(checkpoint, days, sinks)
+    finally:
+        checkpoint.close()
+        _close_sinks(sinks)
+
+
+def _shard_sink(sink, index):
+    # Sinks without shard() (CSV files per date, POSTs) can be written by several processes at once.
+    return sink.shard(index) if hasattr(sink, 'shard') else sink
+
+
+def _merge_sinks(sinks):
+    for sink in sinks:
+        if hasattr(sink, 'merge'):
+            sink.merge()
+
+
+def _close_sinks(sinks):
+    for sink in sinks:
+        if hasattr(sink, 'close'):
+            sink.close()
+
+
+def _writes_whole_dates(sink):
+    # Sinks with writes_whole_dates = False (e.g. PostSink) are only given the games that
+    # are not done yet, so a retried date does not send its other games again.
+    return getattr(sink, 'writes_whole_dates', True)
+
+
+def _write_csv(dataframe, index, path):
+    # Written under a temporary name first so an interrupted run never leaves a partial file.
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = os.path.join(os.path.dirname(path), f'.{uuid4().hex}.tmp')
+    dataframe.to_csv(temp_path, index=index)
+    os.replace(temp_path, path)
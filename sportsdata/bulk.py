@@ -0,0 +1,132 @@
+import gzip
+import json
+from .client import post
+from .constants import BULK_BATCH_SIZE, BULK_MAX_IN_FLIGHT, BULK_COMPRESS_LEVEL
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+
+
+class BulkPoster:
+    """
+    Streams records (e.g. GameBoxscore.to_dict) to an HTTP endpoint as JSON
+    arrays of batch_size records.
+
+    - Batches are encoded (with orjson when it is installed), gzipped and
+      POSTed on background threads through the shared client, so requests
+      reuse its pooled keep-alive connections.
+    - At most max_in_flight batches are being sent at once. send() blocks
+      until one of them completes, which holds up whatever produces the
+      records, e.g. a GameBoxscores.iter() generator stops fetching games
+      while the endpoint is behind.
+    - A batch that fails raises its error from the next send() or flush().
+
+    Use it as a context manager, or call flush()/close() to send the last
+    partial batch:
+
+        with BulkPoster(BASE_URL + 'mlb/boxscores', verify=False) as poster:
+            poster.send_all(game.to_dict for game in GameBoxscores.iter(date=date))
+
+    Parameters
+    ----------
+    url : string
+        Endpoint the batches are POSTed to.
+
+    batch_size : int
+        Records per request.
+
+    max_in_flight : int
+        Batches being sent at once.
+
+    compress_level : int
+        gzip level of the request bodies (sent with Content-Encoding: gzip).
+        None sends them uncompressed.
+
+    kwargs
+        Passed to client.post, e.g. verify=False.
+    """
+
+    def __init__(self, url, batch_size=BULK_BATCH_SIZE, max_in_flight=BULK_MAX_IN_FLIGHT,
+                 compress_level=BULK_COMPRESS_LEVEL, **kwargs):
+        self._url = url
+        self._batch_size = batch_size
+        self._compress_level = compress_level
+        self._kwargs = kwargs
+        self._encode = _get_encoder()
+        self._batch = []
+        self._futures = []
+        self._slots = BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(max_in_flight)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._executor.shutdown(cancel_futures=True)
+
+    def send(self, record):
+        self._batch.append(record)
+        if len(self._batch) >= self._batch_size:
+            self._submit()
+
+    def send_all(self, records):
+        for record in records:
+            self.send(record)
+
+    def flush(self):
+        """
+        Sends the partial batch and waits until every batch is acknowledged.
+        """
+        if len(self._batch) > 0:
+            self._submit()
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+
+    def _submit(self):
+        self._raise_errors()
+        batch, self._batch = self._batch, []
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._post, batch)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def _post(self, batch):
+        # Encoding and compressing here keeps them off the thread producing the records.
+        body = self._encode(batch)
+        headers = dict(self._kwargs.get('headers') or {})
+        headers['Content-Type'] = 'application/json'
+        if self._compress_level is not None:
+            body = gzip.compress(body, self._compress_level)
+            headers['Content-Encoding'] = 'gzip'
+        post(self._url, data=body, **dict(self._kwargs, headers=headers))
+
+    def _raise_errors(self):
+        pending = []
+        for future in self._futures:
+            if future.done():
+                future.result()
+            else:
+                pending.append(future)
+        self._futures = pending
+
+
+def _get_encoder():
+    # orjson is optional. It encodes these records several times faster than json.
+    try:
+        import orjson
+    except ImportError:
+        return lambda records: json.dumps(records, separators=(',', ':')).encode()
+    return lambda records: orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY)
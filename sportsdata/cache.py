@@ -0,0 +1,191 @@
+import os
+import re
+import sqlite3
+from .constants import CACHE_FOREVER
+from datetime import date
+from threading import Lock
+from time import time
+from urllib.parse import unquote
+
+_ISO_DATE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+_US_DATE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+
+
+class ResponseCache:
+    """
+    Disk-backed HTTP response cache keyed by URL.
+
+    Entries are stored in a single SQLite file along with an expiry time and
+    the time they were last read. When the total body size goes over max_size,
+    expired entries are dropped first, then the least recently used ones.
+
+    The ETag and Last-Modified validators of each response are kept as well,
+    so an expired entry can be revalidated with a conditional GET instead of
+    being downloaded again.
+
+    Parameters
+    ----------
+    directory : string
+        Directory that holds the cache file. Created if it does not exist.
+
+    max_size : int
+        Maximum total size of the cached bodies, in bytes.
+
+    ttls : list (tuple)
+        (URL regex, seconds) pairs that decide how long a response stays
+        cached. The first matching pattern wins; unmatched URLs are not cached.
+        A third value, if given, is the TTL of URLs whose dates (YYYY-MM-DD
+        or MM/DD/YYYY) are all before today, e.g. schedules of past dates.
+    """
+
+    def __init__(self, directory, max_size, ttls):
+        self._max_size = max_size
+        self._ttls = [(re.compile(rule[0]), rule[1], rule[2] if len(rule) > 2 else None) for rule in ttls]
+        self._lock = Lock()
+        self._conn = None
+
+        self._open(directory)
+
+    def _open(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(directory, 'responses.db'), timeout=30, check_same_thread=False)
+        # WAL lets several processes (e.g. a sharded backfill) read while one writes.
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS responses ('
+                     'url TEXT PRIMARY KEY, '
+                     'content BLOB NOT NULL, '
+                     'content_type TEXT, '
+                     'expires_at REAL, '  # NULL = never expires
+                     'last_access REAL NOT NULL, '
+                     'size INTEGER NOT NULL, '
+                     'etag TEXT, '
+                     'last_modified TEXT)')
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(responses)')]
+        for column in ['etag', 'last_modified']:
+            if column not in columns:
+                # Cache files created before validators were stored.
+                conn.execute(f'ALTER TABLE responses ADD COLUMN {column} TEXT')
+        conn.execute('CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)')
+        conn.commit()
+        setattr(self, '_conn', conn)
+
+    def get_ttl(self, url):
+        for pattern, ttl, past_ttl in self._ttls:
+            if pattern.search(url):
+                if past_ttl is not None and _is_past(url):
+                    return past_ttl
+                return ttl
+        return None
+
+    def get(self, url):
+        """
+        Returns (content, content_type) for a fresh entry, or None on a miss.
+        """
+        now = time()
+        with self._lock:
+            row = self._conn.execute('SELECT content, content_type, expires_at FROM responses WHERE url = ?',
+                                     (url,)).fetchone()
+            if row is None:
+                return None
+            content, content_type, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                return None
+            self._conn.execute('UPDATE responses SET last_access = ? WHERE url = ?', (now, url))
+            self._conn.commit()
+        return content, content_type
+
+    def get_validators(self, url):
+        """
+        Returns (etag, last_modified) of an expired entry that has at least one
+        of them, or None if there is nothing to revalidate.
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT etag, last_modified FROM responses WHERE url = ?', (url,)).fetchone()
+        if row is None or (row[0] is None and row[1] is None):
+            return None
+        return row
+
+    def revalidate(self, url, ttl):
+        """
+        Marks an entry fresh again after a 304 Not Modified and returns its
+        (content, content_type), or None if it was evicted in the meantime.
+        """
+        now = time()
+        expires_at = None if ttl == CACHE_FOREVER else now + ttl
+        with self._lock:
+            row = self._conn.execute('SELECT content, content_type FROM responses WHERE url = ?', (url,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE responses SET expires_at = ?, last_access = ? WHERE url = ?',
+                               (expires_at, now, url))
+            self._conn.commit()
+        return row
+
+    def set(self, url, content, content_type, ttl, etag=None, last_modified=None):
+        """
+        Stores a response body. ttl is in seconds, or CACHE_FOREVER.
+        """
+        now = time()
+        expires_at = None if ttl == CACHE_FOREVER else now + ttl
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                               (url, content, content_type, expires_at, now, len(content), etag, last_modified))
+            self._evict(now)
+            self._conn.commit()
+
+    def set_ttl(self, url, ttl):
+        """
+        Changes the expiry of an existing entry, e.g. once a game is known to be final.
+        """
+        expires_at = None if ttl == CACHE_FOREVER else time() + ttl
+        with self._lock:
+            self._conn.execute('UPDATE responses SET expires_at = ? WHERE url = ?', (expires_at, url))
+            self._conn.commit()
+
+    def _evict(self, now):
+        total_size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total_size <= self._max_size:
+            return
+        self._conn.execute('DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?', (now,))
+        total_size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        rows = self._conn.execute('SELECT url, size FROM responses ORDER BY last_access')
+        evicted = []
+        for url, size in rows:
+            if total_size <= self._max_size:
+                break
+            evicted.append((url,))
+            total_size -= size
+        self._conn.executemany('DELETE FROM responses WHERE url = ?', evicted)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+def get_conditional_headers(headers, validators):
+    """
+    Returns a copy of a request's headers with If-None-Match/If-Modified-Since
+    set from an entry's (etag, last_modified).
+    """
+    headers = dict(headers or {})
+    etag, last_modified = validators
+    if etag is not None:
+        headers['If-None-Match'] = etag
+    if last_modified is not None:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def _is_past(url):
+    # Whether the URL has dates and all of them are before today.
+    url = unquote(url)
+    dates = [(year, month, day) for year, month, day in _ISO_DATE.findall(url)]
+    dates += [(year, month, day) for month, day, year in _US_DATE.findall(url)]
+    try:
+        return len(dates) > 0 and all(date(*map(int, ymd)) < date.today() for ymd in dates)
+    except ValueError:
+        return False
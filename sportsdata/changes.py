@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import sqlite3
+from threading import Lock
+from time import time
+
+GAME = 'game'
+PLAYER = 'player'
+PLAY = 'play'
+
+# Keys of the nested records in GameBoxscore.to_dict.
+PLAYER_LISTS = ('AwayPlayers', 'HomePlayers')
+PLAY_LIST = 'PlayByPlay'
+
+
+def get_content_hash(record):
+    """
+    Stable hash of a record's to_dict: its JSON with sorted keys, so the hash
+    only changes when a value does.
+    """
+    content = json.dumps(record, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+class ChangeIndex:
+    """
+    SQLite index of the content hash of every game, player boxscore and play
+    that was delivered somewhere (e.g. POSTed to our API), so re-running a
+    date range only sends what is new or changed (stat corrections).
+
+    Records are keyed by sport and game ID: players by their ID and plays by
+    their index in the game's play list, not by an ID from the source.
+    Inserting or removing a play therefore shifts every later play, and all
+    of them are sent again as changed. Hashes are only saved once the records
+    are delivered, so a failed POST is sent again on the next run.
+
+    Parameters
+    ----------
+    path : string
+        Path of the index file. Use a separate file for each destination.
+    """
+
+    def __init__(self, path):
+        self._lock = Lock()
+        self._conn = None
+
+        self._open(path)
+
+    def _open(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        # WAL lets the processes of a sharded backfill read while one writes.
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS records ('
+                     'sport TEXT NOT NULL, '
+                     'game_id TEXT NOT NULL, '
+                     'kind TEXT NOT NULL, '  # game, player or play
+                     'key TEXT NOT NULL, '
+                     'hash BLOB NOT NULL, '
+                     'updated_at REAL NOT NULL, '
+                     'PRIMARY KEY (sport, game_id, kind, key))')
+        conn.commit()
+        setattr(self, '_conn', conn)
+
+    def get_hashes(self, sport, game_id):
+        """
+        Returns {(kind, key): hash} of a game's delivered records.
+        """
+        with self._lock:
+            rows = self._conn.execute('SELECT kind, key, hash FROM records WHERE sport = ? AND game_id = ?',
+                                      (sport, str(game_id))).fetchall()
+        return {(kind, key): bytes(content_hash) for kind, key, content_hash in rows}
+
+    def save(self, sport, hashes):
+        """
+        Saves the hashes returned by get_changes once their records are delivered.
+        """
+        now = time()
+        with self._lock:
+            self._conn.executemany('INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?)',
+                                   [(sport, game_id, kind, key, content_hash, now)
+                                    for game_id, kind, key, content_hash in hashes])
+            self._conn.commit()
+
+    def get_changes(self, sport, games, game_key, player_key):
+        """
+        Compares games (GameBoxscore.to_dict) with the index. Returns the
+        games with a new or changed record, and the hashes to save once they
+        are delivered. Each game keeps its own fields (they are small and
+        identify the game) but only its new or changed players and plays, so
+        the receiving end has to upsert them.
+
+        Parameters
+        ----------
+        sport : string
+            'mlb', 'nhl', etc.
+
+        games : list (dict)
+            GameBoxscore.to_dict of each game.
+
+        game_key, player_key : string
+            Columns with the game and player IDs, e.g. 'MlbGameId' and
+            'MlbPlayerId'.
+        """
+        changes, hashes = [], []
+        for game in games:
+            game_id = str(game[game_key])
+            known = self.get_hashes(sport, game_id)
+            fields = {key: value for key, value in game.items() if key not in PLAYER_LISTS and key != PLAY_LIST}
+            records = [(GAME, game_id, fields)]
+            records.extend((PLAYER, str(player[player_key]), player)
+                           for key in PLAYER_LISTS for player in game.get(key, []))
+            records.extend((PLAY, str(i), play) for i, play in enumerate(game.get(PLAY_LIST, [])))
+
+            changed = set()
+            for kind, key, record in records:
+                content_hash = get_content_hash(record)
+                if known.get((kind, key)) != content_hash:
+                    changed.add((kind, key))
+                    hashes.append((game_id, kind, key, content_hash))
+            if len(changed) == 0:
+                continue
+            change = dict(fields)
+            for key in PLAYER_LISTS:
+                if key in game:
+                    change[key] = [player for player in game[key] if (PLAYER, str(player[player_key])) in changed]
+            if PLAY_LIST in game:
+                change[PLAY_LIST] = [play for i, play in enumerate(game[PLAY_LIST]) if (PLAY, str(i)) in changed]
+            changes.append(change)
+        return changes, hashes
+
+    def close(self):
+        self._conn.close()
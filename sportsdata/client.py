@@ -0,0 +1,279 @@
+import re
+import requests
+from .cache import ResponseCache, get_conditional_headers
+from .constants import VERIFY_REQUESTS, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_TIMEOUT, HTTP_TIMEOUTS
+from .constants import HTTP_RATE_LIMITS, HTTP_RETRIES, HTTP_BACKOFF, HTTP_BACKOFF_MAX, HTTP_RETRY_STATUSES
+from .constants import CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_RESET
+from .constants import CACHE_DIRECTORY, CACHE_MAX_SIZE, CACHE_TTLS, CACHE_FOREVER, ARCHIVE_PATH, ARCHIVE_MODE
+from .ratelimit import RateLimiter, get_host_limiter
+from .replay import REPLAY, open_archive, get_request_body
+from .retry import RetryPolicy, CircuitBreaker
+from requests.adapters import HTTPAdapter
+from requests.utils import get_encoding_from_headers
+from time import sleep
+from urllib.parse import urlsplit
+
+
+class Client:
+    """
+    HTTP client shared by every sport module.
+
+    Wraps a single requests.Session so connections to statsapi.mlb.com,
+    statsapi.web.nhl.com, etc. are kept alive and reused between requests
+    instead of doing a new TCP + TLS handshake for every call.
+
+    Parameters
+    ----------
+    pool_connections : int
+        Number of hosts to keep connection pools for.
+
+    pool_maxsize : int
+        Maximum number of connections kept alive per host.
+
+    timeout : float or tuple
+        Default (connect, read) timeout in seconds for every request.
+
+    timeouts : list (tuple)
+        (URL regex, timeout) pairs that override the default timeout for
+        matching URLs. The first matching pattern wins.
+
+    verify : bool
+        Whether or not to verify TLS certificates.
+
+    rate_limits : dict
+        Host -> (requests per second, burst). Every request waits on its
+        host's token bucket before it is sent.
+
+    retry_policy : RetryPolicy
+        Retries for connection errors, timeouts and retryable statuses (see
+        retry.py). Defaults to the HTTP_RETRIES/HTTP_BACKOFF constants.
+
+    breaker_threshold : int
+        Consecutive failures after which requests to a host fail fast with
+        CircuitOpenError.
+
+    breaker_reset : float
+        Seconds before a host with an open circuit is tried again.
+
+    cache_directory : string
+        Directory for the on-disk response cache. None disables caching.
+
+    cache_max_size : int
+        Maximum size of the response cache in bytes.
+
+    cache_ttls : list (tuple)
+        (URL regex, seconds) pairs that decide how long a GET response stays
+        cached. The first matching pattern wins; unmatched URLs are not cached.
+
+    archive_path : string
+        Path of a record/replay archive (see replay.py). None disables it.
+
+    archive_mode : string
+        'record' to save every response to the archive, or 'replay' to serve
+        responses from it without any network access. The response cache is
+        bypassed in both modes so that every response goes through the archive.
+    """
+
+    def __init__(self, pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                 timeout=HTTP_TIMEOUT, timeouts=HTTP_TIMEOUTS, verify=VERIFY_REQUESTS, rate_limits=HTTP_RATE_LIMITS,
+                 retry_policy=None, breaker_threshold=CIRCUIT_BREAKER_THRESHOLD, breaker_reset=CIRCUIT_BREAKER_RESET,
+                 cache_directory=CACHE_DIRECTORY, cache_max_size=CACHE_MAX_SIZE, cache_ttls=CACHE_TTLS,
+                 archive_path=ARCHIVE_PATH, archive_mode=ARCHIVE_MODE):
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._timeout = timeout
+        self._timeouts = [(re.compile(pattern), t) for pattern, t in timeouts]
+        self._verify = verify
+        self._limiters = {domain: RateLimiter(rate, burst) for domain, (rate, burst) in rate_limits.items()}
+        self._retry_policy = retry_policy or RetryPolicy(HTTP_RETRIES, HTTP_BACKOFF, HTTP_BACKOFF_MAX,
+                                                         HTTP_RETRY_STATUSES)
+        self._breaker_threshold = breaker_threshold
+        self._breaker_reset = breaker_reset
+        self._breakers = {}
+        self._cache = None
+        self._archive = None
+        self._session = None
+
+        self._create_session()
+        if cache_directory is not None:
+            setattr(self, '_cache', ResponseCache(cache_directory, cache_max_size, cache_ttls))
+        if archive_path is not None:
+            setattr(self, '_archive', open_archive(archive_path, archive_mode))
+
+    def _create_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self._pool_connections, pool_maxsize=self._pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        setattr(self, '_session', session)
+
+    def _get_timeout(self, url):
+        for pattern, timeout in self._timeouts:
+            if pattern.search(url):
+                return timeout
+        return self._timeout
+
+    def _get_breaker(self, host):
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers.setdefault(
+                host, CircuitBreaker(host, self._breaker_threshold, self._breaker_reset))
+        return breaker
+
+    def request(self, method, url, **kwargs):
+        if self._archive is not None and self._archive.mode == REPLAY:
+            content, content_type = self._archive.replay(method, url, get_request_body(kwargs))
+            return self._build_response(url, content, content_type)
+
+        parts = urlsplit(url)
+        limiter = get_host_limiter(self._limiters, parts.hostname or '')
+        breaker = self._get_breaker(parts.netloc)
+        kwargs.setdefault('timeout', self._get_timeout(url))
+        kwargs.setdefault('verify', self._verify)
+        attempt = 0
+        while True:
+            breaker.check()
+            try:
+                if limiter is not None:
+                    limiter.acquire()
+                response = self._session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                breaker.record_failure()
+                if not self._retry_policy.should_retry(method, attempt):
+                    raise
+                sleep(self._retry_policy.get_delay(attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                # Anything else (ChunkedEncodingError, TooManyRedirects, ...) must not leave a trial open.
+                breaker.release_trial()
+                raise
+
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            if response.status_code >= 400 and self._retry_policy.should_retry(method, attempt, response.status_code):
+                sleep(self._retry_policy.get_delay(attempt, response.headers.get('Retry-After')))
+                attempt += 1
+                continue
+            response.raise_for_status()
+            break
+
+        if self._archive is not None:
+            self._archive.record(method, url, get_request_body(kwargs), response.content,
+                                 response.headers.get('Content-Type'))
+        return response
+
+    def get(self, url, ttl=None, **kwargs):
+        """
+        GET a URL, serving it from the response cache when a fresh copy exists.
+        An expired copy with an ETag or Last-Modified is revalidated with a
+        conditional request and reused if the server answers 304 Not Modified.
+        ttl overrides the cache_ttls lookup (seconds, or CACHE_FOREVER).
+        """
+        if ttl is None and self._cache is not None:
+            ttl = self._cache.get_ttl(url)
+        if ttl is None or self._cache is None or self._archive is not None:
+            return self.request('GET', url, **kwargs)
+
+        cached = self._cache.get(url)
+        if cached is not None:
+            content, content_type = cached
+            return self._build_response(url, content, content_type)
+
+        validators = self._cache.get_validators(url)
+        if validators is not None:
+            headers = get_conditional_headers(kwargs.get('headers'), validators)
+            response = self.request('GET', url, **dict(kwargs, headers=headers))
+            if response.status_code == 304:
+                cached = self._cache.revalidate(url, ttl)
+                if cached is not None:
+                    content, content_type = cached
+                    return self._build_response(url, content, content_type)
+                response = self.request('GET', url, **kwargs)
+        else:
+            response = self.request('GET', url, **kwargs)
+        self._cache.set(url, response.content, response.headers.get('Content-Type'), ttl,
+                        response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return response
+
+    def _build_response(self, url, content, content_type):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = content
+        if content_type is not None:
+            response.headers['Content-Type'] = content_type
+        response.encoding = get_encoding_from_headers(response.headers)
+        return response
+
+    def cache_forever(self, url):
+        """
+        Marks a cached response as immutable, e.g. the feed of a game that is final.
+        """
+        if self._cache is not None:
+            self._cache.set_ttl(url, CACHE_FOREVER)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        self._session.close()
+        if self._cache is not None:
+            self._cache.close()
+
+
+_client = None
+_config = {}
+
+
+def get_client():
+    """
+    Returns the shared client, creating it with the default settings on first use.
+    """
+    global _client
+    if _client is None:
+        _client = Client()
+    return _client
+
+
+def configure(**kwargs):
+    """
+    Replaces the shared client with one built from the given Client parameters,
+    e.g. configure(pool_maxsize=32, timeout=(3, 60)).
+    """
+    global _client, _config
+    if _client is not None:
+        _client.close()
+    _client = Client(**kwargs)
+    _config = kwargs
+    return _client
+
+
+def get_config():
+    """
+    Returns the parameters the shared client was last configured with, e.g. to
+    configure the same client in a worker process.
+    """
+    return dict(_config)
+
+
+def get(url, **kwargs):
+    return get_client().get(url, **kwargs)
+
+
+def get_json(url, **kwargs):
+    return get_client().get(url, **kwargs).json()
+
+
+def get_text(url, **kwargs):
+    return get_client().get(url, **kwargs).text
+
+
+def cache_forever(url):
+    get_client().cache_forever(url)
+
+
+def post(url, **kwargs):
+    return get_client().post(url, **kwargs)
@@ -4,6 +4,13 @@ SPORTS = ['nfl', 'mlb', 'nba', 'nhl']
 
 DFS_WEBSITES = ['dk', 'fd', 'yh']
 
+# Columns of fantasy.add_fantasy_points, named like the salary tables' fantasy points.
+DFS_FANTASY_POINTS_COLUMNS = {
+    'dk': 'DraftKingsFp',
+    'fd': 'FanDuelFp',
+    'yh': 'YahooFp'
+}
+
 DAYS_IN_MONTH = {
     1: 31,
     2: 28,  # todo- Leap years
@@ -18,3 +25,84 @@ DAYS_IN_MONTH = {
     11: 30,
     12: 31
 }
+
+# Shared HTTP client (see client.py)
+HTTP_POOL_CONNECTIONS = 10  # Number of hosts to keep connection pools for
+HTTP_POOL_MAXSIZE = 10  # Connections kept alive per host
+HTTP_TIMEOUT = (5, 30)  # (connect, read) seconds
+ASYNC_MAX_CONCURRENCY = 100  # Requests in flight at once across all hosts (see aclient.py)
+
+# Bulk POSTs to the ingestion API (see bulk.py).
+BULK_BATCH_SIZE = 25  # Records per request
+BULK_MAX_IN_FLIGHT = 3  # Batches being sent at once; further sends block until one completes
+BULK_COMPRESS_LEVEL = 5  # gzip level of request bodies, None to send them uncompressed
+
+# Timeouts by URL pattern (first match wins) for endpoints that need something other
+# than HTTP_TIMEOUT. stats.nba.com tends to hang rather than refuse, so it gets a short read.
+HTTP_TIMEOUTS = [
+    (r'stats\.nba\.com', (5, 10)),
+]
+
+# Retries (see retry.py): exponential backoff with full jitter, honoring Retry-After.
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.5  # Base delay in seconds, doubled every retry
+HTTP_BACKOFF_MAX = 60  # Seconds
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Per-host circuit breaker: after this many consecutive failures, requests to the host
+# fail immediately until CIRCUIT_BREAKER_RESET seconds have passed.
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_RESET = 60  # Seconds
+
+# Per-host rate limits: (requests per second, burst). Subdomains inherit their parent's
+# limit, e.g. 'www.hltv.org' uses the 'hltv.org' entry. Hosts not listed are not limited.
+HTTP_RATE_LIMITS = {
+    'statsapi.mlb.com': (2.0, 4),
+    'statsapi.web.nhl.com': (2.0, 4),
+    'stats.nba.com': (0.5, 1),
+    'data.nba.com': (1.0, 2),
+    'hltv.org': (0.2, 1),
+    'bovada.lv': (1.0, 2),
+    'feeds.nfl.com': (0.2, 1),
+    'rotoguru1.com': (0.33, 1),
+    'api.draftkings.com': (0.2, 1),
+}
+
+# On-disk response cache (see cache.py). Disabled unless a directory is set here or
+# passed to client.configure(cache_directory=...).
+CACHE_DIRECTORY = None
+CACHE_MAX_SIZE = 2 * 1024 ** 3  # Bytes
+
+# Seconds a cached response stays fresh, by URL pattern (first match wins). URLs that
+# match no pattern are not cached. Game feeds are cached forever once the game is final.
+# An optional third value is used instead when every date in the URL is before today:
+# schedules say which games are final, so only those of past dates can be kept long.
+CACHE_FOREVER = -1
+CACHE_TTLS = [
+    (r'/game/\d+/(feed/live|boxscore|playByPlay)', 60),
+    (r'00_full_schedule\.json', 5 * 60),
+    (r'/schedule\?', 5 * 60, 6 * 60 * 60),
+    (r'/teams|/players\?|commonteamroster', 24 * 60 * 60),
+    (r'stats\.nba\.com/stats/boxscore', 60),
+    (r'bovada\.lv', 10),
+    (r'hltv\.org', 60 * 60),
+    (r'-reference\.com/friv/injuries', 60 * 60),
+    (r'rotoguru1\.com', 24 * 60 * 60),
+]
+
+# Record/replay archive (see replay.py). With ARCHIVE_MODE = 'record' every response is
+# saved to ARCHIVE_PATH; with 'replay' responses are read back from it and nothing is sent.
+ARCHIVE_PATH = None
+ARCHIVE_MODE = None
+
+# Checkpoint file of backfill.Backfill: completed dates and the status of every game.
+BACKFILL_CHECKPOINT_PATH = 'checkpoints/backfill.db'
+# Shards per worker process of a sharded backfill. More, smaller shards even out the
+# work of busy and quiet stretches of a season.
+BACKFILL_SHARDS_PER_PROCESS = 4
+
+# Odds poller (see poller.py): seconds between polls of every sport's Bovada odds, and
+# between writes of the buffered price changes to ODDS_HISTORY_PATH.
+ODDS_HISTORY_PATH = 'odds'
+ODDS_POLL_INTERVAL = 10
+ODDS_FLUSH_INTERVAL = 5 * 60
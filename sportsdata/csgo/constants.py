@@ -0,0 +1,2 @@
+# Bovada's esports odds. It has other games than CSGO too (see odds.get_csgo_items).
+CSGO_ODDS_URL = 'https://www.bovada.lv/services/sports/event/v2/events/A/description/esports'
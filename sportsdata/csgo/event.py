@@ -1,5 +1,6 @@
 import pandas as pd
-import requests
+from ..client import get_text
+from ..util import build_dataframe, to_json_safe
 from pyquery import PyQuery as pq
 
 
@@ -27,19 +28,19 @@ class Event:
         setattr(self, '_csgo_event_id', event_id)
         setattr(self, '_event_name', event_name)
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'CsgoEventId': self._csgo_event_id,
             'EventName': self._event_name,
         }
-        return pd.DataFrame([fields_to_include], index=None)
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Events:
@@ -50,7 +51,7 @@ class Events:
 
     def _get_events(self):
         url = 'https://www.hltv.org/events#tab-ALL'
-        events_html = pq(url, verify=False)
+        events_html = pq(get_text(url, verify=False))
 
         for div in events_html('div').items():
             if div.attr['id'] == 'ALL':
@@ -67,10 +68,7 @@ class Events:
 
     @property
     def dataframes(self):
-        frames = []
-        for event in self.__iter__():
-            frames.append(event.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([event._get_fields() for event in self])
 
     @property
     def to_dicts(self):
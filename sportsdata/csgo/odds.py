@@ -1,7 +1,8 @@
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
-from datetime import datetime
+from ..client import get_json
+from ..odds import EventOdds, build_market_dataframe, get_game_events, set_game_lines
+from ..util import build_dataframe, to_json_safe
+from .constants import CSGO_ODDS_URL
 
 
 class MatchOdds:
@@ -26,54 +27,26 @@ class MatchOdds:
         self._team2_moneyline_odds_decimal = None
         self._team2_handicap = None
         self._over_under = None
+        self._odds = None
 
         self._set_odds(odds)
 
     def _set_odds(self, odds):
-        setattr(self, '_event_description', odds['description'])
-        setattr(self, '_event_start_time', datetime.fromtimestamp(odds['startTime']/1000).isoformat())
-
-        # Game Lines, Alternative Lines, Score Props, etc.
-        for display_group in odds['displayGroups']:
-            if display_group['description'] == 'Game Lines':
-                # Moneyline, Point Spread, Total
-                for market in display_group['markets']:
-                    if market['description'] == 'Moneyline' and market['period']['description'] == 'Game':
-                        self._get_moneyline(market)
-                    if market['description'] == 'Point Spread' and market['period']['description'] == 'Game':
-                        self._get_point_spread(market)
-                    if market['description'] == 'Total' and market['period']['description'] == 'Game':
-                        self._get_totals(market)
-
-    def _get_moneyline(self, market):
-        for outcome in market['outcomes']:
-            if outcome['type'] == 'A':
-                setattr(self, '_team1_name', outcome['description'])
-                setattr(self, '_team1_moneyline_odds_american', outcome['price']['american'])
-                setattr(self, '_team1_moneyline_odds_decimal', outcome['price']['decimal'])
-            if outcome['type'] == 'H':
-                setattr(self, '_team2_name', outcome['description'])
-                setattr(self, '_team2_moneyline_odds_american', outcome['price']['american'])
-                setattr(self, '_team2_moneyline_odds_decimal', outcome['price']['decimal'])
-
-    def _get_point_spread(self, market):
-        for outcome in market['outcomes']:
-            if outcome['type'] == 'A':
-                setattr(self, '_team1_handicap', outcome['price']['handicap'])
-            if outcome['type'] == 'H':
-                setattr(self, '_team2_handicap', outcome['price']['handicap'])
-
-    def _get_totals(self, market):
-        for outcome in market['outcomes']:
-            if outcome['description'] == 'Over':
-                #totals['Over'] = outcome['price']['handicap']
-                setattr(self, '_over_under', outcome['price']['handicap'])
-            # if outcome['description'] == 'Under':
-                #totals['Under'] = outcome['price']['handicap']
+        event_odds = EventOdds(odds)
+        setattr(self, '_odds', event_odds)
+        setattr(self, '_event_description', event_odds.event_description)
+        setattr(self, '_event_start_time', event_odds.event_start_time.isoformat())
+        set_game_lines(self, event_odds, 'Game', ('team1', 'team2'), 'name')
 
     @property
-    def dataframe(self):
-        fields_to_include = {
+    def markets(self):
+        """
+        EventOdds with every market of the match, not just the game lines.
+        """
+        return self._odds
+
+    def _get_fields(self):
+        return {
             'EventDescription': self._event_description,
             'EventStartTime': self._event_start_time,
             'Team1Name': self._team1_name,
@@ -86,14 +59,14 @@ class MatchOdds:
             'Team2Handicap': self._team2_handicap,
             'OverUnder': self._over_under
         }
-        return pd.DataFrame([fields_to_include], index=[self._event_description])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._event_description])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        #dic['EventStartTime'] = dic['EventStartTime'].isoformat()
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class MatchesOdds:
@@ -117,37 +90,32 @@ class MatchesOdds:
         return iter(self.__repr__())
 
     def _get_odds(self):
-        url = 'https://www.bovada.lv/services/sports/event/v2/events/A/description/esports'
-        print('Getting odds from ' + url)
-        odds_json = requests.get(url, verify=VERIFY_REQUESTS).json()
+        print('Getting odds from ' + CSGO_ODDS_URL)
+        odds_json = get_json(CSGO_ODDS_URL)
         if len(odds_json) == 0:
             print(f'No CSGO odds found.')
             return
 
-        # Bovada's esports odds url contains data for games other than CSGO. Get CSGO objects.
-        csgo_items = []
-        for item in odds_json:
-            description = item['path'][0]['description'].upper()
-            if 'CS:GO' in description or 'CSGO' in description or 'COUNTER-STRIKE' in description:
-                csgo_items.append(item)
-
+        csgo_items = get_csgo_items(odds_json)
         print(len(csgo_items))
 
-        for item in csgo_items:
-            for event in item['events']:
-                if event['type'] != 'GAMEEVENT' or datetime.fromtimestamp(event['startTime']/1000) < datetime.now():
-                    # Skip odds that are not for match-level events. Skip odds for matches in the past.
-                    continue
-                odds = MatchOdds(event)
-                if odds._team1_name is not None:  # todo?
-                    self._odds.append(odds)
+        # Skip odds that are not for match-level events. Skip odds for matches in the past.
+        for event in get_game_events(csgo_items, upcoming_only=True, all_items=True):
+            odds = MatchOdds(event)
+            if odds._team1_name is not None:  # todo?
+                self._odds.append(odds)
 
     @property
     def dataframes(self):
-        frames = []
-        for odds in self.__iter__():
-            frames.append(odds.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([odds._get_fields() for odds in self],
+                               [odds._event_description for odds in self])
+
+    @property
+    def market_dataframes(self):
+        """
+        Every market of every match, one row per outcome (odds.MARKET_COLUMNS).
+        """
+        return build_market_dataframe([odds._odds for odds in self])
 
     @property
     def to_dicts(self):
@@ -155,3 +123,16 @@ class MatchesOdds:
         for odds in self.__iter__():
             dics.append(odds.to_dict)
         return dics
+
+
+def get_csgo_items(odds_json):
+    """
+    CSGO items of Bovada's esports odds, whose url contains data for games
+    other than CSGO.
+    """
+    csgo_items = []
+    for item in odds_json:
+        description = item['path'][0]['description'].upper()
+        if 'CS:GO' in description or 'CSGO' in description or 'COUNTER-STRIKE' in description:
+            csgo_items.append(item)
+    return csgo_items
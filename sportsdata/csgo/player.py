@@ -1,5 +1,6 @@
 import pandas as pd
-import requests
+from ..client import get_text
+from ..util import build_dataframe, to_json_safe
 from pyquery import PyQuery as pq
 
 
@@ -38,20 +39,20 @@ class Player:
                     # The first team listed is the player's current team
                     break
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'CsgoPlayerId': self._csgo_player_id,
             'PlayerName': self._player_name,
             'CsgoTeamId': self._csgo_team_id,
         }
-        return pd.DataFrame([fields_to_include], index=None)
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Players:
@@ -76,7 +77,7 @@ class Players:
 
     def _get_players(self):
         url = 'https://www.hltv.org/stats/players?startDate=all'
-        players_html = pq(url, verify=False)
+        players_html = pq(get_text(url, verify=False))
         #players_html = requests.get(url, verify=False).content
         for table in players_html('table').items():
             first_row = True
@@ -89,10 +90,7 @@ class Players:
 
     @property
     def dataframes(self):
-        frames = []
-        for player in self.__iter__():
-            frames.append(player.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([player._get_fields() for player in self])
 
     @property
     def to_dicts(self):
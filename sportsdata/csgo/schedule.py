@@ -1,9 +1,9 @@
 import pandas as pd
-import requests
+from ..client import get_text
+from ..util import build_dataframe, to_json_safe
 from datetime import datetime, timedelta
 from dateutil import parser
 from pyquery import PyQuery as pq
-from time import sleep
 
 
 class Match:
@@ -28,7 +28,7 @@ class Match:
         setattr(self, '_match_url', full_url)
 
         print('Getting match data from ' + full_url)
-        match_html = pq(full_url, verify=False)
+        match_html = pq(get_text(full_url, verify=False))
         map_divs = []
         for div in match_html('div').items():
             if div.attr['class'] == 'timeAndEvent':
@@ -57,9 +57,8 @@ class Match:
         dt = date_obj + timedelta(hours=hours_into_day)
         setattr(self, '_match_date_time', dt)
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'CsgoMatchId': self._csgo_match_id,
             'MatchUrl': self._match_url,
             'MatchDateTime': self._match_date_time,
@@ -69,14 +68,14 @@ class Match:
             'BestOf': self._best_of,
             'CsgoEventId': self._csgo_event_id
         }
-        return pd.DataFrame([fields_to_include], index=None)
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        dic['MatchDateTime'] = dic['MatchDateTime'].isoformat()
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Schedule:
@@ -101,7 +100,7 @@ class Schedule:
 
     def _get_schedule(self):
         url = 'https://www.hltv.org/matches'
-        matches_html = pq(url, verify=False)
+        matches_html = pq(get_text(url, verify=False))
 
         for day_div in matches_html('div').items():
             if day_div.attr['class'] == 'match-day':
@@ -111,15 +110,11 @@ class Schedule:
                             match_url = a.attr['href']
                             match = Match(match_url)
                             self._matches.append(match)
-                            sleep(5)
                             break
 
     @property
     def dataframes(self):
-        frames = []
-        for match in self.__iter__():
-            frames.append(match.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([match._get_fields() for match in self])
 
     @property
     def to_dicts(self):
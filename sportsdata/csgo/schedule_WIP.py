@@ -1,5 +1,6 @@
 import pandas as pd
 import requests
+from ..util import build_dataframe, to_json_safe
 from datetime import datetime, timedelta
 from dateutil import parser
 # from match import MatchBoxscore
@@ -59,9 +60,8 @@ class Match:
         dt = date_obj + timedelta(hours=hours_into_day)
         setattr(self, '_match_date_time', dt)
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'CsgoMatchId': self._csgo_match_id,
             'MatchUrl': self._match_url,
             'MatchDateTime': self._match_date_time,
@@ -71,14 +71,14 @@ class Match:
             'BestOf': self._best_of,
             'CsgoEventId': self._csgo_event_id
         }
-        return pd.DataFrame([fields_to_include], index=None)
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        dic['MatchDateTime'] = dic['MatchDateTime'].isoformat()
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Schedule:
@@ -184,10 +184,7 @@ class Schedule:
 
     @property
     def dataframes(self):
-        frames = []
-        for match in self.__iter__():
-            frames.append(match.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([match._get_fields() for match in self])
 
     @property
     def to_dicts(self):
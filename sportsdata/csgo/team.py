@@ -1,5 +1,6 @@
 import pandas as pd
-import requests
+from ..client import get_text
+from ..util import build_dataframe, to_json_safe
 from pyquery import PyQuery as pq
 
 
@@ -28,19 +29,19 @@ class Team:
                     team_id = team_url.split('/')[3]
                     setattr(self, '_csgo_team_id', team_id)
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'CsgoTeamId': self._csgo_team_id,
             'TeamName': self._team_name,
         }
-        return pd.DataFrame([fields_to_include], index=None)
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Teams:
@@ -59,7 +60,7 @@ class Teams:
 
     def _get_teams(self):
         url = 'https://www.hltv.org/stats/teams'
-        teams_html = pq(url, verify=False)
+        teams_html = pq(get_text(url, verify=False))
         #teams_html = requests.get(url, verify=False)
 
         for table in teams_html('table').items():
@@ -80,10 +81,7 @@ class Teams:
 
     @property
     def dataframes(self):
-        frames = []
-        for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([team._get_fields() for team in self])
 
     @property
     def to_dicts(self):
@@ -0,0 +1,270 @@
+import numpy as np
+import os
+import pandas as pd
+import shutil
+from uuid import uuid4
+
+PARTITION_FILENAME = 'part-0.parquet'
+SCHEMA_FILENAME = '_common_metadata'
+
+
+def write_partitioned(path, data, partitions, key=None):
+    """
+    Appends rows to the Parquet dataset at path, partitioned by season and
+    date: path/season=2019/date=2019-10-16/part-0.parquet.
+
+    With key, rows are upserted: the rows a date already has with the same
+    key (e.g. the same game ID) are replaced and its other rows are kept, so
+    re-running a game never duplicates rows and writing one game of a date
+    never drops the others. Without key, a date that is already in the
+    dataset is replaced as a whole. Every table keeps one schema across days
+    in path/_common_metadata. It is widened as new days come in, e.g. a
+    column that was all null on opening day gets its real type later.
+
+    Parameters
+    ----------
+    path : string
+        Directory of the dataset, e.g. 'parquet/mlb/player_boxscores'.
+
+    data : DataFrame or dict
+        Rows to write, as a DataFrame or as {column: values}
+        (Schema.get_columns), which skips building a DataFrame first.
+        Values can be lists or typed pandas arrays (nullable ints,
+        booleans, categoricals and datetimes), which keep their types.
+
+    partitions : list (tuple)
+        (season, date) of each row, with date in 'YYYY-MM-DD' format.
+
+    key : string
+        Column the rows are upserted by, e.g. 'MlbGameId'.
+    """
+    import pyarrow as pa
+
+    if len(partitions) == 0:
+        return
+    if isinstance(data, dict):
+        table = pa.table(data)
+    else:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+    schema = _update_schema(path, _get_dictionary_schema(table.schema))
+    table = _conform(table, schema)
+
+    keys = np.array([f'season={season}/date={date}' for season, date in partitions])
+    for partition in dict.fromkeys(keys):
+        directory = os.path.join(path, *partition.split('/'))
+        os.makedirs(directory, exist_ok=True)
+        _write_partition(directory, table.take(np.flatnonzero(keys == partition)), schema, key)
+
+
+def read_partitioned(path, seasons=None, start_date=None, end_date=None, columns=None):
+    """
+    Loads a dataset written by write_partitioned into one DataFrame. Only
+    the partitions that match the filters are read. Integer and boolean
+    columns are loaded as pandas' nullable Int/boolean dtypes, so columns
+    with nulls keep their types, and dictionary columns as categoricals.
+
+    Parameters
+    ----------
+    path : string
+        Directory of the dataset.
+
+    seasons : list (ints)
+        Seasons to load. None loads every season.
+
+    start_date, end_date : string
+        Inclusive date bounds ('YYYY-MM-DD' format).
+
+    columns : list (strings)
+        Columns to load. None loads all of them.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(os.path.join(path, SCHEMA_FILENAME))
+    partition_schema = pa.schema([('season', pa.int32()), ('date', pa.string())])
+    dataset = ds.dataset(path, schema=pa.unify_schemas([schema, partition_schema]), format='parquet',
+                         partitioning=ds.partitioning(partition_schema, flavor='hive'))
+    conditions = []
+    if seasons is not None:
+        conditions.append(ds.field('season').isin(seasons))
+    if start_date is not None:
+        conditions.append(ds.field('date') >= start_date)
+    if end_date is not None:
+        conditions.append(ds.field('date') <= end_date)
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    table = dataset.to_table(columns=columns or schema.names, filter=expression)
+    return table.to_pandas(types_mapper=_get_pandas_dtype)
+
+
+def merge_partitioned(path, source, key=None):
+    """
+    Moves the partitions of the dataset at source into the dataset at path
+    and widens path's schema with source's. With key, the rows are upserted
+    into the dates path already has (see write_partitioned); without it,
+    those dates are replaced. source is removed afterwards.
+    """
+    import pyarrow.parquet as pq
+
+    schema_path = os.path.join(source, SCHEMA_FILENAME)
+    if not os.path.exists(schema_path):
+        return
+    schema = _update_schema(path, pq.read_schema(schema_path))
+    for directory, _, filenames in sorted(os.walk(source)):
+        if PARTITION_FILENAME in filenames:
+            target = os.path.join(path, os.path.relpath(directory, source))
+            os.makedirs(target, exist_ok=True)
+            source_path = os.path.join(directory, PARTITION_FILENAME)
+            if key is not None and os.path.exists(os.path.join(target, PARTITION_FILENAME)):
+                _write_partition(target, _conform(pq.read_table(source_path), schema), schema, key)
+            else:
+                os.replace(source_path, os.path.join(target, PARTITION_FILENAME))
+    shutil.rmtree(source)
+
+
+def _write_partition(directory, table, schema, key):
+    # Upserts table into the partition's file by key (or replaces it), through a temporary file
+    # so readers never see a partial file.
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    file_path = os.path.join(directory, PARTITION_FILENAME)
+    if key is not None and os.path.exists(file_path):
+        existing = _conform(pq.read_table(file_path), schema)
+        kept = pc.invert(pc.is_in(existing.column(key), value_set=table.column(key).combine_chunks()))
+        table = pa.concat_tables([existing.filter(kept), table])
+    temp_path = os.path.join(directory, f'.{uuid4().hex}.tmp')
+    pq.write_table(table, temp_path)
+    os.replace(temp_path, file_path)
+
+
+def _update_schema(path, schema):
+    # Widens the dataset's shared schema with a new table's schema and saves it.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema_path = os.path.join(path, SCHEMA_FILENAME)
+    if os.path.exists(schema_path):
+        existing = pq.read_schema(schema_path)
+        merged = pa.unify_schemas([existing, schema.remove_metadata()], promote_options='permissive')
+        if merged.equals(existing):
+            return existing
+        schema = merged
+    os.makedirs(path, exist_ok=True)
+    schema = schema.remove_metadata()
+    temp_path = os.path.join(path, f'.{uuid4().hex}.tmp')
+    pq.write_metadata(schema, temp_path)
+    os.replace(temp_path, schema_path)
+    return schema
+
+
+def _get_dictionary_schema(schema):
+    # Categorical columns become dictionaries whose index width depends on the number of
+    # categories, and an all-null day has null values. One type per column keeps the
+    # dataset's schema stable across days.
+    import pyarrow as pa
+
+    fields = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            value_type = pa.string() if pa.types.is_null(field.type.value_type) else field.type.value_type
+            field = field.with_type(pa.dictionary(pa.int32(), value_type))
+        fields.append(field)
+    return pa.schema(fields)
+
+
+def _get_pandas_dtype(arrow_type):
+    import pyarrow as pa
+
+    if pa.types.is_integer(arrow_type):
+        prefix = 'UInt' if pa.types.is_unsigned_integer(arrow_type) else 'Int'
+        return pd.api.types.pandas_dtype(f'{prefix}{arrow_type.bit_width}')
+    if pa.types.is_boolean(arrow_type):
+        return pd.BooleanDtype()
+    return None
+
+
+def _conform(table, schema):
+    # Adds the schema's columns a day does not have (as nulls) and casts the rest.
+    import pyarrow as pa
+
+    if table.schema.equals(schema):
+        return table
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            columns.append(table.column(field.name).cast(field.type))
+        else:
+            columns.append(pa.nulls(len(table), field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def write_game_boxscores(path, sport, games, game_schema, player_schema, play_schema, key):
+    """
+    Appends games to three datasets under path/sport: game_boxscores,
+    player_boxscores and play_by_plays, each partitioned by the game's season
+    and (local) date. The tables are built straight from the records with
+    their schemas, with the same columns and dtypes as the GameBoxscores
+    dataframes (e.g. Int16 stats, categorical teams and a timestamp
+    GameDateTime).
+    Games that are already in the datasets are replaced (with all of their
+    players and plays), and the other games of their dates are kept.
+
+    Parameters
+    ----------
+    path : string
+        Root directory of the datasets.
+
+    sport : string
+        'mlb', 'nhl', etc.
+
+    games : list (GameBoxscore)
+        Parsed games.
+
+    game_schema, player_schema, play_schema : Schema
+        Field schemas of the sport's GameBoxscore, PlayerBoxscore and Play.
+
+    key : string
+        Game ID column of the three tables, e.g. 'MlbGameId'.
+    """
+    partitions, player_partitions, play_partitions = [], [], []
+    players, plays = [], []
+    for game in games:
+        partition = (int(game._season), game._game_date)
+        partitions.append(partition)
+        players.extend(game._away_players)
+        players.extend(game._home_players)
+        player_partitions.extend([partition] * (len(players) - len(player_partitions)))
+        plays.extend(game._play_by_play)
+        play_partitions.extend([partition] * (len(plays) - len(play_partitions)))
+
+    directory = os.path.join(path, sport)
+    write_partitioned(os.path.join(directory, 'game_boxscores'), game_schema.get_columns(games, True), partitions,
+                      key)
+    write_partitioned(os.path.join(directory, 'player_boxscores'), player_schema.get_columns(players, True),
+                      player_partitions, key)
+    write_partitioned(os.path.join(directory, 'play_by_plays'), play_schema.get_columns(plays, True),
+                      play_partitions, key)
+
+
+def merge_game_boxscores(path, source, keys):
+    """
+    Moves every dataset written by write_game_boxscores under source into
+    the same dataset under path, upserting by game (see merge_partitioned).
+    keys is the game ID column of each sport, e.g. {'mlb': 'MlbGameId'}.
+    """
+    for sport in sorted(os.listdir(source)):
+        for table in sorted(os.listdir(os.path.join(source, sport))):
+            merge_partitioned(os.path.join(path, sport, table), os.path.join(source, sport, table), keys[sport])
+    shutil.rmtree(source)
+
+
+def read_game_boxscores(path, sport, table, seasons=None, start_date=None, end_date=None, columns=None):
+    """
+    Loads one of the datasets written by write_game_boxscores, e.g.
+    read_game_boxscores('parquet', 'mlb', 'player_boxscores', seasons=[2019]).
+    """
+    return read_partitioned(os.path.join(path, sport, table), seasons, start_date, end_date, columns)
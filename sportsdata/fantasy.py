@@ -0,0 +1,270 @@
+import numpy as np
+import pandas as pd
+from .constants import DFS_FANTASY_POINTS_COLUMNS, DFS_WEBSITES
+
+
+class Bonus:
+    """
+    Points a player gets once when at least count of the stats reach
+    minimum, e.g. Bonus(3, ['SkaterGoals'], 3) for a hat trick or
+    Bonus(1.5, ['Points', 'Rebounds', 'Assists', 'Steals', 'Blocks'], 10, 2)
+    for a double-double.
+
+    Parameters
+    ----------
+    points : float
+        Points of the bonus.
+
+    stats : list
+        Stats compared to minimum: columns of the player boxscores, stats
+        declared in the Scoring or {column: weight} sums.
+
+    minimum : float
+        Value a stat has to reach.
+
+    count : int
+        Number of the stats that have to reach minimum.
+
+    where : string
+        Boolean column that also has to be true, e.g. 'CompleteGame'.
+    """
+
+    def __init__(self, points, stats, minimum, count=1, where=None):
+        self.points = points
+        self.stats = stats
+        self.minimum = minimum
+        self.count = count
+        self.where = where
+
+
+class Scoring:
+    """
+    Fantasy scoring rules of one sport on each DFS website, declared once
+    and applied to a whole player boxscores DataFrame (e.g. a season of
+    player_dataframes) at a time:
+
+    - Every stat the rules use is resolved to a weighted sum of inputs, i.e.
+      numeric columns, whether a column equals a value, or the result of a
+      function of the DataFrame.
+    - The inputs are read into one float matrix (nulls count as 0) and
+      multiplied by the (inputs x websites) weights, which gives every
+      website's points in one product.
+    - Bonuses are threshold tests on the matrix of their stats.
+
+    Parameters
+    ----------
+    stats : dict
+        Stats the rules use that are not columns, as {stat: definition}:
+        {column: weight} for a weighted sum of columns and stats (e.g.
+        singles), (column, value) for whether a column equals a value (e.g.
+        a goalie's win), or a function of the DataFrame that returns an
+        array.
+
+    points : dict
+        {website: {stat: points}}.
+
+    bonuses : dict
+        {website: list (Bonus)}.
+    """
+
+    def __init__(self, stats, points, bonuses=None):
+        self._stats = stats
+        self._points = points
+        self._bonuses = bonuses or {}
+
+    @property
+    def websites(self):
+        return list(self._points)
+
+    def _resolve(self, stat, inputs):
+        # {input index: weight} of a stat. Inputs are columns, (column, value) tuples and functions.
+        definition = stat if isinstance(stat, dict) else self._stats.get(stat, stat)
+        if isinstance(definition, dict):
+            weights = {}
+            for name, weight in definition.items():
+                for index, value in self._resolve(name, inputs).items():
+                    weights[index] = weights.get(index, 0.0) + weight * value
+            return weights
+        key = definition if isinstance(definition, (str, tuple)) else stat
+        if key not in inputs:
+            inputs[key] = (len(inputs), definition)
+        return {inputs[key][0]: 1.0}
+
+    def get_points(self, dataframe, websites=DFS_WEBSITES):
+        """
+        Returns a DataFrame with the points of each row of dataframe on
+        each website, with dataframe's index and the websites as columns.
+        """
+        websites = [website for website in websites if website in self._points]
+        inputs = {}
+        weights = {website: [self._resolve(stat, inputs) for stat in self._points[website]]
+                   for website in websites}
+        bonuses = {website: [(bonus, [self._resolve(stat, inputs) for stat in bonus.stats])
+                             for bonus in self._bonuses.get(website, [])]
+                   for website in websites}
+
+        matrix = np.zeros((len(dataframe), len(inputs)))
+        for index, definition in inputs.values():
+            matrix[:, index] = _get_input(dataframe, definition)
+
+        points_matrix = np.zeros((len(inputs), len(websites)))
+        for i, website in enumerate(websites):
+            for stat_weights, points in zip(weights[website], self._points[website].values()):
+                for index, weight in stat_weights.items():
+                    points_matrix[index, i] += weight * points
+        points = matrix @ points_matrix
+
+        for i, website in enumerate(websites):
+            for bonus, stats in bonuses[website]:
+                stat_matrix = np.zeros((len(inputs), len(stats)))
+                for j, stat_weights in enumerate(stats):
+                    for index, weight in stat_weights.items():
+                        stat_matrix[index, j] = weight
+                earned = ((matrix @ stat_matrix) >= bonus.minimum).sum(axis=1) >= bonus.count
+                if bonus.where is not None:
+                    earned &= dataframe[bonus.where].to_numpy(dtype=bool, na_value=False)
+                points[:, i] += earned * bonus.points
+        return pd.DataFrame(points.round(2), index=dataframe.index, columns=websites)
+
+
+def _get_input(dataframe, definition):
+    if callable(definition):
+        return np.asarray(definition(dataframe), dtype=float)
+    if isinstance(definition, tuple):
+        column, value = definition
+        return (dataframe[column] == value).to_numpy(dtype=float, na_value=0.0)
+    series = dataframe[definition]
+    if not (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)):
+        # Scraped stats (XFL) are strings.
+        series = pd.to_numeric(series, errors='coerce')
+    return series.to_numpy(dtype=float, na_value=0.0)
+
+
+def _get_outs_pitched(dataframe):
+    # Innings pitched are written as innings.outs, e.g. '6.1' is 19 outs.
+    innings = pd.to_numeric(dataframe['InningsPitched'], errors='coerce').to_numpy(dtype=float, na_value=0.0)
+    whole = np.floor(innings)
+    return whole * 3 + np.round((innings - whole) * 10)
+
+
+MLB_SCORING = Scoring(
+    stats={
+        'Singles': {'Hits': 1, 'Doubles': -1, 'Triples': -1, 'HomeRuns': -1},
+        'OutsPitched': _get_outs_pitched
+    },
+    points={
+        'dk': {'Singles': 3, 'Doubles': 5, 'Triples': 8, 'HomeRuns': 10, 'RunsBattedIn': 2, 'Runs': 2,
+               'BasesOnBalls': 2, 'HitByPitch': 2, 'StolenBases': 5,
+               'OutsPitched': 0.75, 'PitchedStrikeouts': 2, 'PitchingWin': 4, 'EarnedRuns': -2, 'AllowedHits': -0.6,
+               'AllowedBasesOnBalls': -0.6, 'BattersHitByPitch': -0.6, 'CompleteGame': 2.5, 'Shutout': 2.5},
+        'fd': {'Singles': 3, 'Doubles': 6, 'Triples': 9, 'HomeRuns': 12, 'RunsBattedIn': 3.5, 'Runs': 3.2,
+               'BasesOnBalls': 3, 'HitByPitch': 3, 'StolenBases': 6,
+               'OutsPitched': 1, 'PitchedStrikeouts': 3, 'PitchingWin': 6, 'EarnedRuns': -3, 'QualityStart': 4},
+        'yh': {'Singles': 2.6, 'Doubles': 5.2, 'Triples': 7.8, 'HomeRuns': 10.4, 'RunsBattedIn': 1.9, 'Runs': 1.9,
+               'BasesOnBalls': 2.6, 'HitByPitch': 2.6, 'StolenBases': 4.2,
+               'OutsPitched': 1, 'PitchedStrikeouts': 3, 'PitchingWin': 4, 'EarnedRuns': -3}
+    },
+    bonuses={
+        # No-hitter: a complete game without a hit allowed.
+        'dk': [Bonus(5, [{'AllowedHits': -1}], 0, where='CompleteGame')]
+    })
+
+NHL_SCORING = Scoring(
+    stats={
+        'Goals': {'SkaterGoals': 1, 'GoalieGoals': 1},
+        'Assists': {'SkaterAssists': 1, 'GoalieAssists': 1},
+        'Points': {'Goals': 1, 'Assists': 1},
+        'PowerPlayPoints': {'SkaterPowerPlayGoals': 1, 'SkaterPowerPlayAssists': 1},
+        'ShortHandedPoints': {'SkaterShortHandedGoals': 1, 'SkaterShortHandedAssists': 1},
+        'GoalieWin': ('GoalieDecision', 'W'),
+        'GoalieLoss': ('GoalieDecision', 'L')
+    },
+    points={
+        'dk': {'Goals': 8.5, 'Assists': 5, 'SkaterShots': 1.5, 'SkaterBlocked': 1.3, 'ShortHandedPoints': 2,
+               'SkaterShootoutGoals': 1.5, 'GoalieWin': 6, 'GoalieSaves': 0.7, 'GoalieGoalsAgainst': -3.5},
+        'fd': {'Goals': 12, 'Assists': 8, 'SkaterShots': 1.6, 'SkaterBlocked': 1.6, 'PowerPlayPoints': 0.5,
+               'ShortHandedPoints': 2, 'GoalieWin': 12, 'GoalieSaves': 0.8, 'GoalieGoalsAgainst': -4},
+        'yh': {'Goals': 6, 'Assists': 4, 'SkaterShots': 0.5, 'SkaterBlocked': 0.5, 'SkaterPowerPlayGoals': 2,
+               'SkaterShortHandedGoals': 2, 'GoalieWin': 5, 'GoalieSaves': 0.3, 'GoalieGoalsAgainst': -1.5}
+    },
+    bonuses={
+        # Shutout: a win without a goal against, for a goalie who played the whole game.
+        'dk': [Bonus(3, ['Goals'], 3), Bonus(3, ['SkaterShots'], 5), Bonus(3, ['SkaterBlocked'], 3),
+               Bonus(3, ['Points'], 3), Bonus(3, ['GoalieSaves'], 35),
+               Bonus(4, [{'GoalieWin': 1, 'GoalieGoalsAgainst': -1}], 1, where='OnlyGoalie'),
+               Bonus(2, ['GoalieLoss'], 1, where='Overtime')],
+        'fd': [Bonus(8, [{'GoalieWin': 1, 'GoalieGoalsAgainst': -1}], 1, where='OnlyGoalie')],
+        'yh': [Bonus(3, [{'GoalieWin': 1, 'GoalieGoalsAgainst': -1}], 1, where='OnlyGoalie')]
+    })
+
+NBA_SCORING = Scoring(
+    stats={},
+    points={
+        'dk': {'Points': 1, 'ThreePointFieldGoals': 0.5, 'Rebounds': 1.25, 'Assists': 1.5, 'Steals': 2, 'Blocks': 2,
+               'Turnovers': -0.5},
+        'fd': {'Points': 1, 'Rebounds': 1.2, 'Assists': 1.5, 'Steals': 3, 'Blocks': 3, 'Turnovers': -1},
+        'yh': {'Points': 1, 'ThreePointFieldGoals': 0.5, 'Rebounds': 1.2, 'Assists': 1.5, 'Steals': 3, 'Blocks': 3,
+               'Turnovers': -1}
+    },
+    bonuses={
+        'dk': [Bonus(1.5, ['Points', 'Rebounds', 'Assists', 'Steals', 'Blocks'], 10, 2),
+               Bonus(3, ['Points', 'Rebounds', 'Assists', 'Steals', 'Blocks'], 10, 3)]
+    })
+
+XFL_SCORING = Scoring(
+    stats={
+        'Touchdowns': {'RushingTouchdowns': 1, 'ReceivingTouchdowns': 1}
+    },
+    points={
+        'dk': {'PassingYards': 0.04, 'PassingTouchdowns': 4, 'PassingInterceptions': -1, 'RushingYards': 0.1,
+               'Receptions': 1, 'ReceivingYards': 0.1, 'Touchdowns': 6, 'OnePointConversions': 1,
+               'TwoPointConversions': 2, 'ThreePointConversions': 3},
+        'fd': {'PassingYards': 0.04, 'PassingTouchdowns': 4, 'PassingInterceptions': -1, 'RushingYards': 0.1,
+               'Receptions': 0.5, 'ReceivingYards': 0.1, 'Touchdowns': 6, 'OnePointConversions': 1,
+               'TwoPointConversions': 2, 'ThreePointConversions': 3},
+        'yh': {'PassingYards': 0.04, 'PassingTouchdowns': 4, 'PassingInterceptions': -1, 'RushingYards': 0.1,
+               'Receptions': 0.5, 'ReceivingYards': 0.1, 'Touchdowns': 6, 'OnePointConversions': 1,
+               'TwoPointConversions': 2, 'ThreePointConversions': 3}
+    },
+    bonuses={
+        'dk': [Bonus(3, ['PassingYards'], 300), Bonus(3, ['RushingYards'], 100), Bonus(3, ['ReceivingYards'], 100)]
+    })
+
+FANTASY_SCORING = {
+    'mlb': MLB_SCORING,
+    'nhl': NHL_SCORING,
+    'nba': NBA_SCORING,
+    'xfl': XFL_SCORING
+}
+
+
+def get_fantasy_points(dataframe, sport, websites=DFS_WEBSITES):
+    """
+    Fantasy points of every player boxscore in dataframe (e.g.
+    GameBoxscores.player_dataframes for a season) on each website, as a
+    DataFrame with dataframe's index and a DraftKingsFp, FanDuelFp and
+    YahooFp column.
+
+    Parameters
+    ----------
+    dataframe : DataFrame
+        Player boxscores of one sport.
+
+    sport : string
+        'mlb', 'nhl', 'nba' or 'xfl'.
+
+    websites : list (string)
+        DFS websites to score ('dk', 'fd' and/or 'yh').
+    """
+    if sport not in FANTASY_SCORING:
+        raise ValueError(f'No fantasy scoring for {sport!r} (supported: {", ".join(FANTASY_SCORING)})')
+    points = FANTASY_SCORING[sport].get_points(dataframe, websites)
+    return points.rename(columns=DFS_FANTASY_POINTS_COLUMNS)
+
+
+def add_fantasy_points(dataframe, sport, websites=DFS_WEBSITES):
+    """
+    Returns a copy of dataframe with the fantasy point columns of
+    get_fantasy_points added.
+    """
+    return pd.concat([dataframe, get_fantasy_points(dataframe, sport, websites)], axis=1)
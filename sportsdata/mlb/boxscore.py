@@ -1,16 +1,152 @@
+import asyncio
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
-from ..util import utc_to_pst
-from .playbyplay import PlayByPlay
+from ..aclient import aget_json, acache_forever
+from ..client import get_json, cache_forever
+from ..constants import CACHE_FOREVER
+from ..export import write_game_boxscores
+from ..schema import Field, Schema
+from ..util import utc_to_pst, to_json_safe, iter_map
+from .constants import MLB_SCHEDULE_URL, MLB_GAME_FEED_URL
+from .playbyplay import PLAY_SCHEMA, PlayByPlay
 from .schedule import Schedule
-from .util import get_dates_by_season
+from .util import get_dates_by_kwargs, get_final_game_ids
 from datetime import datetime
-from time import sleep
 
 # todo- check base/bases on balls
 
 
+def get_game_feed(game_id):
+    url = MLB_GAME_FEED_URL.format(game_id=game_id)
+    print(f'Getting game data from {url}')
+    game = get_json(url)
+    # Payloads for final games never change, so they can be cached forever.
+    if game['gameData']['status']['codedGameState'] == 'F':
+        cache_forever(url)
+    return game
+
+
+def get_game_ids_by_dates(start_date, end_date):
+    # IDs of the final games between two dates ('MM/DD/YYYY' format).
+    url = MLB_SCHEDULE_URL.format(start_date=start_date, end_date=end_date)
+    print('Getting MLB schedule from ' + url)
+    return get_final_game_ids(get_json(url))
+
+
+async def aget_game_feed(game_id):
+    url = MLB_GAME_FEED_URL.format(game_id=game_id)
+    print(f'Getting game data from {url}')
+    game = await aget_json(url)
+    if game['gameData']['status']['codedGameState'] == 'F':
+        acache_forever(url)
+    return game
+
+
+def _is_one(value):
+    return value == 1
+
+
+def _get_earned_run_average(era):
+    # '-.--' until the pitcher has recorded an out.
+    return None if era == '-.--' else era
+
+
+def _get_team_fields(team):
+    # Away and home columns only differ by their prefix.
+    prefix = team.capitalize()
+    fields = [
+        Field(f'_{team}_team_id', f'{prefix}TeamId', 'game', f'gameData.teams.{team}.id', dtype='Int16'),
+        Field(f'_{team}_record_wins', f'{prefix}RecordWins', 'game', f'gameData.teams.{team}.record.leagueRecord.wins',
+              dtype='Int16'),
+        Field(f'_{team}_record_losses', f'{prefix}RecordLosses', 'game',
+              f'gameData.teams.{team}.record.leagueRecord.losses', dtype='Int16'),
+        Field(f'_{team}_record_pct', f'{prefix}RecordPct', 'game', f'gameData.teams.{team}.record.leagueRecord.pct')
+    ]
+    batting = [
+        ('runs', 'Runs', 'runs'),
+        ('fly_outs', 'FlyOuts', 'flyOuts'),
+        ('ground_outs', 'GroundOuts', 'groundOuts'),
+        ('doubles', 'Doubles', 'doubles'),
+        ('triples', 'Triples', 'triples'),
+        ('home_runs', 'HomeRuns', 'homeRuns'),
+        ('strikeouts', 'Strikeouts', 'strikeOuts'),
+        ('base_on_balls', 'BaseOnBalls', 'baseOnBalls'),
+        ('intentional_base_on_balls', 'IntentionalBaseOnBalls', 'intentionalWalks'),
+        ('hits', 'Hits', 'hits'),
+        ('hit_by_pitch', 'HitByPitch', 'hitByPitch'),
+        ('at_bats', 'AtBats', 'atBats'),
+        ('caught_stealing', 'CaughtStealing', 'caughtStealing'),
+        ('stolen_bases', 'StolenBases', 'stolenBases'),
+        ('left_on_base', 'LeftOnBase', 'leftOnBase')
+    ]
+    for attribute, column, key in batting:
+        fields.append(Field(f'_{team}_{attribute}', f'{prefix}{column}', 'box',
+                            f'teams.{team}.teamStats.batting.{key}', dtype='Int8'))
+    return fields
+
+
+PLAYER_BOXSCORE_SCHEMA = Schema([
+    Field('_mlb_player_id', 'MlbPlayerId', 'box', 'person.id', dtype='Int32'),
+    Field('_mlb_game_id', 'MlbGameId', dtype='Int32'),
+    Field('_season', 'Season', dtype='category'),
+    Field('_away_team_id', 'AwayTeamId', dtype='Int16'),
+    Field('_home_team_id', 'HomeTeamId', dtype='Int16'),
+    Field('_is_away', 'IsAway', dtype='boolean'),
+    Field('_team_result', 'TeamResult', dtype='category'),
+    # Field('_extra_innings', 'ExtraInnings'),
+    Field('_batting_order', 'BattingOrder', dtype='Int16'),
+    Field('_at_bats', 'AtBats', 'batting', 'atBats', dtype='Int8'),
+    Field('_runs', 'Runs', 'batting', 'runs', dtype='Int8'),
+    Field('_hits', 'Hits', 'batting', 'hits', dtype='Int8'),
+    Field('_doubles', 'Doubles', 'batting', 'doubles', dtype='Int8'),
+    Field('_triples', 'Triples', 'batting', 'triples', dtype='Int8'),
+    Field('_home_runs', 'HomeRuns', 'batting', 'homeRuns', dtype='Int8'),
+    Field('_runs_batted_in', 'RunsBattedIn', 'batting', 'rbi', dtype='Int8'),
+    Field('_bases_on_balls', 'BasesOnBalls', 'batting', 'baseOnBalls', dtype='Int8'),
+    Field('_intentional_bases_on_balls', 'IntentionalBasesOnBalls', 'batting', 'intentionalWalks', dtype='Int8'),
+    Field('_strikeouts', 'Strikeouts', 'batting', 'strikeOuts', dtype='Int8'),
+    Field('_hit_by_pitch', 'HitByPitch', 'batting', 'hitByPitch', dtype='Int8'),
+    Field('_sacrifice_hits', 'SacrificeHits', 'batting', 'sacBunts', dtype='Int8'),
+    Field('_sacrifice_flies', 'SacrificeFlies', 'batting', 'sacFlies', dtype='Int8'),
+    Field('_grounded_into_double_play', 'GroundedIntoDoublePlay', 'batting', 'groundIntoDoublePlay', dtype='Int8'),
+    Field('_stolen_bases', 'StolenBases', 'batting', 'stolenBases', dtype='Int8'),
+    Field('_caught_stealing', 'CaughtStealing', 'batting', 'caughtStealing', dtype='Int8'),
+    Field('_starting_pitcher', 'StartingPitcher', 'pitching', 'gamesStarted', dtype='Int8'),
+    Field('_pitching_win', 'PitchingWin', 'pitching', 'wins', _is_one, False, dtype='boolean'),
+    Field('_innings_pitched', 'InningsPitched', 'pitching', 'inningsPitched'),
+    Field('_allowed_hits', 'AllowedHits', 'pitching', 'hits', dtype='Int8'),
+    Field('_allowed_runs', 'AllowedRuns', 'pitching', 'runs', dtype='Int8'),
+    Field('_earned_runs', 'EarnedRuns', 'pitching', 'earnedRuns', dtype='Int8'),
+    Field('_earned_run_average', 'EarnedRunAverage', 'pitching', 'runsScoredPer9', _get_earned_run_average),
+    Field('_pitched_strikeouts', 'PitchedStrikeouts', 'pitching', 'strikeOuts', dtype='Int8'),
+    Field('_allowed_home_runs', 'AllowedHomeRuns', 'pitching', 'homeRuns', dtype='Int8'),
+    Field('_allowed_bases_on_balls', 'AllowedBasesOnBalls', 'pitching', 'baseOnBalls', dtype='Int8'),
+    Field('_batters_hit_by_pitch', 'BattersHitByPitch', 'pitching', 'hitBatsmen', dtype='Int8'),
+    Field('_complete_game', 'CompleteGame', 'pitching', 'completeGames', _is_one, dtype='boolean'),
+    Field('_shutout', 'Shutout', 'pitching', 'shutouts', _is_one, dtype='boolean'),
+    Field('_quality_start', 'QualityStart', dtype='boolean')
+])
+
+GAME_BOXSCORE_SCHEMA = Schema([
+    Field('_mlb_game_id', 'MlbGameId', dtype='Int32'),
+    Field('_season', 'Season', 'game', 'gameData.game.season', dtype='category'),
+    Field('_game_date_time', 'GameDateTime', dtype='datetime64[ns]'),
+    Field('_game_date', 'GameDate'),
+    Field('_game_time', 'GameTime'),
+    Field('_day_night', 'DayNight', 'game', 'gameData.datetime.dayNight', dtype='category'),
+    Field('_game_status', 'GameStatus', 'game', 'gameData.status.detailedState', dtype='category')
+] + _get_team_fields('away') + _get_team_fields('home') + [
+    Field('_home_plate_official_id', 'HomePlateOfficialId', dtype='Int32'),
+    Field('_first_base_official_id', 'FirstBaseOfficialId', dtype='Int32'),
+    Field('_second_base_official_id', 'SecondBaseOfficialId', dtype='Int32'),
+    Field('_third_base_official_id', 'ThirdBaseOfficialId', dtype='Int32'),
+    Field('_mlb_venue_id', 'MlbVenueId', 'game', 'gameData.venue.id', dtype='Int32', optional=True),
+    # Field('_series_description', 'SeriesDescription'),
+    # Field('_series_game_number', 'SeriesGameNumber'),
+    # Field('_games_in_series', 'GamesInSeries'),
+    # Field('_extra_innings', 'ExtraInnings')
+])
+
+
 class PlayerBoxscore:
     """
     Player's boxscore data from an individual MLB game.
@@ -27,56 +163,20 @@ class PlayerBoxscore:
         Dict that contains the player's boxscore data.
     """
 
+    __slots__ = PLAYER_BOXSCORE_SCHEMA.attributes
+
     def __init__(self, game, team, box_json):
-        self._mlb_player_id = None
-        self._mlb_game_id = None
-        self._season = None
-        self._away_team_id = None
-        self._home_team_id = None
-        self._is_away = None
-        self._team_result = None
-        # self._extra_innings = None
-        self._batting_order = None
-        self._at_bats = None
-        self._runs = None
-        self._hits = None
-        self._doubles = None
-        self._triples = None
-        self._home_runs = None
-        self._runs_batted_in = None
-        self._bases_on_balls = None
-        self._intentional_bases_on_balls = None
-        self._strikeouts = None
-        self._hit_by_pitch = None
-        self._sacrifice_hits = None
-        self._sacrifice_flies = None
-        self._grounded_into_double_play = None
-        self._stolen_bases = None
-        self._caught_stealing = None
-        self._starting_pitcher = None
-        self._pitching_win = None
-        self._innings_pitched = None
-        self._allowed_hits = None
-        self._allowed_runs = None
-        self._earned_runs = None
-        self._earned_run_average = None
-        self._pitched_strikeouts = None
-        self._allowed_home_runs = None
-        self._allowed_bases_on_balls = None
-        self._batters_hit_by_pitch = None
-        self._complete_game = None
-        self._shutout = None
-        self._quality_start = None
+        PLAYER_BOXSCORE_SCHEMA.reset(self)
 
         self._parse_player_boxscore(game, team, box_json)
 
     def _parse_player_boxscore(self, game, team, box):
-        has_batting_stats = len(box['stats']['batting']) > 0
-        has_pitching_stats = len(box['stats']['pitching']) > 0
-        if not has_batting_stats and not has_pitching_stats:
+        batting = box['stats']['batting']
+        pitching = box['stats']['pitching']
+        if len(batting) == 0 and len(pitching) == 0:
             return  # todo
 
-        setattr(self, '_mlb_player_id', box['person']['id'])
+        PLAYER_BOXSCORE_SCHEMA.extract('box', self, box)
         setattr(self, '_mlb_game_id', game._mlb_game_id)
         setattr(self, '_season', game._season)
         setattr(self, '_away_team_id', game._away_team_id)
@@ -85,41 +185,12 @@ class PlayerBoxscore:
         setattr(self, '_team_result', self._get_team_result(game, team))
         setattr(self, '_batting_order', self._get_batting_order(box))
 
-        if has_batting_stats:
-            setattr(self, '_at_bats', box['stats']['batting']['atBats'])
-            setattr(self, '_runs', box['stats']['batting']['runs'])
-            setattr(self, '_hits', box['stats']['batting']['hits'])
-            setattr(self, '_doubles', box['stats']['batting']['doubles'])
-            setattr(self, '_triples', box['stats']['batting']['triples'])
-            setattr(self, '_home_runs', box['stats']['batting']['homeRuns'])
-            setattr(self, '_runs_batted_in', box['stats']['batting']['rbi'])
-            setattr(self, '_bases_on_balls', box['stats']['batting']['baseOnBalls'])
-            setattr(self, '_intentional_bases_on_balls', box['stats']['batting']['intentionalWalks'])
-            setattr(self, '_strikeouts', box['stats']['batting']['strikeOuts'])
-            setattr(self, '_hit_by_pitch', box['stats']['batting']['hitByPitch'])
-            setattr(self, '_sacrifice_hits', box['stats']['batting']['sacBunts'])
-            setattr(self, '_sacrifice_flies', box['stats']['batting']['sacFlies'])
-            setattr(self, '_grounded_into_double_play', box['stats']['batting']['groundIntoDoublePlay'])
-            setattr(self, '_stolen_bases', box['stats']['batting']['stolenBases'])
-            setattr(self, '_caught_stealing', box['stats']['batting']['caughtStealing'])
-
-        if has_pitching_stats:
-            setattr(self, '_starting_pitcher', box['stats']['pitching']['gamesStarted'])
-            setattr(self, '_pitching_win', 'wins' in box['stats']['pitching'] and box['stats']['pitching']['wins'] == 1)
-            setattr(self, '_innings_pitched', box['stats']['pitching']['inningsPitched'])
-            setattr(self, '_allowed_hits', box['stats']['pitching']['hits'])
-            setattr(self, '_allowed_runs', box['stats']['pitching']['runs'])
-            setattr(self, '_earned_runs', box['stats']['pitching']['earnedRuns'])
-            if box['stats']['pitching']['runsScoredPer9'] != '-.--':
-                setattr(self, '_earned_run_average', box['stats']['pitching']['runsScoredPer9'])
-            setattr(self, '_pitched_strikeouts', box['stats']['pitching']['strikeOuts'])
-            setattr(self, '_allowed_home_runs', box['stats']['pitching']['homeRuns'])
-            setattr(self, '_allowed_bases_on_balls', box['stats']['pitching']['baseOnBalls'])
-            setattr(self, '_batters_hit_by_pitch', box['stats']['pitching']['hitBatsmen'])
-            setattr(self, '_complete_game', box['stats']['pitching']['completeGames'] == 1)
-            setattr(self, '_shutout', box['stats']['pitching']['shutouts'] == 1)
-            quality_start = float(box['stats']['pitching']['inningsPitched']
-                                  ) >= 6.0 and box['stats']['pitching']['runs'] <= 3.0
+        if len(batting) > 0:
+            PLAYER_BOXSCORE_SCHEMA.extract('batting', self, batting)
+
+        if len(pitching) > 0:
+            PLAYER_BOXSCORE_SCHEMA.extract('pitching', self, pitching)
+            quality_start = float(pitching['inningsPitched']) >= 6.0 and pitching['runs'] <= 3.0
             setattr(self, '_quality_start', quality_start)
 
     def _get_team_result(self, game, team):
@@ -142,56 +213,16 @@ class PlayerBoxscore:
             batting_order = None
         return batting_order
 
+    def _get_fields(self):
+        return PLAYER_BOXSCORE_SCHEMA.get_fields(self)
+
     @property
     def dataframe(self):
-        fields_to_include = {
-            'MlbPlayerId': self._mlb_player_id,
-            'MlbGameId': self._mlb_game_id,
-            'Season': self._season,
-            'AwayTeamId': self._away_team_id,
-            'HomeTeamId': self._home_team_id,
-            'IsAway': self._is_away,
-            'TeamResult': self._team_result,
-            # 'ExtraInnings': self._extra_innings,
-            'BattingOrder': self._batting_order,
-            'AtBats': self._at_bats,
-            'Runs': self._runs,
-            'Hits': self._hits,
-            'Doubles': self._doubles,
-            'Triples': self._triples,
-            'HomeRuns': self._home_runs,
-            'RunsBattedIn': self._runs_batted_in,
-            'BasesOnBalls': self._bases_on_balls,
-            'IntentionalBasesOnBalls': self._intentional_bases_on_balls,
-            'Strikeouts': self._strikeouts,
-            'HitByPitch': self._hit_by_pitch,
-            'SacrificeHits': self._sacrifice_hits,
-            'SacrificeFlies': self._sacrifice_flies,
-            'GroundedIntoDoublePlay': self._grounded_into_double_play,
-            'StolenBases': self._stolen_bases,
-            'CaughtStealing': self._caught_stealing,
-            'StartingPitcher': self._starting_pitcher,
-            'PitchingWin': self._pitching_win,
-            'InningsPitched': self._innings_pitched,
-            'AllowedHits': self._allowed_hits,
-            'AllowedRuns': self._allowed_runs,
-            'EarnedRuns': self._earned_runs,
-            'EarnedRunAverage': self._earned_run_average,
-            'PitchedStrikeouts': self._pitched_strikeouts,
-            'AllowedHomeRuns': self._allowed_home_runs,
-            'AllowedBasesOnBalls': self._allowed_bases_on_balls,
-            'BattersHitByPitch': self._batters_hit_by_pitch,
-            'CompleteGame': self._complete_game,
-            'Shutout': self._shutout,
-            'QualityStart': self._quality_start
-        }
-        return pd.DataFrame([fields_to_include], index=None)
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class PlayerBoxscores:
@@ -229,10 +260,7 @@ class PlayerBoxscores:
 
     @property
     def dataframes(self):
-        frames = []
-        for boxscore in self.__iter__():
-            frames.append(boxscore.dataframe)
-        return pd.concat(frames)
+        return PLAYER_BOXSCORE_SCHEMA.build_dataframe(self._boxscores)
 
     @property
     def to_dicts(self):
@@ -250,138 +278,49 @@ class GameBoxscore:
     ----------
     game_id : int
         The game ID according to MLB's API.
+
+    game_json : dict
+        The game's already-fetched feed/live payload. Requested if not given.
     """
 
-    def __init__(self, game_id):
-        self._mlb_game_id = None
-        self._season = None
-        self._game_date_time = None
-        self._game_date = None
-        self._game_time = None
-        self._day_night = None
-        self._game_status = None
-        self._away_team_id = None
-        self._away_record_wins = None
-        self._away_record_losses = None
-        self._away_record_pct = None
-        self._away_runs = None
-        self._away_fly_outs = None
-        self._away_ground_outs = None
-        self._away_doubles = None
-        self._away_triples = None
-        self._away_home_runs = None
-        self._away_strikeouts = None
-        self._away_base_on_balls = None
-        self._away_intentional_base_on_balls = None
-        self._away_hits = None
-        self._away_hit_by_pitch = None
-        self._away_at_bats = None
-        self._away_caught_stealing = None
-        self._away_stolen_bases = None
-        self._away_left_on_base = None
-        self._home_team_id = None
-        self._home_record_wins = None
-        self._home_record_losses = None
-        self._home_record_pct = None
-        self._home_runs = None
-        self._home_fly_outs = None
-        self._home_ground_outs = None
-        self._home_doubles = None
-        self._home_triples = None
-        self._home_home_runs = None
-        self._home_strikeouts = None
-        self._home_base_on_balls = None
-        self._home_intentional_base_on_balls = None
-        self._home_hits = None
-        self._home_hit_by_pitch = None
-        self._home_at_bats = None
-        self._home_caught_stealing = None
-        self._home_stolen_bases = None
-        self._home_left_on_base = None
-        self._home_plate_official_id = None
-        self._first_base_official_id = None
-        self._second_base_official_id = None
-        self._third_base_official_id = None
+    def __init__(self, game_id, game_json=None):
+        GAME_BOXSCORE_SCHEMA.reset(self)
         self._away_players = None
         self._home_players = None
         self._play_by_play = None
-        # self._mlb_venue_id = None
-        # self._series_description = None
-        # self._series_game_number = None
-        # self._games_in_series = None
-        # self._extra_innings = None
 
-        self._get_game_boxscore(game_id)
+        self._get_game_boxscore(game_id, game_json)
 
-    def _get_game_boxscore(self, game_id):
+    def _get_game_boxscore(self, game_id, game):
         setattr(self, '_mlb_game_id', game_id)
 
-        url = f'https://statsapi.mlb.com/api/v1/game/{game_id}/feed/live'
-        print(f'Getting game data from {url}')
-        game = requests.get(url, verify=VERIFY_REQUESTS).json()
+        if game is None:
+            game = get_game_feed(game_id)
+        is_final = game['gameData']['status']['codedGameState'] == 'F'
         utc = datetime.strptime(game['gameData']['datetime']['dateTime'], '%Y-%m-%dT%H:%M:%SZ')
         game_dt = utc_to_pst(utc)
-        setattr(self, '_season', game['gameData']['game']['season'])
+        GAME_BOXSCORE_SCHEMA.extract('game', self, game)
         setattr(self, '_game_date_time', game_dt.isoformat())
         setattr(self, '_game_date', game_dt.date().isoformat())
         setattr(self, '_game_time', game_dt.time().isoformat())
-        setattr(self, '_day_night', game['gameData']['datetime']['dayNight'])
-        setattr(self, '_game_status', game['gameData']['status']['detailedState'])
-
-        url = f'https://statsapi.mlb.com/api/v1/game/{game_id}/boxscore'
-        print(f'Getting game boxscore data from {url}')
-        box = requests.get(url, verify=VERIFY_REQUESTS).json()
-        # box = game['liveData']['boxscore']
-        away_team = box['teams']['away']['team']  # todo
-        away_team_stats = box['teams']['away']['teamStats']
-        home_team = box['teams']['away']['team']  # todo
-        home_team_stats = box['teams']['home']['teamStats']
-        setattr(self, '_away_team_id', away_team['id'])
-        setattr(self, '_away_record_wins', away_team['record']['leagueRecord']['wins'])
-        setattr(self, '_away_record_losses', away_team['record']['leagueRecord']['losses'])
-        setattr(self, '_away_record_pct', away_team['record']['leagueRecord']['pct'])
-        setattr(self, '_away_runs', away_team_stats['batting']['runs'])
-        setattr(self, '_away_fly_outs', away_team_stats['batting']['flyOuts'])
-        setattr(self, '_away_ground_outs', away_team_stats['batting']['groundOuts'])
-        setattr(self, '_away_doubles', away_team_stats['batting']['doubles'])
-        setattr(self, '_away_triples', away_team_stats['batting']['triples'])
-        setattr(self, '_away_home_runs', away_team_stats['batting']['homeRuns'])
-        setattr(self, '_away_strikeouts', away_team_stats['batting']['strikeOuts'])
-        setattr(self, '_away_base_on_balls', away_team_stats['batting']['baseOnBalls'])
-        setattr(self, '_away_intentional_base_on_balls', away_team_stats['batting']['intentionalWalks'])
-        setattr(self, '_away_hits', away_team_stats['batting']['hits'])
-        setattr(self, '_away_hit_by_pitch', away_team_stats['batting']['hitByPitch'])
-        setattr(self, '_away_at_bats', away_team_stats['batting']['atBats'])
-        setattr(self, '_away_caught_stealing', away_team_stats['batting']['caughtStealing'])
-        setattr(self, '_away_stolen_bases', away_team_stats['batting']['stolenBases'])
-        setattr(self, '_away_left_on_base', away_team_stats['batting']['leftOnBase'])
-        setattr(self, '_home_team_id', box['teams']['home']['team']['id'])
-        setattr(self, '_home_record_wins', home_team['record']['leagueRecord']['wins'])
-        setattr(self, '_home_record_losses', home_team['record']['leagueRecord']['losses'])
-        setattr(self, '_home_record_pct', home_team['record']['leagueRecord']['pct'])
-        setattr(self, '_home_runs', home_team_stats['batting']['runs'])
-        setattr(self, '_home_fly_outs', home_team_stats['batting']['flyOuts'])
-        setattr(self, '_home_ground_outs', home_team_stats['batting']['groundOuts'])
-        setattr(self, '_home_doubles', home_team_stats['batting']['doubles'])
-        setattr(self, '_home_triples', home_team_stats['batting']['triples'])
-        setattr(self, '_home_home_runs', home_team_stats['batting']['homeRuns'])
-        setattr(self, '_home_strikeouts', home_team_stats['batting']['strikeOuts'])
-        setattr(self, '_home_base_on_balls', home_team_stats['batting']['baseOnBalls'])
-        setattr(self, '_home_intentional_base_on_balls', home_team_stats['batting']['intentionalWalks'])
-        setattr(self, '_home_hits', home_team_stats['batting']['hits'])
-        setattr(self, '_home_hit_by_pitch', home_team_stats['batting']['hitByPitch'])
-        setattr(self, '_home_at_bats', home_team_stats['batting']['atBats'])
-        setattr(self, '_home_caught_stealing', home_team_stats['batting']['caughtStealing'])
-        setattr(self, '_home_stolen_bases', home_team_stats['batting']['stolenBases'])
-        setattr(self, '_home_left_on_base', home_team_stats['batting']['leftOnBase'])
+
+        # feed/live already contains the boxscore and all plays. The per-endpoint
+        # requests are only a fallback for payloads that are missing them.
+        if 'boxscore' in game['liveData']:
+            box = game['liveData']['boxscore']
+        else:
+            url = f'https://statsapi.mlb.com/api/v1/game/{game_id}/boxscore'
+            print(f'Getting game boxscore data from {url}')
+            box = get_json(url, ttl=CACHE_FOREVER if is_final else None)
+        plays = game['liveData']['plays']['allPlays'] if 'plays' in game['liveData'] else None
+
+        GAME_BOXSCORE_SCHEMA.extract('box', self, box)
 
         setattr(self, '_home_plate_official_id', self._get_official_id_by_type(box['officials'], 'Home Plate'))
         setattr(self, '_first_base_official_id', self._get_official_id_by_type(box['officials'], 'First Base'))
         setattr(self, '_second_base_official_id', self._get_official_id_by_type(box['officials'], 'Second Base'))
         setattr(self, '_third_base_official_id', self._get_official_id_by_type(box['officials'], 'Third Base'))
 
-        setattr(self, '_mlb_venue_id', None if 'id' not in game['gameData']
-                ['venue'] else game['gameData']['venue']['id'])
         # setattr(self, '_series_description', game['seriesDescription'])
         # setattr(self, '_series_game_number', game['seriesGameNumber'])
         # setattr(self, '_games_in_series', game['gamesInSeries'])
@@ -389,83 +328,27 @@ class GameBoxscore:
 
         setattr(self, '_away_players', PlayerBoxscores(self, 'away', box['teams']['away']))
         setattr(self, '_home_players', PlayerBoxscores(self, 'home', box['teams']['home']))
-        setattr(self, '_play_by_play', PlayByPlay(game_id))
+        setattr(self, '_play_by_play', PlayByPlay(game_id, plays, is_final))
 
     def _get_official_id_by_type(self, officials, official_type):
         for official in officials:
             if official['officialType'] == official_type:
                 return official['official']['id']
 
+    def _get_fields(self):
+        return GAME_BOXSCORE_SCHEMA.get_fields(self)
+
     @property
     def dataframe(self):
-        fields_to_include = {
-            'MlbGameId': self._mlb_game_id,
-            'Season': self._season,
-            'GameDateTime': self._game_date_time,
-            'GameDate': self._game_date,
-            'GameTime': self._game_time,
-            'DayNight': self._day_night,
-            'GameStatus': self._game_status,
-            'AwayTeamId': self._away_team_id,
-            'AwayRecordWins': self._away_record_wins,
-            'AwayRecordLosses': self._away_record_losses,
-            'AwayRecordPct': self._away_record_pct,
-            'AwayRuns': self._away_runs,
-            'AwayFlyOuts': self._away_fly_outs,
-            'AwayGroundOuts': self._away_ground_outs,
-            'AwayDoubles': self._away_doubles,
-            'AwayTriples': self._away_triples,
-            'AwayHomeRuns': self._away_home_runs,
-            'AwayStrikeouts': self._away_strikeouts,
-            'AwayBaseOnBalls': self._away_base_on_balls,
-            'AwayIntentionalBaseOnBalls': self._away_intentional_base_on_balls,
-            'AwayHits': self._away_hits,
-            'AwayHitByPitch': self._away_hit_by_pitch,
-            'AwayAtBats': self._away_at_bats,
-            'AwayCaughtStealing': self._away_caught_stealing,
-            'AwayStolenBases': self._away_stolen_bases,
-            'AwayLeftOnBase': self._away_left_on_base,
-            'HomeTeamId': self._home_team_id,
-            'HomeRecordWins': self._home_record_wins,
-            'HomeRecordLosses': self._home_record_losses,
-            'HomeRecordPct': self._home_record_pct,
-            'HomeRuns': self._home_runs,
-            'HomeFlyOuts': self._home_fly_outs,
-            'HomeGroundOuts': self._home_ground_outs,
-            'HomeDoubles': self._home_doubles,
-            'HomeTriples': self._home_triples,
-            'HomeHomeRuns': self._home_home_runs,
-            'HomeStrikeouts': self._home_strikeouts,
-            'HomeBaseOnBalls': self._home_base_on_balls,
-            'HomeIntentionalBaseOnBalls': self._home_intentional_base_on_balls,
-            'HomeHits': self._home_hits,
-            'HomeHitByPitch': self._home_hit_by_pitch,
-            'HomeAtBats': self._home_at_bats,
-            'HomeCaughtStealing': self._home_caught_stealing,
-            'HomeStolenBases': self._home_stolen_bases,
-            'HomeLeftOnBase': self._home_left_on_base,
-            'HomePlateOfficialId': self._home_plate_official_id,
-            'FirstBaseOfficialId': self._first_base_official_id,
-            'SecondBaseOfficialId': self._second_base_official_id,
-            'ThirdBaseOfficialId': self._third_base_official_id,
-            'MlbVenueId': self._mlb_venue_id,
-            # 'SeriesDescription': self._series_description,
-            # 'SeriesGameNumber': self._series_game_number,
-            # 'GamesInSeries': self._games_in_series,
-            # 'ExtraInnings': self._extra_innings
-        }
-        return pd.DataFrame([fields_to_include], index=[self._mlb_game_id])
+        return pd.DataFrame([self._get_fields()], index=[self._mlb_game_id])
 
     @property
     def player_dataframes(self):
-        away_players = self._away_players.dataframes
-        home_players = self._home_players.dataframes
-        return pd.concat([away_players, home_players])
+        return PLAYER_BOXSCORE_SCHEMA.build_dataframe(self._away_players._boxscores + self._home_players._boxscores)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
+        dic = to_json_safe(self._get_fields())
         dic['AwayPlayers'] = self._away_players.to_dicts
         dic['HomePlayers'] = self._home_players.to_dicts
         dic['PlayByPlay'] = self._play_by_play.to_dicts
@@ -487,23 +370,65 @@ class GameBoxscores:
 
     date : string
         Date to get game boxscores from ('MM/DD/YYYY' format).
+
+    max_workers : int
+        Number of games to fetch concurrently (default 1, i.e. one at a time).
+        Requests are throttled by the client's per-host rate limit. Keep this
+        at or below the client's pool size so connections are reused.
+
+    games : list (dicts)
+        Already-fetched feed/live payloads to parse instead of requesting them.
+
+    boxscores : list (GameBoxscore)
+        Already-parsed games to collect.
     """
 
     def __init__(self, **kwargs):
-        self._boxscores = []
+        self._boxscores = list(self.iter(**kwargs))
+
+    @classmethod
+    def iter(cls, **kwargs):
+        """
+        Yields each game's GameBoxscore as soon as it has been fetched and
+        parsed, in schedule order, taking the same kwargs as GameBoxscores.
+        Nothing is kept once a game is yielded, so a season can be streamed
+        in bounded memory:
+
+            for game in GameBoxscores.iter(season=2019, max_workers=8):
+                game.player_dataframes.to_csv(...)
+        """
+        if 'boxscores' in kwargs:
+            yield from kwargs['boxscores']
+            return
 
-        if 'season' in kwargs:
-            start_date, end_date = get_dates_by_season(kwargs['season'])
+        if 'games' in kwargs:
+            for game in kwargs['games']:
+                yield GameBoxscore(game['gamePk'], game)
             return
-        elif 'range' in kwargs:
-            start_date, end_date = kwargs['range'][0], kwargs['range'][1]
-        elif 'date' in kwargs:
-            start_date, end_date = kwargs['date'], kwargs['date']
-        else:
+
+        start_date, end_date = get_dates_by_kwargs(kwargs)
+        if start_date is None:
             print('Invalid GameBoxscores param(s)')
             return
 
-        self._get_game_boxscores(start_date, end_date)
+        game_ids = get_game_ids_by_dates(start_date, end_date)
+        yield from iter_map(GameBoxscore, game_ids, kwargs.get('max_workers', 1))
+
+    @classmethod
+    async def afetch(cls, **kwargs):
+        """
+        Awaitable version of GameBoxscores(**kwargs) that fetches with the asyncio
+        client. Every game's feed is requested at once; the client's concurrency
+        cap and per-host rate limit decide how many are actually in flight.
+        """
+        start_date, end_date = get_dates_by_kwargs(kwargs)
+        if start_date is None:
+            return cls()
+        url = MLB_SCHEDULE_URL.format(start_date=start_date, end_date=end_date)
+        print('Getting MLB schedule from ' + url)
+        game_ids = get_final_game_ids(await aget_json(url))
+        games = await asyncio.gather(*[aget_game_feed(game_id) for game_id in game_ids])
+        return cls(games=games)
 
     def __repr__(self):
         return self._boxscores
@@ -511,52 +436,34 @@ class GameBoxscores:
     def __iter__(self):
         return iter(self.__repr__())
 
-    def _get_game_boxscores(self, start_date, end_date):
-        url = f'https://statsapi.mlb.com/api/v1/schedule?startDate={start_date}&endDate={end_date}&sportId=1'
-        print('Getting MLB schedule from ' + url)
-        schedule = requests.get(url, verify=VERIFY_REQUESTS).json()
-        for date in schedule['dates']:
-            for game_data in date['games']:
-                series_desc = game_data['seriesDescription']
-
-                if 'Training' in series_desc or 'Exhibition' in series_desc or 'All-Star' in series_desc:
-                    continue
-
-                if game_data['status']['codedGameState'] != 'F':
-                    continue  # Game is not over
-                # todo- games that were completed early?
-
-                # todo?
-                # if game['gamePk'] not i game_ids:
-                #     continue
-
-                boxscore = GameBoxscore(game_data['gamePk'])
-                self._boxscores.append(boxscore)
-                sleep(3)
-
     @property
     def dataframes(self):
-        frames = []
-        for boxscore in self.__iter__():
-            frames.append(boxscore.dataframe)
-        return pd.concat(frames)
+        return GAME_BOXSCORE_SCHEMA.build_dataframe(self._boxscores, [boxscore._mlb_game_id for boxscore in self])
 
     @property
     def player_dataframes(self):
-        frames = []
+        # One frame for every player of every game, rather than a concat of per-game frames.
+        records = []
         for game in self._boxscores:
-            away_players = game._away_players.dataframes
-            home_players = game._home_players.dataframes
-            frames.append(pd.concat([away_players, home_players]))
-        return pd.concat(frames)
+            records.extend(game._away_players)
+            records.extend(game._home_players)
+        return PLAYER_BOXSCORE_SCHEMA.build_dataframe(records)
 
     @property
     def pbp_dataframes(self):
-        frames = []
+        records = []
         for game in self._boxscores:
-            pbp = game._play_by_play.dataframes
-            frames.append(pbp)
-        return pd.concat(frames)
+            records.extend(game._play_by_play)
+        return PLAY_SCHEMA.build_dataframe(records)
+
+    def to_parquet(self, path):
+        """
+        Appends the games, player boxscores and plays to the Parquet datasets
+        under path/mlb/, partitioned by season and date. Read them back with
+        export.read_game_boxscores(path, 'mlb', 'player_boxscores', seasons=[...]).
+        """
+        write_game_boxscores(path, 'mlb', self._boxscores, GAME_BOXSCORE_SCHEMA, PLAYER_BOXSCORE_SCHEMA,
+                             PLAY_SCHEMA, 'MlbGameId')
 
     @property
     def to_dicts(self):
@@ -13,4 +13,10 @@ MLB_SEASONS = [
     {'season': 2016, 'start_date': '04/03/2016', 'end_date': '11/02/2016'},
     {'season': 2017, 'start_date': '04/02/2017', 'end_date': '11/01/2017'},
     {'season': 2018, 'start_date': '03/29/2018', 'end_date': '10/28/2018'},
-    {'season': 2019, 'start_date': '03/28/2019', 'end_date': '11/01/2019'}]
\ No newline at end of file
+    {'season': 2019, 'start_date': '03/28/2019', 'end_date': '11/01/2019'}]
+
+MLB_SCHEDULE_URL = 'https://statsapi.mlb.com/api/v1/schedule?startDate={start_date}&endDate={end_date}&sportId=1'
+MLB_GAME_FEED_URL = 'https://statsapi.mlb.com/api/v1/game/{game_id}/feed/live'
+MLB_TEAMS_URL = 'https://statsapi.mlb.com/api/v1/teams?sportId=1'
+MLB_PLAYERS_URL = 'https://statsapi.mlb.com/api/v1/sports/1/players?season={season}'
+MLB_ODDS_URL = 'https://www.bovada.lv/services/sports/event/v2/events/A/description/baseball/mlb'
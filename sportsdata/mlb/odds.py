@@ -1,7 +1,9 @@
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
-from datetime import datetime
+from ..aclient import aget_json
+from ..client import get_json
+from ..odds import EventOdds, build_market_dataframe, get_game_events, set_game_lines
+from ..util import build_dataframe, to_json_safe
+from .constants import MLB_ODDS_URL
 
 
 class GameOdds:
@@ -25,54 +27,26 @@ class GameOdds:
         self._home_moneyline_odds_decimal = None
         self._home_handicap = None
         self._over_under = None
+        self._odds = None
 
-        self._set_odds(odds)
+        self._set_odds(event)
 
     def _set_odds(self, event):
-        setattr(self, '_event_description', event['description'])
-        setattr(self, '_event_start_time', datetime.fromtimestamp(event['startTime']/1000))
-
-        # Game Lines, Alternative Lines, Score Props, etc.
-        for display_group in event['displayGroups']:
-            if display_group['description'] == 'Game Lines':
-                # Moneyline, Point Spread, Total
-                for market in display_group['markets']:
-                    if market['description'] == 'Moneyline' and market['period']['description'] == 'Match':
-                        self._get_moneyline(market)
-                    if market['description'] in ['Point Spread', 'Puck Line'] and market['period']['description'] == 'Match':
-                        self._get_point_spread(market)
-                    if market['description'] == 'Total' and market['period']['description'] == 'Match':
-                        self._get_totals(market)
-
-    def _get_moneyline(self, market):
-        for outcome in market['outcomes']:
-            if outcome['type'] == 'A':
-                setattr(self, '_away_team_name', outcome['description'])
-                setattr(self, '_away_moneyline_american', outcome['price']['american'])
-                setattr(self, '_away_moneyline_decimal', outcome['price']['decimal'])
-            if outcome['type'] == 'H':
-                setattr(self, '_home_team_name', outcome['description'])
-                setattr(self, '_home_moneyline_american', outcome['price']['american'])
-                setattr(self, '_home_moneyline_decimal', outcome['price']['decimal'])
-
-    def _get_point_spread(self, market):
-        for outcome in market['outcomes']:
-            if outcome['type'] == 'A':
-                setattr(self, '_away_handicap', outcome['price']['handicap'])
-            if outcome['type'] == 'H':
-                setattr(self, '_home_handicap', outcome['price']['handicap'])
-
-    def _get_totals(self, market):
-        for outcome in market['outcomes']:
-            if outcome['description'] == 'Over':
-                #totals['Over'] = outcome['price']['handicap']
-                setattr(self, '_over_under', outcome['price']['handicap'])
-            # if outcome['description'] == 'Under':
-                #totals['Under'] = outcome['price']['handicap']
+        odds = EventOdds(event)
+        setattr(self, '_odds', odds)
+        setattr(self, '_event_description', odds.event_description)
+        setattr(self, '_event_start_time', odds.event_start_time)
+        set_game_lines(self, odds)
 
     @property
-    def dataframe(self):
-        fields_to_include = {
+    def markets(self):
+        """
+        EventOdds with every market of the game, not just the game lines.
+        """
+        return self._odds
+
+    def _get_fields(self):
+        return {
             'EventDescription': self._event_description,
             'EventStartTime': self._event_start_time,
             'AwayTeamName': self._away_team_name,
@@ -85,13 +59,14 @@ class GameOdds:
             'HomeHandicap': self._home_handicap,
             'OverUnder': self._over_under
         }
-        return pd.DataFrame([fields_to_include], index=[self._event_description])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._event_description])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class GamesOdds:
@@ -100,12 +75,24 @@ class GamesOdds:
 
     Parameters
     ----------
-    None
+    odds_json : list
+        An already-fetched Bovada payload to parse instead of requesting one.
     """
-    def __init__(self):
+    def __init__(self, odds_json=None):
         self._odds = []
 
-        self._get_odds()
+        if odds_json is None:
+            self._get_odds()
+        else:
+            self._parse_odds(odds_json)
+
+    @classmethod
+    async def afetch(cls):
+        """
+        Awaitable version of GamesOdds() that fetches with the asyncio client.
+        """
+        print('Getting odds from ' + MLB_ODDS_URL)
+        return cls(await aget_json(MLB_ODDS_URL))
 
     def __repr__(self):
         return self._odds
@@ -114,25 +101,27 @@ class GamesOdds:
         return iter(self.__repr__())
 
     def _get_odds(self):
-        url = 'https://www.bovada.lv/services/sports/event/v2/events/A/description/baseball/mlb'
-        print('Getting odds from ' + url)
-        odds_json = requests.get(url, verify=VERIFY_REQUESTS).json()
+        print('Getting odds from ' + MLB_ODDS_URL)
+        self._parse_odds(get_json(MLB_ODDS_URL))
+
+    def _parse_odds(self, odds_json):
         if len(odds_json) == 0:
-            print(f'No NHL odds found.')
+            print(f'No MLB odds found.')
             return
-        for event in odds_json[0]['events']:
-            if event['type'] != 'GAMEEVENT':
-                # Skip odds for season-long bets (i.e. Atlantic Division - Odds to Win)
-                continue
-            odds = GameOdds(event)
-            self._odds.append(odds)
+        for event in get_game_events(odds_json):
+            self._odds.append(GameOdds(event))
 
     @property
     def dataframes(self):
-        frames = []
-        for odds in self.__iter__():
-            frames.append(odds.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([odds._get_fields() for odds in self],
+                               [odds._event_description for odds in self])
+
+    @property
+    def market_dataframes(self):
+        """
+        Every market of every game, one row per outcome (odds.MARKET_COLUMNS).
+        """
+        return build_market_dataframe([odds._odds for odds in self])
 
     @property
     def to_dicts(self):
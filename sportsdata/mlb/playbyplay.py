@@ -1,9 +1,37 @@
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
+from ..client import get_json
+from ..constants import CACHE_FOREVER
+from ..schema import Field, Schema
+from ..util import to_json_safe
 from time import sleep
 
 
+PLAY_SCHEMA = Schema([
+    Field('_mlb_game_id', 'MlbGameId', dtype='Int32'),
+    Field('_result_type', 'ResultType', 'play', 'result.type', dtype='category'),
+    Field('_event', 'Event', 'play', 'result.event', dtype='category'),
+    Field('_event_type', 'EventType', 'play', 'result.eventType', dtype='category'),
+    Field('_description', 'Description', 'play', 'result.description'),
+    Field('_rbi', 'Rbi', 'play', 'result.rbi', dtype='Int8'),
+    Field('_away_score', 'AwayScore', 'play', 'result.awayScore', dtype='Int8'),
+    Field('_home_score', 'HomeScore', 'play', 'result.homeScore', dtype='Int8'),
+    Field('_at_bat_index', 'AtBatIndex', 'play', 'about.atBatIndex', dtype='Int16'),
+    Field('_half_inning', 'HalfInning', 'play', 'about.halfInning', dtype='category'),
+    Field('_is_top_inning', 'IsTopInning', 'play', 'about.isTopInning', dtype='boolean'),
+    Field('_inning', 'Inning', 'play', 'about.inning', dtype='Int8'),
+    Field('_is_scoring_play', 'IsScoringPlay', 'play', 'about.isScoringPlay', dtype='boolean'),
+    Field('_has_out', 'HasOut', 'play', 'about.hasOut', dtype='boolean'),
+    Field('_count_balls', 'CountBalls', 'play', 'count.balls', dtype='Int8'),
+    Field('_count_strikes', 'CountStrikes', 'play', 'count.strikes', dtype='Int8'),
+    Field('_count_outs', 'CountOuts', 'play', 'count.outs', dtype='Int8'),
+    Field('_batter_id', 'BatterId', 'play', 'matchup.batter.id', dtype='Int32'),
+    Field('_bat_side', 'BatSide', 'play', 'matchup.batSide.code', dtype='category'),
+    Field('_pitcher_id', 'PitcherId', 'play', 'matchup.pitcher.id', dtype='Int32'),
+    Field('_pitch_hand', 'PitchHand', 'play', 'matchup.pitchHand.code', dtype='category'),
+    Field('_men_on_base', 'MenOnBase', 'play', 'matchup.splits.menOnBase', dtype='category')
+])
+
+
 class Play:
     """
     Represents a single play
@@ -17,89 +45,27 @@ class Play:
         Dict that contains play information.
     """
 
+    __slots__ = PLAY_SCHEMA.attributes
+
     def __init__(self, game_id, play_json):
-        self._mlb_game_id = None
-        self._result_type = None
-        self._event = None
-        self._event_type = None
-        self._description = None
-        self._rbi = None
-        self._away_score = None
-        self._home_score = None
-        self._at_bat_index = None
-        self._half_inning = None
-        self._is_top_inning = None
-        self._inning = None
-        self._is_scoring_play = None
-        self._has_out = None
-        self._count_balls = None
-        self._count_strikes = None
-        self._count_outs = None
-        self._batter_id = None
-        self._bat_side = None
-        self._pitcher_id = None
-        self._pitch_hand = None
-        self._men_on_base = None
+        PLAY_SCHEMA.reset(self)
 
         setattr(self, '_mlb_game_id', game_id)
         self._parse_play(play_json)
 
     def _parse_play(self, play):
-        setattr(self, '_result_type', play['result']['type'])
-        setattr(self, '_event', play['result']['event'])
-        setattr(self, '_event_type', play['result']['eventType'])
-        setattr(self, '_description', play['result']['description'])
-        setattr(self, '_rbi', play['result']['rbi'])
-        setattr(self, '_away_score', play['result']['awayScore'])
-        setattr(self, '_home_score', play['result']['homeScore'])
-        setattr(self, '_at_bat_index', play['about']['atBatIndex'])
-        setattr(self, '_half_inning', play['about']['halfInning'])
-        setattr(self, '_is_top_inning', play['about']['isTopInning'])
-        setattr(self, '_inning', play['about']['inning'])
-        setattr(self, '_is_scoring_play', play['about']['isScoringPlay'])
-        setattr(self, '_has_out', play['about']['hasOut'])
-        setattr(self, '_count_balls', play['count']['balls'])
-        setattr(self, '_count_strikes', play['count']['strikes'])
-        setattr(self, '_count_outs', play['count']['outs'])
-        setattr(self, '_batter_id', play['matchup']['batter']['id'])
-        setattr(self, '_bat_side', play['matchup']['batSide']['code'])
-        setattr(self, '_pitcher_id', play['matchup']['pitcher']['id'])
-        setattr(self, '_pitch_hand', play['matchup']['pitchHand']['code'])
-        setattr(self, '_men_on_base', play['matchup']['splits']['menOnBase'])
+        PLAY_SCHEMA.extract('play', self, play)
+
+    def _get_fields(self):
+        return PLAY_SCHEMA.get_fields(self)
 
     @property
     def dataframe(self):
-        fields_to_include = {
-            'MlbGameId': self._mlb_game_id,
-            'ResultType': self._result_type,
-            'Event': self._event,
-            'EventType': self._event_type,
-            'Description': self._description,
-            'Rbi': self._rbi,
-            'AwayScore': self._away_score,
-            'HomeScore': self._home_score,
-            'AtBatIndex': self._at_bat_index,
-            'HalfInning': self._half_inning,
-            'IsTopInning': self._is_top_inning,
-            'Inning': self._inning,
-            'IsScoringPlay': self._is_scoring_play,
-            'HasOut': self._has_out,
-            'CountBalls': self._count_balls,
-            'CountStrikes': self._count_strikes,
-            'CountOuts': self._count_outs,
-            'BatterId': self._batter_id,
-            'BatSide': self._bat_side,
-            'PitcherId': self._pitcher_id,
-            'PitchHand': self._pitch_hand,
-            'MenOnBase': self._men_on_base
-        }
-        return pd.DataFrame([fields_to_include], index=None)
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class PlayByPlay:
@@ -110,12 +76,22 @@ class PlayByPlay:
     ----------
     game_id : int
         The game ID according to MLB's API.
+
+    plays : list (dict)
+        List of dicts that contains the play-by-play data, e.g. from the game's
+        feed/live payload. Fetched from the playByPlay endpoint if not given.
+
+    is_final : bool
+        Whether or not the game is over. Plays for final games never change,
+        so the response is cached forever.
     """
 
-    def __init__(self, game_id):
+    def __init__(self, game_id, plays=None, is_final=False):
         self._plays = []
 
-        self._get_play_by_play(game_id)
+        if plays is None:
+            plays = self._get_play_by_play(game_id, is_final)
+        self._parse_play_by_play(game_id, plays)
 
     def __repr__(self):
         return self._plays
@@ -123,20 +99,20 @@ class PlayByPlay:
     def __iter__(self):
         return iter(self.__repr__())
 
-    def _get_play_by_play(self, game_id):
+    def _get_play_by_play(self, game_id, is_final):
         url = f'https://statsapi.mlb.com/api/v1/game/{game_id}/playByPlay'
         print('Getting play-by-play data from ' + url)
-        pbp_json = requests.get(url, verify=VERIFY_REQUESTS).json()
-        for play_json in pbp_json['allPlays']:
+        pbp_json = get_json(url, ttl=CACHE_FOREVER if is_final else None)
+        return pbp_json['allPlays']
+
+    def _parse_play_by_play(self, game_id, plays):
+        for play_json in plays:
             play = Play(game_id, play_json)
             self._plays.append(play)
 
     @property
     def dataframes(self):
-        frames = []
-        for play in self.__iter__():
-            frames.append(play.dataframe)
-        return pd.concat(frames)
+        return PLAY_SCHEMA.build_dataframe(self._plays)
 
     @property
     def to_dicts(self):
@@ -1,6 +1,8 @@
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
+from ..aclient import aget_json
+from ..client import get_json
+from ..util import build_dataframe, to_json_safe
+from .constants import MLB_PLAYERS_URL
 
 
 class Player:
@@ -48,9 +50,8 @@ class Player:
         setattr(self, '_bat_side', player['batSide']['code'])
         setattr(self, '_pitch_hand', player['pitchHand']['code'])
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'MlbPlayerId': self._mlb_player_id,
             'Season': self._season,
             'FullName': self._full_name,
@@ -65,13 +66,14 @@ class Player:
             'BatSide': self._bat_side,
             'PitchHand': self._pitch_hand,
         }
-        return pd.DataFrame([fields_to_include], index=[self._mlb_player_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._mlb_player_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Players:
@@ -82,11 +84,26 @@ class Players:
     ----------
     season : int
         Season to get player data from.
+
+    players_json : dict
+        An already-fetched players payload to parse instead of requesting one.
     """
-    def __init__(self, season):
+    def __init__(self, season, players_json=None):
         self._players = []
 
-        self._get_players(season)
+        if players_json is None:
+            self._get_players(season)
+        else:
+            self._parse_players(players_json, season)
+
+    @classmethod
+    async def afetch(cls, season):
+        """
+        Awaitable version of Players(season) that fetches with the asyncio client.
+        """
+        url = MLB_PLAYERS_URL.format(season=season)
+        print('Getting players from ' + url)
+        return cls(season, await aget_json(url))
 
     def __repr__(self):
         return self._players
@@ -95,19 +112,19 @@ class Players:
         return iter(self.__repr__())
 
     def _get_players(self, season):
-        url = f'https://statsapi.mlb.com/api/v1/sports/1/players?season={season}'
+        url = MLB_PLAYERS_URL.format(season=season)
         print('Getting players from ' + url)
-        players = requests.get(url, verify=VERIFY_REQUESTS).json()
+        self._parse_players(get_json(url), season)
+
+    def _parse_players(self, players, season):
         for person_json in players['people']:
             player = Player(person_json, season)
             self._players.append(player)
 
     @property
     def dataframes(self):
-        frames = []
-        for player in self.__iter__():
-            frames.append(player.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([player._get_fields() for player in self],
+                               [player._mlb_player_id for player in self])
 
     @property
     def to_dicts(self):
@@ -1,6 +1,8 @@
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
+from ..aclient import aget_json
+from ..client import get_json
+from ..util import build_dataframe, to_json_safe
+from .constants import MLB_TEAMS_URL
 
 
 class Team:
@@ -34,9 +36,8 @@ class Team:
         setattr(self, '_mlb_league_id', team['league']['id'])
         setattr(self, '_mlb_division_id', team['division']['id'])
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'MlbTeamId': self._mlb_team_id,
             'TeamName': self._team_name,
             'MlbVenueId': self._mlb_venue_id,
@@ -46,13 +47,14 @@ class Team:
             'MlbLeagueId': self._mlb_league_id,
             'MlbDivisionId': self._mlb_division_id
         }
-        return pd.DataFrame([fields_to_include], index=[self._mlb_team_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._mlb_team_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Teams:
@@ -61,12 +63,24 @@ class Teams:
 
     Parameters
     ----------
-    None
+    teams_json : dict
+        An already-fetched teams payload to parse instead of requesting one.
     """
-    def __init__(self):
+    def __init__(self, teams_json=None):
         self._teams = []
 
-        self._get_teams()
+        if teams_json is None:
+            self._get_teams()
+        else:
+            self._parse_teams(teams_json)
+
+    @classmethod
+    async def afetch(cls):
+        """
+        Awaitable version of Teams() that fetches with the asyncio client.
+        """
+        print('Getting teams from ' + MLB_TEAMS_URL)
+        return cls(await aget_json(MLB_TEAMS_URL))
 
     def __repr__(self):
         return self._teams
@@ -75,19 +89,18 @@ class Teams:
         return iter(self.__repr__())
 
     def _get_teams(self):
-        url = f'https://statsapi.mlb.com/api/v1/teams?sportId=1'
-        print('Getting teams from ' + url)
-        teams = requests.get(url, verify=VERIFY_REQUESTS).json()
+        print('Getting teams from ' + MLB_TEAMS_URL)
+        self._parse_teams(get_json(MLB_TEAMS_URL))
+
+    def _parse_teams(self, teams):
         for team_json in teams['teams']:
             team = Team(team_json)
             self._teams.append(team)
 
     @property
     def dataframes(self):
-        frames = []
-        for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([team._get_fields() for team in self],
+                               [team._mlb_team_id for team in self])
 
     @property
     def to_dicts(self):
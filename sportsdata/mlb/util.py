@@ -10,6 +10,36 @@ def get_dates_by_season(season):
     return start_date, end_date
 
 
+def get_dates_by_kwargs(kwargs):
+    # (start_date, end_date) from the season/range/date kwargs the collection classes
+    # take, or (None, None) if none were given.
+    if 'season' in kwargs:
+        return get_dates_by_season(kwargs['season'])
+    elif 'range' in kwargs:
+        return kwargs['range'][0], kwargs['range'][1]
+    elif 'date' in kwargs:
+        return kwargs['date'], kwargs['date']
+    return None, None
+
+
+def get_final_game_ids(schedule):
+    # IDs of the regular/postseason games in a schedule payload that are over.
+    game_ids = []
+    for date in schedule['dates']:
+        for game_data in date['games']:
+            series_desc = game_data['seriesDescription']
+
+            if 'Training' in series_desc or 'Exhibition' in series_desc or 'All-Star' in series_desc:
+                continue
+
+            if game_data['status']['codedGameState'] != 'F':
+                continue  # Game is not over
+            # todo- games that were completed early?
+
+            game_ids.append(game_data['gamePk'])
+    return game_ids
+
+
 def get_missing_players(new_players, existing_players):
     new_players_upper = []
     for player in new_players:
@@ -1,8 +1,8 @@
 import pandas as pd
-import requests
-from constants import NBA_REQUEST_PROXIES, NBA_REQUEST_HEADERS
+from ..client import get_json
+from ..util import build_dataframe, to_json_safe
+from .constants import NBA_REQUEST_PROXIES, NBA_REQUEST_HEADERS
 from datetime import datetime, timedelta
-from time import sleep
 
 
 class PlayerBoxscore:
@@ -95,9 +95,8 @@ class PlayerBoxscore:
         setattr(self, '_plus_minus',
                 None if box['PLUS_MINUS'] == None else int(box['PLUS_MINUS']))
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'NbaPlayerId': self._nba_player_id,
             'NbaGameId': self._nba_game_id,
             'Season': self._season,
@@ -128,13 +127,14 @@ class PlayerBoxscore:
             'Points': self._points,
             'PlusMinus': self._plus_minus
         }
-        return pd.DataFrame([fields_to_include], index=None)
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 class PlayerBoxscores:
     """
@@ -161,8 +161,7 @@ class PlayerBoxscores:
             print(game._nba_game_id_str)
             url = f'https://stats.nba.com/stats/boxscoretraditionalv2/?gameId={game._nba_game_id_str}&startPeriod=1&endPeriod=1&startRange=0&endRange=0&rangeType=0&startRange=0'
             print(url)
-            boxscore_data = requests.get(
-                url, NBA_REQUEST_PROXIES, headers=NBA_REQUEST_HEADERS, timeout=10).json()
+            boxscore_data = get_json(url, proxies=NBA_REQUEST_PROXIES, headers=NBA_REQUEST_HEADERS)
             for results in boxscore_data['resultSets']:
                 if results['name'] != 'PlayerStats':
                     # Skip team-based stats
@@ -175,10 +174,7 @@ class PlayerBoxscores:
 
     @property
     def dataframes(self):
-        frames = []
-        for boxscore in self.__iter__():
-            frames.append(boxscore.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([boxscore._get_fields() for boxscore in self])
 
     @property
     def to_dicts(self):
@@ -242,9 +238,8 @@ class GameBoxscore:
         setattr(self, '_home_team_record_losses', int(game['h']['re'].split('-')[1]))
         setattr(self, '_nba_venue_name', game['an'])
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'NbaGameId': self._nba_game_id,
             'Season': self._season,
             'GameDateTime': self._game_date_time,
@@ -261,12 +256,14 @@ class GameBoxscore:
             'HomeTeamRecordLosses': self._home_team_record_losses,
             'NbaVenueName': self._nba_venue_name
         }
-        return pd.DataFrame([fields_to_include], index=[self._nba_game_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._nba_game_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
+        dic = to_json_safe(self._get_fields())
         dic['AwayPlayers'] = self._away_players.to_dicts
         dic['HomePlayers'] = self._home_players.to_dicts
         return dic
@@ -288,40 +285,38 @@ class GameBoxscores:
         End date to get game boxscores from ('MM/DD/YYYY' format)
     """
     def __init__(self, season, start_date, end_date):
-        self._boxscores = []
-
-        self._get_game_boxscores(season, start_date, end_date)
-
-    def __repr__(self):
-        return self._boxscores
-
-    def __iter__(self):
-        return iter(self.__repr__())
-
-    def _get_games(self, season, start_date, end_date):
+        self._boxscores = list(self.iter(season, start_date, end_date))
+
+    @classmethod
+    def iter(cls, season, start_date, end_date):
+        """
+        Yields each game's GameBoxscore as soon as it has been parsed, taking
+        the same parameters as GameBoxscores, without keeping the games.
+        """
         url = f'http://data.nba.com/data/10s/v2015/json/mobile_teams/nba/{season}/league/00_full_schedule.json'  # todo
         print('Getting NBA schedule from ' + url)
-        schedule = requests.get(url, verify=VERIFY_REQUESTS).json()
+        schedule = get_json(url)
         begin = datetime.strptime(start_date, '%m/%d/%Y').date()
         end = datetime.strptime(end_date, '%m/%d/%Y').date()
         for item in schedule['lscd']:
             for game_data in item['mscd']['g']:
                 game_dt = datetime.strptime(game_data['etm'], '%Y-%m-%dT%H:%M:%S') + timedelta(hours=-3)
                 game_date = game_dt.date()
-                game_time = game_dt.time()
                 if game_date < begin or game_date > end or game_data['stt'] == 'PPD':
                     # Only get games in the specified date range that were not postponed.
                     continue
-                boxscore = GameBoxscore(season, game_data)
-                self._boxscore.append(boxscore)
-                sleep(5)
+                yield GameBoxscore(season, game_data)
+
+    def __repr__(self):
+        return self._boxscores
+
+    def __iter__(self):
+        return iter(self.__repr__())
 
     @property
     def dataframes(self):
-        frames = []
-        for boxscore in self.__iter__():
-            frames.append(boxscore.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([boxscore._get_fields() for boxscore in self],
+                               [boxscore._nba_game_id for boxscore in self])
 
     @property
     def to_dicts(self):
@@ -241,3 +241,5 @@ NBA_API_TEAMS = [
         'location': 'Washington'
     }
 ]
+
+NBA_ODDS_URL = 'https://www.bovada.lv/services/sports/event/v2/events/A/description/basketball/nba'
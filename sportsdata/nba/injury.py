@@ -1,4 +1,6 @@
 import pandas as pd
+from ..client import get_text
+from ..util import build_dataframe, to_json_safe
 from datetime import datetime
 from pyquery import PyQuery as pq
 
@@ -43,9 +45,8 @@ class Injury:
                 setattr(self, '_injury_type', status_and_type[1].replace(')', '').strip())
                 setattr(self, '_details', notes[1].strip())
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'ReportDate': self._report_date,
             'PlayerName': self._player_name,
             'NbaTeam': self._nba_team,
@@ -54,13 +55,14 @@ class Injury:
             'InjuryType': self._injury_type,
             'Details': self._details
         }
-        return pd.DataFrame([fields_to_include], index=[self._report_date])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._report_date])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
         
 
 class Injuries:
@@ -85,7 +87,7 @@ class Injuries:
     def _get_injuries(self):
         url = 'https://www.basketball-reference.com/friv/injuries.cgi'
         print('Getting data from ' + url)
-        injuries_html = pq(url, verify=VERIFY_REQUESTS)
+        injuries_html = pq(get_text(url))
         for table in injuries_html('table').items():
             if table.attr['id'] == 'injuries':
                 injuries_table = table
@@ -99,10 +101,8 @@ class Injuries:
 
     @property
     def dataframes(self):
-        frames = []
-        for injury in self.__iter__():
-            frames.append(injury.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([injury._get_fields() for injury in self],
+                               [injury._report_date for injury in self])
 
     @property
     def to_dicts(self):
@@ -1,8 +1,7 @@
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
+from ..client import get_json
+from ..util import build_dataframe, to_json_safe
 from constants import NBA_API_TEAMS, NBA_REQUEST_PROXIES, NBA_REQUEST_HEADERS
-from time import sleep
 
 
 class Player:
@@ -46,9 +45,8 @@ class Player:
         setattr(self, '_nba_team_id', team_id)
         setattr(self, '_position', player['POSITION'])
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'NbaPlayerId': self._nba_player_id,
             'FullName': self._full_name,
             # 'FirstName': self._first_name,
@@ -60,13 +58,14 @@ class Player:
             'Position': self._position,
             # 'DebutDate': self._debut_date
         }
-        return pd.DataFrame([fields_to_include], index=[self._nba_player_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._nba_player_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Players:
@@ -92,7 +91,7 @@ class Players:
         for team in NBA_API_TEAMS:
             url = f'https://stats.nba.com/stats/commonteamroster?LeagueID=&Season=2019-20&TeamID={team["team_id"]}'
             print(f'Getting roster from {url}')
-            roster = requests.get(url, NBA_REQUEST_PROXIES, headers=NBA_REQUEST_HEADERS, timeout=10, verify=VERIFY_REQUESTS).json()
+            roster = get_json(url, proxies=NBA_REQUEST_PROXIES, headers=NBA_REQUEST_HEADERS)
             for person in roster['resultSets']:
                 if person['name'] != 'CommonTeamRoster':
                     # Skip coaches
@@ -102,14 +101,11 @@ class Players:
                 for player_row in player_rows:
                     player = Player(player_row, stat_headers)
                     self._players.append(player)
-            sleep(3)
 
     @property
     def dataframes(self):
-        frames = []
-        for player in self.__iter__():
-            frames.append(player.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([player._get_fields() for player in self],
+                               [player._nba_player_id for player in self])
         
     @property
     def to_dicts(self):
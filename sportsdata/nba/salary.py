@@ -1,5 +1,7 @@
 import pandas as pd
-import requests
+from ..client import get_text
+from ..util import build_dataframe
+from pyquery import PyQuery as pq
 
 
 class Salary:
@@ -18,9 +20,8 @@ class Salary:
     def _get_salary_data(self):
         print('todo')
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'SalaryDate': self._salary_date,
             'PlayerName': self._player_name,
             'DraftKingsSalary': self._draftkings_salary,
@@ -30,7 +31,10 @@ class Salary:
             'YahooSalary': self._yahoo_salary,
             'YahooFp': self._yahoo_fantasy_points
         }
-        return pd.DataFrame([fields_to_include], index=None)
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=None)
 
 
 class Salaries:
@@ -51,7 +55,6 @@ class Salaries:
             for website in ['dk', 'fd', 'yh']:
                 day_dataframe = get_dataframe_by_website_and_date(website, loop_date)
                 day_dataframes.append(day_dataframe)
-                sleep(randint(2, 4))
             joined_df = util.join_dataframes(day_dataframes, HEADERS, loop_date)
             col_mappings = {'Salary_x': 'DraftKingsSalary', 'FantasyPoints_x': 'DraftKingsFp', 'Salary_y': 'FanDuelSalary',
                             'FantasyPoints_y': 'FanDuelFp', 'Salary': 'YahooSalary', 'FantasyPoints': 'YahooFp'}
@@ -63,7 +66,7 @@ class Salaries:
         dataframe = pd.DataFrame()
         url = NBA_SALARIES_URL % (website, date.month, date.day, date.year)
         print('Getting salary data from: ' + url)
-        salary_html = pq(url)
+        salary_html = pq(get_text(url))
         if salary_html:
             dates, players, salaries, fps = [], [], [], []
             for table in salary_html('table').items():
@@ -96,7 +99,4 @@ class Salaries:
 
     @property
     def dataframes(self):
-        frames = []
-        for salary in self.__iter__():
-            frames.append(salary.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([salary._get_fields() for salary in self])
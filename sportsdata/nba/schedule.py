@@ -1,6 +1,6 @@
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
+from ..client import get_json
+from ..util import build_dataframe, to_json_safe
 from .util import get_dates_by_season
 from datetime import datetime, timedelta
 from dateutil import tz
@@ -47,9 +47,8 @@ class Game:
         #setattr(self, '_nba_venue_id', None if 'id' not in game['venue'] else game['venue']['id'])
         setattr(self, '_nba_venue_name', game['an'])
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'NbaGameId': self._nba_game_id,
             'Season': self._season,
             'GameDateTime': self._game_date_time,
@@ -60,13 +59,14 @@ class Game:
             # 'NbaVenueId': self._nba_venue_id,
             'NbaVenueName': self._nba_venue_name
         }
-        return pd.DataFrame([fields_to_include], index=[self._nba_game_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._nba_game_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Schedule:
@@ -113,7 +113,7 @@ class Schedule:
     def _get_schedule(self, season, start_date, end_date):
         url = f'http://data.nba.com/data/10s/v2015/json/mobile_teams/nba/{season}/league/00_full_schedule.json'
         print('Getting schedule from ' + url)
-        schedule = requests.get(url, verify=VERIFY_REQUESTS).json()
+        schedule = get_json(url)
         begin = datetime.strptime(start_date, '%m/%d/%Y').date()
         end = datetime.strptime(end_date, '%m/%d/%Y').date()
         for item in schedule['lscd']:
@@ -126,10 +126,8 @@ class Schedule:
 
     @property
     def dataframes(self):
-        frames = []
-        for game in self.__iter__():
-            frames.append(game.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([game._get_fields() for game in self],
+                               [game._nba_game_id for game in self])
 
     @property
     def to_dicts(self):
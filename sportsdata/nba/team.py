@@ -1,6 +1,7 @@
 import pandas as pd
 import requests
 from ..constants import VERIFY_REQUESTS
+from ..util import build_dataframe, to_json_safe
 from .constants import NBA_API_TEAMS
 
 
@@ -35,9 +36,8 @@ class Team:
         # setattr(self, '_nba_conference_id', team['conference']['id'])
         # setattr(self, '_nba_division_id', team['division']['id'])
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'NbaTeamId': self._nba_team_id,
             'TeamName': self._team_name,
             #'NbaVenueId': self._mlb_venue_id,
@@ -47,13 +47,14 @@ class Team:
             #'NbaConferenceId': self._nba_conference_id,
             #'NbaDivisionId': self._nba_division_id
         }
-        return pd.DataFrame([fields_to_include], index=[self._nba_team_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._nba_team_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
         
 
 class Teams:
@@ -82,10 +83,8 @@ class Teams:
 
     @property
     def dataframes(self):
-        frames = []
-        for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([team._get_fields() for team in self],
+                               [team._nba_team_id for team in self])
 
     @property
     def to_dicts(self):
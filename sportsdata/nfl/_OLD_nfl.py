@@ -1,10 +1,8 @@
 import argparse
 import json
-import requests
+from sportsdata.client import get_json, post
 from datetime import datetime, timedelta
 #from dateutil import tz
-from random import randint
-from time import sleep
 
 
 def validate_dates(date_strings):
@@ -97,7 +95,7 @@ def get_games(seasons, weeks):
                 str(season) + "/" + \
                 'REG' + "/" + str(week) + ".json"
             print("Getting game data from " + url)
-            games = requests.get(url, verify=VERIFY_REQUESTS).json()
+            games = get_json(url)
 
             for game in games["gameScores"]:
                 # if game['gameSchedule']['season'] > end_season:
@@ -108,12 +106,9 @@ def get_games(seasons, weeks):
                 #     return
                 game_ids.append(game['gameSchedule']['gameId'])
 
-            sleep(randint(5, 10))
-
             for game_id in game_ids:
 
-                boxscore = requests.get(
-                    "https://feeds.nfl.com/feeds-rs/boxscore/" + str(game_id) + ".json", verify=VERIFY_REQUESTS).json()
+                boxscore = get_json("https://feeds.nfl.com/feeds-rs/boxscore/" + str(game_id) + ".json")
 
                 game_obj = {
                     'NflGameId': boxscore['gameSchedule']['gameId'],
@@ -143,8 +138,6 @@ def get_games(seasons, weeks):
 
                 game_objs.append(game_obj)
 
-                sleep(randint(20, 30))
-
     for game in game_objs:
         print(game)
         print('\n')
@@ -156,7 +149,7 @@ def get_boxscores(seasons, weeks):
         url = "https://feeds.nfl.com/feeds-rs/schedules/" + \
             str(season) + ".json"
         print("Getting list of game IDs from " + url)
-        games = requests.get(url).json()
+        games = get_json(url)
         game_ids = []
         for game in games['gameSchedules']:
             game_ids.append(game['gameId'])
@@ -165,8 +158,7 @@ def get_boxscores(seasons, weeks):
               str(len(game_ids)) + " games...")
 
         for game_id in game_ids:
-            boxscore = requests.get(
-                "https://feeds.nfl.com/feeds-rs/boxscore/" + str(game_id) + ".json").json()
+            boxscore = get_json("https://feeds.nfl.com/feeds-rs/boxscore/" + str(game_id) + ".json")
 
             home_team_id = boxscore['gameSchedule']['homeTeamId']
             away_team_id = boxscore['gameSchedule']['visitorTeamId']
@@ -378,10 +370,8 @@ def get_boxscores(seasons, weeks):
             for boxscore in boxscores:
                 print(boxscore)
                 print('\n')
-            response = requests.post(base_url + 'boxscores',
-                                     json=boxscores, verify=VERIFY_REQUESTS).json()
+            response = post(base_url + 'boxscores', json=boxscores).json()
             print(response)
-            sleep(randint(20, 30))
 
 
 # todo
@@ -0,0 +1 @@
+NFL_ODDS_URL = 'https://www.bovada.lv/services/sports/event/v2/events/A/description/football/nfl'
@@ -1,11 +1,148 @@
+import asyncio
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
-from ..util import utc_to_pst
-from .playbyplay import PlayByPlay
-from .util import get_dates_by_season
+from ..aclient import aget_json, acache_forever
+from ..client import get_json, cache_forever
+from ..export import write_game_boxscores
+from ..schema import Field, Schema
+from ..util import utc_to_pst, to_json_safe
+from .constants import NHL_LINESCORE_SCHEDULE_URL, NHL_GAME_FEED_URL
+from .playbyplay import PLAY_SCHEMA, PlayByPlay
+from .util import get_dates_by_kwargs, get_play_stats
+from collections import Counter
 from datetime import datetime
-from time import sleep
+
+
+def get_game_feed(game_id):
+    url = NHL_GAME_FEED_URL.format(game_id=game_id)
+    print(f'Getting game data from {url}')
+    game = get_json(url)
+    # Payloads for final games never change, so they can be cached forever.
+    if game['gameData']['status']['abstractGameState'] == 'Final':
+        cache_forever(url)
+    return game
+
+
+async def aget_game_feed(game_id):
+    url = NHL_GAME_FEED_URL.format(game_id=game_id)
+    print(f'Getting game data from {url}')
+    game = await aget_json(url)
+    if game['gameData']['status']['abstractGameState'] == 'Final':
+        acache_forever(url)
+    return game
+
+
+def get_game_ids(schedule):
+    game_ids = []
+    for date in schedule['dates']:
+        for game_data in date['games']:
+            if game_data['gamePk'] != 2018010110:  # 2018/2019 Koln Haie game
+                game_ids.append(game_data['gamePk'])
+    return game_ids
+
+
+def get_game_ids_by_dates(start_date, end_date):
+    # IDs of the games between two dates ('MM/DD/YYYY' format).
+    url = NHL_LINESCORE_SCHEDULE_URL.format(start_date=start_date, end_date=end_date)
+    print('Getting NHL schedule from ' + url)
+    return get_game_ids(get_json(url))
+
+
+def _get_season(season):
+    # '20192020' -> 2019
+    return int(season[:4])
+
+
+def _get_team_fields(team):
+    # Away and home columns only differ by their prefix.
+    prefix = team.capitalize()
+    fields = [Field(f'_{team}_team_id', f'{prefix}TeamId', 'game', f'gameData.teams.{team}.id', dtype='Int16')]
+    skater_stats = [
+        ('goals', 'Goals', 'goals', 'Int8'),
+        ('pim', 'Pim', 'pim', 'Int16'),
+        ('shots', 'Shots', 'shots', 'Int8'),
+        ('pp_pct', 'PpPct', 'powerPlayPercentage', None),
+        ('pp_goals', 'PpGoals', 'powerPlayGoals', 'Int8'),
+        ('pp_opportunities', 'PpOpportunities', 'powerPlayOpportunities', 'Int8'),
+        ('face_off_win_pct', 'FaceOffWinPct', 'faceOffWinPercentage', None),
+        ('blocked', 'Blocked', 'blocked', 'Int8'),
+        ('takeaways', 'Takeaways', 'takeaways', 'Int8'),
+        ('giveaways', 'Giveaways', 'giveaways', 'Int8'),
+        ('hits', 'Hits', 'hits', 'Int8')
+    ]
+    for attribute, column, key, dtype in skater_stats:
+        fields.append(Field(f'_{team}_{attribute}', f'{prefix}{column}', 'box',
+                            f'teams.{team}.teamStats.teamSkaterStats.{key}', dtype=dtype))
+    return fields
+
+
+PLAYER_BOXSCORE_SCHEMA = Schema([
+    Field('_nhl_player_id', 'NhlPlayerId', 'box', 'person.id', dtype='Int32'),
+    Field('_nhl_game_id', 'NhlGameId', dtype='Int32'),
+    Field('_season', 'Season', dtype='Int16'),
+    Field('_away_team_id', 'AwayTeamId', dtype='Int16'),
+    Field('_home_team_id', 'HomeTeamId', dtype='Int16'),
+    Field('_is_away', 'IsAway', dtype='boolean'),
+    Field('_team_result', 'TeamResult', dtype='category'),
+    Field('_result_note', 'ResultNote', dtype='category'),
+    Field('_overtime', 'Overtime', dtype='boolean'),
+    Field('_shootout', 'Shootout', dtype='boolean'),
+    Field('_skater_time_on_ice', 'SkaterTimeOnIce', 'skater', 'timeOnIce'),
+    Field('_skater_assists', 'SkaterAssists', 'skater', 'assists', dtype='Int8'),
+    Field('_skater_goals', 'SkaterGoals', 'skater', 'goals', dtype='Int8'),
+    Field('_skater_shots', 'SkaterShots', 'skater', 'shots', dtype='Int8'),
+    Field('_skater_hits', 'SkaterHits', 'skater', 'hits', dtype='Int8'),
+    Field('_skater_power_play_goals', 'SkaterPowerPlayGoals', 'skater', 'powerPlayGoals', dtype='Int8'),
+    Field('_skater_power_play_assists', 'SkaterPowerPlayAssists', 'skater', 'powerPlayAssists', dtype='Int8'),
+    Field('_skater_penalty_mins', 'SkaterPenaltyMins', 'skater', 'penaltyMinutes', dtype='Int16', optional=True),
+    Field('_skater_takeaways', 'SkaterTakeaways', 'skater', 'takeaways', dtype='Int8'),
+    Field('_skater_giveaways', 'SkaterGiveaways', 'skater', 'giveaways', dtype='Int8'),
+    Field('_skater_short_handed_goals', 'SkaterShortHandedGoals', 'skater', 'shortHandedGoals', dtype='Int8'),
+    Field('_skater_short_handed_assists', 'SkaterShortHandedAssists', 'skater', 'shortHandedAssists', dtype='Int8'),
+    Field('_skater_blocked', 'SkaterBlocked', 'skater', 'blocked', dtype='Int8'),
+    Field('_skater_plus_minus', 'SkaterPlusMinus', 'skater', 'plusMinus', dtype='Int8'),
+    Field('_skater_even_time_on_ice', 'SkaterEvenTimeOnIce', 'skater', 'evenTimeOnIce'),
+    Field('_skater_power_play_time_on_ice', 'SkaterPowerPlayTimeOnIce', 'skater', 'powerPlayTimeOnIce'),
+    Field('_skater_short_handed_time_on_ice', 'SkaterShortHandedTimeOnIce', 'skater', 'shortHandedTimeOnIce'),
+    Field('_skater_shootout_goals', 'SkaterShootoutGoals', 'play_stats', 'shootout_goals', default=0, dtype='Int8'),
+    Field('_skater_overtime_goals', 'SkaterOvertimeGoals', 'play_stats', 'overtime_goals', default=0, dtype='Int8'),
+    Field('_goalie_time_on_ice', 'GoalieTimeOnIce', 'goalie', 'timeOnIce'),
+    Field('_goalie_assists', 'GoalieAssists', 'goalie', 'assists', dtype='Int8'),
+    Field('_goalie_goals', 'GoalieGoals', 'goalie', 'goals', dtype='Int8'),
+    Field('_goalie_pim', 'GoaliePenaltyMins', 'goalie', 'pim', dtype='Int16'),
+    Field('_goalie_shots_against', 'GoalieShotsAgainst', 'goalie', 'shots', dtype='Int8'),
+    Field('_goalie_saves', 'GoalieSaves', 'goalie', 'saves', dtype='Int8'),
+    Field('_goalie_goals_against', 'GoalieGoalsAgainst', dtype='Int8'),
+    Field('_goalie_power_play_saves', 'GoaliePowerPlaySaves', 'goalie', 'powerPlaySaves', dtype='Int8'),
+    Field('_goalie_short_handed_saves', 'GoalieShortHandedSaves', 'goalie', 'shortHandedSaves', dtype='Int8'),
+    Field('_goalie_even_saves', 'GoalieEvenSaves', 'goalie', 'evenSaves', dtype='Int8'),
+    Field('_goalie_short_handed_shots_against', 'GoalieShortHandedShotsAgainst', 'goalie', 'shortHandedShotsAgainst',
+          dtype='Int8'),
+    Field('_goalie_even_shots_against', 'GoalieEvenShotsAgainst', 'goalie', 'evenShotsAgainst', dtype='Int8'),
+    Field('_goalie_power_play_shots_against', 'GoaliePowerPlayShotsAgainst', 'goalie', 'powerPlayShotsAgainst',
+          dtype='Int8'),
+    Field('_goalie_decision', 'GoalieDecision', 'goalie', 'decision', dtype='category', optional=True),
+    Field('_goalie_save_pct', 'GoalieSavePct', 'goalie', 'savePercentage', dtype='Float64', optional=True),
+    Field('_goalie_power_play_save_pct', 'GoaliePowerPlaySavePct', 'goalie', 'powerPlaySavePercentage',
+          dtype='Float64', optional=True),
+    Field('_goalie_even_strength_save_pct', 'GoalieEvenStrengthSavePct', 'goalie', 'evenStrengthSavePercentage',
+          dtype='Float64', optional=True),
+    Field('_only_goalie', 'OnlyGoalie', dtype='boolean')
+])
+
+GAME_BOXSCORE_SCHEMA = Schema([
+    Field('_nhl_game_id', 'NhlGameId', dtype='Int32'),
+    Field('_season', 'Season', 'game', 'gameData.game.season', _get_season, dtype='Int16'),
+    Field('_game_date_time', 'GameDateTime', dtype='datetime64[ns]'),
+    Field('_game_date', 'GameDate'),
+    Field('_game_time', 'GameTime'),
+    Field('_game_status', 'GameStatus', 'game', 'gameData.status.detailedState', dtype='category')
+] + _get_team_fields('away') + _get_team_fields('home') + [
+    Field('_nhl_venue_id', 'NhlVenueId', 'game', 'gameData.venue.id', dtype='Int32', optional=True),
+    Field('_nhl_venue_name', 'NhlVenueName', 'game', 'gameData.venue.name', dtype='category'),
+    Field('_result_note', 'ResultNote', dtype='category'),
+    Field('_overtime', 'Overtime', dtype='boolean'),
+    Field('_shootout', 'Shootout', dtype='boolean')
+])
 
 
 class PlayerBoxscore:
@@ -23,70 +160,27 @@ class PlayerBoxscore:
     box_json : dict
         Dict that contains the player's boxscore data.
 
-    shootout_goals : dict
-        Dict that contains game shootout data.
+    play_stats : Counter
+        Stats derived from the game's plays for this player (shootout goals, overtime goals).
 
     goalies_recorded : int
         Number of goalies on the player's team that played in the game.
     """
 
-    def __init__(self, game, team, box_json, shootout_goals, goalies_recorded):
-        self._nhl_player_id = None
-        self._nhl_game_id = None
-        self._season = None
-        self._away_team_id = None
-        self._home_team_id = None
-        self._is_away = None
-        self._team_result = None
-        self._result_note = None
-        self._overtime = None
-        self._shootout = None
-        self._skater_time_on_ice = None
-        self._skater_assists = None
-        self._skater_goals = None
-        self._skater_shots = None
-        self._skater_hits = None
-        self._skater_power_play_goals = None
-        self._skater_power_play_assists = None
-        self._skater_penalty_mins = None
-        self._skater_takeaways = None
-        self._skater_giveaways = None
-        self._skater_short_handed_goals = None
-        self._skater_short_handed_assists = None
-        self._skater_blocked = None
-        self._skater_plus_minus = None
-        self._skater_even_time_on_ice = None
-        self._skater_power_play_time_on_ice = None
-        self._skater_short_handed_time_on_ice = None
-        self._skater_shootout_goals = None
-        self._goalie_time_on_ice = None
-        self._goalie_assists = None
-        self._goalie_goals = None
-        self._goalie_pim = None
-        self._goalie_shots_against = None
-        self._goalie_saves = None
-        self._goalie_goals_against = None
-        self._goalie_power_play_saves = None
-        self._goalie_short_handed_saves = None
-        self._goalie_even_saves = None
-        self._goalie_short_handed_shots_against = None
-        self._goalie_even_shots_against = None
-        self._goalie_power_play_shots_against = None
-        self._goalie_decision = None
-        self._goalie_save_pct = None
-        self._goalie_power_play_save_pct = None
-        self._goalie_even_strength_save_pct = None
-        self._only_goalie = None
-
-        self._parse_player_boxscore(game, team, box_json, shootout_goals, goalies_recorded)
-
-    def _parse_player_boxscore(self, game, team, box, shootout_goals, goalies_recorded):
+    __slots__ = PLAYER_BOXSCORE_SCHEMA.attributes
+
+    def __init__(self, game, team, box_json, play_stats, goalies_recorded):
+        PLAYER_BOXSCORE_SCHEMA.reset(self)
+
+        self._parse_player_boxscore(game, team, box_json, play_stats, goalies_recorded)
+
+    def _parse_player_boxscore(self, game, team, box, play_stats, goalies_recorded):
         has_skater_stats = 'skaterStats' in box['stats'] and len(box['stats']['skaterStats']) > 0
         has_goalie_stats = 'goalieStats' in box['stats'] and len(box['stats']['goalieStats']) > 0
         if not has_skater_stats and not has_goalie_stats:
             return
 
-        setattr(self, '_nhl_player_id', box['person']['id'])
+        PLAYER_BOXSCORE_SCHEMA.extract('box', self, box)
         setattr(self, '_nhl_game_id', game._nhl_game_id)
         setattr(self, '_season', game._season)
         setattr(self, '_away_team_id', game._away_team_id)
@@ -98,50 +192,13 @@ class PlayerBoxscore:
         setattr(self, '_shootout', game._shootout)
 
         if has_skater_stats:
-            skater_stats = box['stats']['skaterStats']
-            setattr(self, '_skater_time_on_ice', skater_stats['timeOnIce'])
-            setattr(self, '_skater_assists', skater_stats['assists'])
-            setattr(self, '_skater_goals', skater_stats['goals'])
-            setattr(self, '_skater_shots', skater_stats['shots'])
-            setattr(self, '_skater_hits', skater_stats['hits'])
-            setattr(self, '_skater_power_play_goals', skater_stats['powerPlayGoals'])
-            setattr(self, '_skater_power_play_assists', skater_stats['powerPlayAssists'])
-            if 'penaltyMinutes' in skater_stats:
-                setattr(self, '_skater_penalty_mins', skater_stats['penaltyMinutes'])
-            setattr(self, '_skater_takeaways', skater_stats['takeaways'])
-            setattr(self, '_skater_giveaways', skater_stats['giveaways'])
-            setattr(self, '_skater_short_handed_goals', skater_stats['shortHandedGoals'])
-            setattr(self, '_skater_short_handed_assists', skater_stats['shortHandedAssists'])
-            setattr(self, '_skater_blocked', skater_stats['blocked'])
-            setattr(self, '_skater_plus_minus', skater_stats['plusMinus'])
-            setattr(self, '_skater_even_time_on_ice', skater_stats['evenTimeOnIce'])
-            setattr(self, '_skater_power_play_time_on_ice', skater_stats['powerPlayTimeOnIce'])
-            setattr(self, '_skater_short_handed_time_on_ice', skater_stats['shortHandedTimeOnIce'])
-            setattr(self, '_skater_shootout_goals', self._get_player_shootout_goals(game, box, shootout_goals))
+            PLAYER_BOXSCORE_SCHEMA.extract('skater', self, box['stats']['skaterStats'])
+            PLAYER_BOXSCORE_SCHEMA.extract('play_stats', self, play_stats)
 
         if has_goalie_stats:
             goalie_stats = box['stats']['goalieStats']
-            setattr(self, '_goalie_time_on_ice', goalie_stats['timeOnIce'])
-            setattr(self, '_goalie_assists', goalie_stats['assists'])
-            setattr(self, '_goalie_goals', goalie_stats['goals'])
-            setattr(self, '_goalie_pim', goalie_stats['pim'])
-            setattr(self, '_goalie_shots_against', goalie_stats['shots'])
-            setattr(self, '_goalie_saves', goalie_stats['saves'])
+            PLAYER_BOXSCORE_SCHEMA.extract('goalie', self, goalie_stats)
             setattr(self, '_goalie_goals_against', goalie_stats['shots'] - goalie_stats['saves'])
-            setattr(self, '_goalie_power_play_saves', goalie_stats['powerPlaySaves'])
-            setattr(self, '_goalie_short_handed_saves', goalie_stats['shortHandedSaves'])
-            setattr(self, '_goalie_even_saves', goalie_stats['evenSaves'])
-            setattr(self, '_goalie_short_handed_shots_against', goalie_stats['shortHandedShotsAgainst'])
-            setattr(self, '_goalie_even_shots_against', goalie_stats['evenShotsAgainst'])
-            setattr(self, '_goalie_power_play_shots_against', goalie_stats['powerPlayShotsAgainst'])
-            if 'decision' in goalie_stats:
-                setattr(self, '_goalie_decision', goalie_stats['decision'])
-            if 'savePercentage' in goalie_stats:
-                setattr(self, '_goalie_save_pct', goalie_stats['savePercentage'])
-            if 'powerPlaySavePercentage' in goalie_stats:
-                setattr(self, '_goalie_power_play_save_pct', goalie_stats['powerPlaySavePercentage'])
-            if 'evenStrengthSavePercentage' in goalie_stats:
-                setattr(self, '_goalie_even_strength_save_pct', goalie_stats['evenStrengthSavePercentage'])
             setattr(self, '_only_goalie', goalies_recorded == 1)
 
     def _get_team_result(self, game, team):
@@ -153,73 +210,16 @@ class PlayerBoxscore:
             team_result = 'L'
         return team_result
 
-    def _get_player_shootout_goals(self, game, box, shootout_goals):
-        skater_shootout_goals = 0
-        if game._shootout:
-            for player in shootout_goals:
-                if player['player_id'] == int(box['person']['id']):
-                    # Player had one or more shootout goals
-                    skater_shootout_goals = player['shootout_goals']
-                    break
-        return skater_shootout_goals
+    def _get_fields(self):
+        return PLAYER_BOXSCORE_SCHEMA.get_fields(self)
 
     @property
     def dataframe(self):
-        fields_to_include = {
-            'NhlPlayerId': self._nhl_player_id,
-            'NhlGameId': self._nhl_game_id,
-            'Season': self._season,
-            'AwayTeamId': self._away_team_id,
-            'HomeTeamId': self._home_team_id,
-            'IsAway': self._is_away,
-            'TeamResult': self._team_result,
-            'ResultNote': self._result_note,
-            'Overtime': self._overtime,
-            'Shootout': self._shootout,
-            'SkaterTimeOnIce': self._skater_time_on_ice,
-            'SkaterAssists': self._skater_assists,
-            'SkaterGoals': self._skater_goals,
-            'SkaterShots': self._skater_shots,
-            'SkaterHits': self._skater_hits,
-            'SkaterPowerPlayGoals': self._skater_power_play_goals,
-            'SkaterPowerPlayAssists': self._skater_power_play_assists,
-            'SkaterPenaltyMins': self._skater_penalty_mins,
-            'SkaterTakeaways': self._skater_takeaways,
-            'SkaterGiveaways': self._skater_giveaways,
-            'SkaterShortHandedGoals': self._skater_short_handed_goals,
-            'SkaterShortHandedAssists': self._skater_short_handed_assists,
-            'SkaterBlocked': self._skater_blocked,
-            'SkaterPlusMinus': self._skater_plus_minus,
-            'SkaterEvenTimeOnIce': self._skater_even_time_on_ice,
-            'SkaterPowerPlayTimeOnIce': self._skater_power_play_time_on_ice,
-            'SkaterShortHandedTimeOnIce': self._skater_short_handed_time_on_ice,
-            'SkaterShootoutGoals': self._skater_shootout_goals,
-            'GoalieTimeOnIce': self._goalie_time_on_ice,
-            'GoalieAssists': self._goalie_assists,
-            'GoalieGoals': self._goalie_goals,
-            'GoaliePenaltyMins': self._goalie_pim,
-            'GoalieShotsAgainst': self._goalie_shots_against,
-            'GoalieSaves': self._goalie_saves,
-            'GoalieGoalsAgainst': self._goalie_goals_against,
-            'GoaliePowerPlaySaves': self._goalie_power_play_saves,
-            'GoalieShortHandedSaves': self._goalie_short_handed_saves,
-            'GoalieEvenSaves': self._goalie_even_saves,
-            'GoalieShortHandedShotsAgainst': self._goalie_short_handed_shots_against,
-            'GoalieEvenShotsAgainst': self._goalie_even_shots_against,
-            'GoaliePowerPlayShotsAgainst': self._goalie_power_play_shots_against,
-            'GoalieDecision': self._goalie_decision,
-            'GoalieSavePct': self._goalie_save_pct,
-            'GoaliePowerPlaySavePct': self._goalie_power_play_save_pct,
-            'GoalieEvenStrengthSavePct': self._goalie_even_strength_save_pct,
-            'OnlyGoalie': self._only_goalie,
-        }
-        return pd.DataFrame([fields_to_include], index=None)
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class PlayerBoxscores:
@@ -236,12 +236,15 @@ class PlayerBoxscores:
 
     players_json : list (dict)
         List of dicts that contains the players' boxscore data.
+
+    play_stats : dict
+        Play-derived stats by player ID, from get_play_stats.
     """
 
-    def __init__(self, game, team, players_json):
+    def __init__(self, game, team, players_json, play_stats):
         self._boxscores = []
 
-        self._parse_player_boxscores(game, team, players_json)
+        self._parse_player_boxscores(game, team, players_json, play_stats)
 
     def __repr__(self):
         return self._boxscores
@@ -249,48 +252,21 @@ class PlayerBoxscores:
     def __iter__(self):
         return iter(self.__repr__())
 
-    # todo- move this to util file?
-    def _get_shootout_goals_by_game(self, game_id):
-        shootout_goals = []
-        url = f'https://statsapi.web.nhl.com/api/v1/game/{game_id}/playByPlay'
-        print('Getting play-by-play data for shootout stats from ' + url)
-        pbp = requests.get(url, verify=VERIFY_REQUESTS).json()
-        for play in pbp["allPlays"]:
-            if (play["about"]["periodType"] == 'SHOOTOUT') and 'players' in play and play['result']['event'] == 'Goal':
-                for player in play['players']:
-                    if player['playerType'] == "Scorer":
-                        shooter_id = player["player"]["id"]
-                        index = -1
-                        for i, obj in enumerate(shootout_goals):
-                            if obj['player_id'] == shooter_id:
-                                index = i
-                                break
-                        if index != -1:
-                            # Player already has shootout goal. Incremement goals
-                            shootout_goals[i]['shootout_goals'] += 1
-                        else:
-                            shootout_goals.append(
-                                {'player_id': shooter_id, 'shootout_goals': 1})
-        return shootout_goals
-
-    def _parse_player_boxscores(self, game, team, players_json):
-        shootout_goals = {}  # todo
+    def _parse_player_boxscores(self, game, team, players_json, play_stats):
         goalies_recorded = 0
         for player, stats in players_json['players'].items():
             # Need to get the number of goalies recorded for fantasy point bonus eligibility
             if 'goalieStats' in stats['stats']:
                 goalies_recorded += 1
         for player, stats in players_json['players'].items():
-            boxscore = PlayerBoxscore(game, team, stats, shootout_goals, goalies_recorded)
+            player_play_stats = play_stats.get(stats['person']['id'], Counter())
+            boxscore = PlayerBoxscore(game, team, stats, player_play_stats, goalies_recorded)
             if boxscore._nhl_player_id:  # some players don't have any stats
                 self._boxscores.append(boxscore)
 
     @property
     def dataframes(self):
-        frames = []
-        for boxscore in self.__iter__():
-            frames.append(boxscore.dataframe)
-        return pd.concat(frames)
+        return PLAYER_BOXSCORE_SCHEMA.build_dataframe(self._boxscores)
 
     @property
     def to_dicts(self):
@@ -308,59 +284,30 @@ class GameBoxscore:
     ----------
     game_id : int
         A game ID according to NHL's API.
+
+    game_json : dict
+        The game's already-fetched feed/live payload. Requested if not given.
     """
 
-    def __init__(self, game_id):
-        self._nhl_game_id = None
-        self._season = None
-        self._game_date_time = None
-        self._game_date = None
-        self._game_status = None
-        self._away_team_id = None
-        self._away_pim = None
-        self._away_shots = None
-        self._away_pp_pct = None
-        self._away_pp_goals = None
-        self._away_pp_opportunities = None
-        self._away_face_off_win_pct = None
-        self._away_blocked = None
-        self._away_takeaways = None
-        self._away_giveaways = None
-        self._away_hits = None
-        self._home_team_id = None
-        self._home_pim = None
-        self._home_shots = None
-        self._home_pp_pct = None
-        self._home_pp_goals = None
-        self._home_pp_opportunities = None
-        self._home_face_off_win_pct = None
-        self._home_blocked = None
-        self._home_takeaways = None
-        self._home_giveaways = None
-        self._home_hits = None
-        self._nhl_venue_id = None
-        self._nhl_venue_name = None
-        self._result_note = None
-        self._overtime = None
-        self._shootout = None
+    def __init__(self, game_id, game_json=None):
+        GAME_BOXSCORE_SCHEMA.reset(self)
         self._away_players = None
         self._home_players = None
+        self._play_by_play = None
 
-        self._get_game_boxscore(game_id)
+        self._get_game_boxscore(game_id, game_json)
 
-    def _get_game_boxscore(self, game_id):
+    def _get_game_boxscore(self, game_id, game):
         setattr(self, '_nhl_game_id', game_id)
 
-        url = f'https://statsapi.web.nhl.com/api/v1/game/{game_id}/feed/live'
-        print(f'Getting game data from {url}')
-        game = requests.get(url, verify=VERIFY_REQUESTS).json()
+        if game is None:
+            game = get_game_feed(game_id)
         utc = datetime.strptime(game['gameData']['datetime']['dateTime'], '%Y-%m-%dT%H:%M:%SZ')
         game_dt = utc_to_pst(utc)
-        setattr(self, '_season', int(game['gameData']['game']['season'][:4])),
+        GAME_BOXSCORE_SCHEMA.extract('game', self, game)
         setattr(self, '_game_date_time', game_dt.isoformat())
         setattr(self, '_game_date', game_dt.date().isoformat())
         setattr(self, '_game_time', game_dt.time().isoformat())
-        setattr(self, '_game_status', game['gameData']['status']['detailedState'])
 
         has_overtime = False
         result_note = ''
@@ -374,101 +321,34 @@ class GameBoxscore:
 
         # url = f'https://statsapi.web.nhl.com/api/v1/game/{game_id}/boxscore'
         # print(f'Getting game boxscore data from {url}')
-        # box = requests.get(url, verify=VERIFY_REQUESTS).json()
+        # box = get_json(url)
         box = game['liveData']['boxscore']
-        away_team = box['teams']['away']  # todo
-        away_team_stats = box['teams']['away']['teamStats']['teamSkaterStats']
-        home_team = box['teams']['away']  # todo
-        home_team_stats = box['teams']['home']['teamStats']['teamSkaterStats']
-        setattr(self, '_away_team_id', game['gameData']['teams']['away']['id'])
-        setattr(self, '_away_goals', away_team_stats['goals'])
-        setattr(self, '_away_pim', away_team_stats['pim'])
-        setattr(self, '_away_shots', away_team_stats['shots'])
-        setattr(self, '_away_pp_pct', away_team_stats['powerPlayPercentage'])
-        setattr(self, '_away_pp_goals', away_team_stats['powerPlayGoals'])
-        setattr(self, '_away_pp_opportunities', away_team_stats['powerPlayOpportunities'])
-        setattr(self, '_away_face_off_win_pct', away_team_stats['faceOffWinPercentage'])
-        setattr(self, '_away_blocked', away_team_stats['blocked'])
-        setattr(self, '_away_takeaways', away_team_stats['takeaways'])
-        setattr(self, '_away_giveaways', away_team_stats['giveaways'])
-        setattr(self, '_away_hits', away_team_stats['hits'])
-        setattr(self, '_home_team_id', game['gameData']['teams']['home']['id'])
-        setattr(self, '_home_goals', home_team_stats['goals'])
-        setattr(self, '_home_pim', home_team_stats['pim'])
-        setattr(self, '_home_shots', home_team_stats['shots'])
-        setattr(self, '_home_pp_pct', home_team_stats['powerPlayPercentage'])
-        setattr(self, '_home_pp_goals', home_team_stats['powerPlayGoals'])
-        setattr(self, '_home_pp_opportunities', home_team_stats['powerPlayOpportunities'])
-        setattr(self, '_home_face_off_win_pct', home_team_stats['faceOffWinPercentage'])
-        setattr(self, '_home_blocked', home_team_stats['blocked'])
-        setattr(self, '_home_takeaways', home_team_stats['takeaways'])
-        setattr(self, '_home_giveaways', home_team_stats['giveaways'])
-        setattr(self, '_home_hits', home_team_stats['hits'])
-        setattr(self, '_nhl_venue_id', None if 'id' not in game['gameData']
-                ['venue'] else game['gameData']['venue']['id'])
-        setattr(self, '_nhl_venue_name', game['gameData']['venue']['name'])
+        GAME_BOXSCORE_SCHEMA.extract('box', self, box)
         setattr(self, '_result_note', result_note)
         setattr(self, '_overtime', has_overtime)
         setattr(self, '_shootout', has_shootout)
 
         plays = game['liveData']['plays']['allPlays']
-        # print(plays)
+        play_stats = get_play_stats(plays)
 
-        setattr(self, '_away_players', PlayerBoxscores(self, 'away', box['teams']['away']))
-        setattr(self, '_home_players', PlayerBoxscores(self, 'home', box['teams']['home']))
+        setattr(self, '_away_players', PlayerBoxscores(self, 'away', box['teams']['away'], play_stats))
+        setattr(self, '_home_players', PlayerBoxscores(self, 'home', box['teams']['home'], play_stats))
         setattr(self, '_play_by_play', PlayByPlay(game_id, plays))
 
+    def _get_fields(self):
+        return GAME_BOXSCORE_SCHEMA.get_fields(self)
+
     @property
     def dataframe(self):
-        fields_to_include = {
-            'NhlGameId': self._nhl_game_id,
-            'Season': self._season,
-            'GameDateTime': self._game_date_time,
-            'GameDate': self._game_date,
-            'GameTime': self._game_time,
-            'GameStatus': self._game_status,
-            'AwayTeamId': self._away_team_id,
-            'AwayGoals': self._away_goals,
-            'AwayPim': self._away_pim,
-            'AwayShots': self._away_shots,
-            'AwayPpPct': self._away_pp_pct,
-            'AwayPpGoals': self._away_pp_goals,
-            'AwayPpOpportunities': self._away_pp_opportunities,
-            'AwayFaceOffWinPct': self._away_face_off_win_pct,
-            'AwayBlocked': self._away_blocked,
-            'AwayTakeaways': self._away_takeaways,
-            'AwayGiveaways': self._away_giveaways,
-            'AwayHits': self._away_hits,
-            'HomeTeamId': self._home_team_id,
-            'HomeGoals': self._home_goals,
-            'HomePim': self._home_pim,
-            'HomeShots': self._home_shots,
-            'HomePpPct': self._home_pp_pct,
-            'HomePpGoals': self._home_pp_goals,
-            'HomePpOpportunities': self._home_pp_opportunities,
-            'HomeFaceOffWinPct': self._home_face_off_win_pct,
-            'HomeBlocked': self._home_blocked,
-            'HomeTakeaways': self._home_takeaways,
-            'HomeGiveaways': self._home_giveaways,
-            'HomeHits': self._home_hits,
-            'NhlVenueId': self._nhl_venue_id,
-            'NhlVenueName': self._nhl_venue_name,
-            'ResultNote': self._result_note,
-            'Overtime': self._overtime,
-            'Shootout': self._shootout
-        }
-        return pd.DataFrame([fields_to_include], index=[self._nhl_game_id])
+        return pd.DataFrame([self._get_fields()], index=[self._nhl_game_id])
 
     @property
     def player_dataframes(self):
-        away_players = self._away_players.dataframes
-        home_players = self._home_players.dataframes
-        return pd.concat([away_players, home_players])
+        return PLAYER_BOXSCORE_SCHEMA.build_dataframe(self._away_players._boxscores + self._home_players._boxscores)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
+        dic = to_json_safe(self._get_fields())
         dic['AwayPlayers'] = self._away_players.to_dicts
         dic['HomePlayers'] = self._home_players.to_dicts
         dic['PlayByPlay'] = self._play_by_play.to_dicts
@@ -477,7 +357,7 @@ class GameBoxscore:
 
 class GameBoxscores:
     """
-    Game stats from multiple MLB games.
+    Game stats from multiple NHL games.
 
     Parameters (kwargs)
     ----------
@@ -490,23 +370,57 @@ class GameBoxscores:
 
     date : string
         Date to get game boxscores from ('MM/DD/YYYY' format).
+
+    games : list (dicts)
+        Already-fetched feed/live payloads to parse instead of requesting them.
+
+    boxscores : list (GameBoxscore)
+        Already-parsed games to collect.
     """
 
     def __init__(self, **kwargs):
-        self._boxscores = []
+        self._boxscores = list(self.iter(**kwargs))
+
+    @classmethod
+    def iter(cls, **kwargs):
+        """
+        Yields each game's GameBoxscore as soon as it has been fetched and
+        parsed, in schedule order, taking the same kwargs as GameBoxscores.
+        Nothing is kept once a game is yielded, so a season can be streamed
+        in bounded memory.
+        """
+        if 'boxscores' in kwargs:
+            yield from kwargs['boxscores']
+            return
 
-        if 'season' in kwargs:
-            start_date, end_date = get_dates_by_season(kwargs['season'])
+        if 'games' in kwargs:
+            for game in kwargs['games']:
+                yield GameBoxscore(game['gamePk'], game)
             return
-        elif 'range' in kwargs:
-            start_date, end_date = kwargs['range'][0], kwargs['range'][1]
-        elif 'date' in kwargs:
-            start_date, end_date = kwargs['date'], kwargs['date']
-        else:
+
+        start_date, end_date = get_dates_by_kwargs(kwargs)
+        if start_date is None:
             print('Invalid GameBoxscores param(s)')
             return
 
-        self._get_game_boxscores(start_date, end_date)
+        for game_id in get_game_ids_by_dates(start_date, end_date):
+            yield GameBoxscore(game_id)
+
+    @classmethod
+    async def afetch(cls, **kwargs):
+        """
+        Awaitable version of GameBoxscores(**kwargs) that fetches with the asyncio
+        client. Every game's feed is requested at once; the client's concurrency
+        cap and per-host rate limit decide how many are actually in flight.
+        """
+        start_date, end_date = get_dates_by_kwargs(kwargs)
+        if start_date is None:
+            return cls()
+        url = NHL_LINESCORE_SCHEDULE_URL.format(start_date=start_date, end_date=end_date)
+        print('Getting NHL schedule from ' + url)
+        game_ids = get_game_ids(await aget_json(url))
+        games = await asyncio.gather(*[aget_game_feed(game_id) for game_id in game_ids])
+        return cls(games=games)
 
     def __repr__(self):
         return self._boxscores
@@ -514,40 +428,34 @@ class GameBoxscores:
     def __iter__(self):
         return iter(self.__repr__())
 
-    def _get_game_boxscores(self, start_date, end_date):
-        url = f'https://statsapi.web.nhl.com/api/v1/schedule?startDate={start_date}&endDate={end_date}&expand=schedule.linescore'
-        print('Getting NHL schedule from ' + url)
-        games = requests.get(url, verify=VERIFY_REQUESTS).json()
-        for date in games['dates']:
-            for game_data in date['games']:
-                if game_data['gamePk'] != 2018010110:  # 2018/2019 Koln Haie game
-                    boxscore = GameBoxscore(game_data['gamePk'])
-                    self._boxscores.append(boxscore)
-                    sleep(5)
-
     @property
     def dataframes(self):
-        frames = []
-        for boxscore in self.__iter__():
-            frames.append(boxscore.dataframe)
-        return pd.concat(frames)
+        return GAME_BOXSCORE_SCHEMA.build_dataframe(self._boxscores, [boxscore._nhl_game_id for boxscore in self])
 
     @property
     def player_dataframes(self):
-        frames = []
+        # One frame for every player of every game, rather than a concat of per-game frames.
+        records = []
         for game in self._boxscores:
-            away_players = game._away_players.dataframes
-            home_players = game._home_players.dataframes
-            frames.append(pd.concat([away_players, home_players]))
-        return pd.concat(frames)
+            records.extend(game._away_players)
+            records.extend(game._home_players)
+        return PLAYER_BOXSCORE_SCHEMA.build_dataframe(records)
 
     @property
     def pbp_dataframes(self):
-        frames = []
+        records = []
         for game in self._boxscores:
-            pbp = game._play_by_play.dataframes
-            frames.append(pbp)
-        return pd.concat(frames)
+            records.extend(game._play_by_play)
+        return PLAY_SCHEMA.build_dataframe(records)
+
+    def to_parquet(self, path):
+        """
+        Appends the games, player boxscores and plays to the Parquet datasets
+        under path/nhl/, partitioned by season and date. Read them back with
+        export.read_game_boxscores(path, 'nhl', 'player_boxscores', seasons=[...]).
+        """
+        write_game_boxscores(path, 'nhl', self._boxscores, GAME_BOXSCORE_SCHEMA, PLAYER_BOXSCORE_SCHEMA,
+                             PLAY_SCHEMA, 'NhlGameId')
 
     @property
     def to_dicts(self):
@@ -7,3 +7,11 @@ FP_COL_INDEX = 2
 SALARY_COL_INDEX = 3
 TEAM_COL_INDEX = 4
 OPP_COL_INDEX = 5
+
+NHL_SCHEDULE_URL = 'https://statsapi.web.nhl.com/api/v1/schedule?startDate={start_date}&endDate={end_date}&sportId=1'
+NHL_LINESCORE_SCHEDULE_URL = ('https://statsapi.web.nhl.com/api/v1/schedule?startDate={start_date}&endDate={end_date}'
+                              '&expand=schedule.linescore')
+NHL_GAME_FEED_URL = 'https://statsapi.web.nhl.com/api/v1/game/{game_id}/feed/live'
+NHL_TEAMS_URL = 'https://statsapi.web.nhl.com/api/v1/teams?sportId=1'
+NHL_ROSTERS_URL = 'https://statsapi.web.nhl.com/api/v1/teams?expand=team.roster'
+NHL_ODDS_URL = 'https://www.bovada.lv/services/sports/event/v2/events/A/description/hockey/nhl'
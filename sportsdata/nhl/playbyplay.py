@@ -1,11 +1,28 @@
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
-from time import sleep
+from ..schema import Field, Schema
+from ..util import to_json_safe
 
 # TODO- change this from nhl to mlb
 
 
+PLAY_SCHEMA = Schema([
+    Field('_nhl_game_id', 'NhlGameId', dtype='Int32'),
+    Field('_nhl_player_1_id', 'NhlPlayer1Id', dtype='Int32'),
+    Field('_nhl_player_1_type', 'NhlPlayer1Type', dtype='category'),
+    Field('_nhl_player_2_id', 'NhlPlayer2Id', dtype='Int32'),
+    Field('_nhl_player_2_type', 'NhlPlayer2Type', dtype='category'),
+    Field('_event', 'Event', 'play', 'result.event', dtype='category'),
+    Field('_description', 'Description', 'play', 'result.description'),
+    Field('_period', 'Period', 'play', 'about.period', dtype='Int8'),
+    Field('_period_type', 'PeriodType', 'play', 'about.periodType', dtype='category'),
+    Field('_period_time', 'PeriodTime', 'play', 'about.periodTime'),
+    Field('_period_time_remaining', 'PeriodTimeRemaining', 'play', 'about.periodTimeRemaining'),
+    Field('_play_date_time', 'PlayDateTime', 'play', 'about.dateTime', dtype='datetime64[ns, UTC]'),
+    Field('_away_goals', 'AwayGoals', 'play', 'about.goals.away', dtype='Int8'),
+    Field('_home_goals', 'HomeGoals', 'play', 'about.goals.home', dtype='Int8')
+])
+
+
 class Play:
     """
     Represents a single play
@@ -19,21 +36,10 @@ class Play:
         Dict that contains play information.
     """
 
+    __slots__ = PLAY_SCHEMA.attributes
+
     def __init__(self, game_id, play_json):
-        self._nhl_game_id = None
-        self._nhl_player_1_id = None
-        self._nhl_player_1_type = None
-        self._nhl_player_2_id = None
-        self._nhl_player_2_type = None
-        self._event = None
-        self._description = None
-        self._period = None
-        self._period_type = None
-        self._period_time = None
-        self._period_time_remaining = None
-        self._play_date_time = None
-        self._away_goals = None
-        self._home_goals = None
+        PLAY_SCHEMA.reset(self)
 
         setattr(self, '_nhl_game_id', game_id)
         self._parse_play(play_json)
@@ -46,41 +52,18 @@ class Play:
             if len(players) > 1:
                 setattr(self, '_nhl_player_2_id', players[1]['player']['id'])
                 setattr(self, '_nhl_player_2_type', players[1]['playerType'])
-        setattr(self, '_event', play['result']['event'])
-        setattr(self, '_description', play['result']['description'])
-        setattr(self, '_period', play['about']['period'])
-        setattr(self, '_period_type', play['about']['periodType'])
-        setattr(self, '_period_time', play['about']['periodTime'])
-        setattr(self, '_period_time_remaining', play['about']['periodTimeRemaining'])
-        setattr(self, '_play_date_time', play['about']['dateTime'])
-        setattr(self, '_away_goals', play['about']['goals']['away'])
-        setattr(self, '_home_goals', play['about']['goals']['away'])
+        PLAY_SCHEMA.extract('play', self, play)
+
+    def _get_fields(self):
+        return PLAY_SCHEMA.get_fields(self)
 
     @property
     def dataframe(self):
-        fields_to_include = {
-            'NhlGameId': self._nhl_game_id,
-            'NhlPlayer1Id': self._nhl_player_1_id,
-            'NhlPlayer1Type': self._nhl_player_1_type,
-            'NhlPlayer2Id': self._nhl_player_2_id,
-            'NhlPlayer2Type': self._nhl_player_2_type,
-            'Event': self._event,
-            'Description': self._description,
-            'Period': self._period,
-            'PeriodType': self._period_type,
-            'PeriodTime': self._period_time,
-            'PeriodTimeRemaining': self._period_time_remaining,
-            'PlayDateTime': self._play_date_time,
-            'AwayGoals': self._away_goals,
-            'HomeGoals': self._home_goals
-        }
-        return pd.DataFrame([fields_to_include], index=None)
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class PlayByPlay:
@@ -114,10 +97,7 @@ class PlayByPlay:
 
     @property
     def dataframes(self):
-        frames = []
-        for play in self.__iter__():
-            frames.append(play.dataframe)
-        return pd.concat(frames)
+        return PLAY_SCHEMA.build_dataframe(self._plays)
 
     @property
     def to_dicts(self):
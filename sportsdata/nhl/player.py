@@ -1,6 +1,8 @@
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
+from ..aclient import aget_json
+from ..client import get_json
+from ..util import build_dataframe, to_json_safe
+from .constants import NHL_ROSTERS_URL
 
 
 class Player:
@@ -43,9 +45,8 @@ class Player:
         setattr(self, '_position', player['position']['abbreviation'])
         #setattr(self, '_debut_date', player['mlbDebutDate'])
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'NhlPlayerId': self._nhl_player_id,
             'FullName': self._full_name,
             # 'FirstName': self._first_name,
@@ -57,13 +58,14 @@ class Player:
             'Position': self._position,
             # 'DebutDate': self._debut_date
         }
-        return pd.DataFrame([fields_to_include], index=[self._nhl_player_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._nhl_player_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Players:
@@ -72,12 +74,24 @@ class Players:
 
     Parameters
     ----------
-    None
+    teams_json : dict
+        An already-fetched teams/rosters payload to parse instead of requesting one.
     """
-    def __init__(self):
+    def __init__(self, teams_json=None):
         self._players = []
 
-        self._get_players()
+        if teams_json is None:
+            self._get_players()
+        else:
+            self._parse_players(teams_json)
+
+    @classmethod
+    async def afetch(cls):
+        """
+        Awaitable version of Players() that fetches with the asyncio client.
+        """
+        print('Getting games from ' + NHL_ROSTERS_URL)
+        return cls(await aget_json(NHL_ROSTERS_URL))
 
     def __repr__(self):
         return self._players
@@ -87,9 +101,10 @@ class Players:
 
     def _get_players(self):
         # TODO- refer to https://github.com/dword4/nhlapi#teams
-        url = f'https://statsapi.web.nhl.com/api/v1/teams?expand=team.roster'
-        print('Getting games from ' + url)
-        teams = requests.get(url, verify=VERIFY_REQUESTS).json()
+        print('Getting games from ' + NHL_ROSTERS_URL)
+        self._parse_players(get_json(NHL_ROSTERS_URL))
+
+    def _parse_players(self, teams):
         for team in teams['teams']:
             nhl_team_id = team['id']
             for person_json in team['roster']['roster']:
@@ -98,10 +113,8 @@ class Players:
 
     @property
     def dataframes(self):
-        frames = []
-        for player in self.__iter__():
-            frames.append(player.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([player._get_fields() for player in self],
+                               [player._nhl_player_id for player in self])
 
     @property
     def to_dicts(self):
@@ -1,7 +1,9 @@
-import mlb.util
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
+from ..aclient import aget_json
+from ..client import get_json
+from ..util import build_dataframe, to_json_safe
+from .constants import NHL_SCHEDULE_URL
+from .util import get_dates_by_kwargs
 from datetime import datetime
 from dateutil import tz
 
@@ -49,9 +51,8 @@ class Game:
         setattr(self, '_nhl_venue_id', None if 'id' not in game['venue'] else game['venue']['id'])
         setattr(self, '_nhl_venue_name', game['venue']['name'])
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'NhlGameId': self._nhl_game_id,
             'Season': self._season,
             'GameDateTime': self._game_date_time,
@@ -62,13 +63,14 @@ class Game:
             'NhlVenueId': self._nhl_venue_id,
             'NhlVenueName': self._nhl_venue_name
         }
-        return pd.DataFrame([fields_to_include], index=[self._nhl_game_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._nhl_game_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Schedule:
@@ -84,25 +86,35 @@ class Schedule:
         The requested date range to pull stats from.
     date : string 
         The requested date to pull stats from.
+    schedule_json : dict
+        An already-fetched schedule payload to parse instead of requesting one.
     """
     def __init__(self, **kwargs):
         self._games = []
 
-        if 'season' in kwargs:
-            season = kwargs['season']
-            start_date, end_date = mlb.util.get_dates_by_season(season)
-        elif 'range' in kwargs:
-            start_date = kwargs['range'][0]
-            end_date = kwargs['range'][1]
-        elif 'date' in kwargs:
-            start_date = kwargs['date']
-            end_date = kwargs['date']
-        else:
+        if 'schedule_json' in kwargs:
+            self._parse_games(kwargs['schedule_json'])
+            return
+
+        start_date, end_date = get_dates_by_kwargs(kwargs)
+        if start_date is None:
             print('Invalid Schedule param(s)')
             return
 
         self._get_games(start_date, end_date)
 
+    @classmethod
+    async def afetch(cls, **kwargs):
+        """
+        Awaitable version of Schedule(**kwargs) that fetches with the asyncio client.
+        """
+        start_date, end_date = get_dates_by_kwargs(kwargs)
+        if start_date is None:
+            return cls()
+        url = NHL_SCHEDULE_URL.format(start_date=start_date, end_date=end_date)
+        print('Getting schedule from ' + url)
+        return cls(schedule_json=await aget_json(url))
+
     def __repr__(self):
         return self._games
 
@@ -110,9 +122,11 @@ class Schedule:
         return iter(self.__repr__())
 
     def _get_games(self, start_date, end_date):
-        url = f'https://statsapi.web.nhl.com/api/v1/schedule?startDate={start_date}&endDate={end_date}&sportId=1'
+        url = NHL_SCHEDULE_URL.format(start_date=start_date, end_date=end_date)
         print('Getting schedule from ' + url)
-        games = requests.get(url, verify=VERIFY_REQUESTS).json()
+        self._parse_games(get_json(url))
+
+    def _parse_games(self, games):
         for date in games['dates']:
             for game_data in date['games']:
                 #TODO
@@ -126,10 +140,8 @@ class Schedule:
 
     @property
     def dataframes(self):
-        frames = []
-        for game in self.__iter__():
-            frames.append(game.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([game._get_fields() for game in self],
+                               [game._nhl_game_id for game in self])
 
     @property
     def to_dicts(self):
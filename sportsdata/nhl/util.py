@@ -1,5 +1,6 @@
 import pandas as pd
 from .constants import NHL_SEASONS
+from collections import Counter, defaultdict
 
 
 def get_dates_by_season(season):
@@ -11,6 +12,37 @@ def get_dates_by_season(season):
     return start_date, end_date
 
 
+def get_dates_by_kwargs(kwargs):
+    # (start_date, end_date) from the season/range/date kwargs the collection classes
+    # take, or (None, None) if none were given.
+    if 'season' in kwargs:
+        return get_dates_by_season(kwargs['season'])
+    elif 'range' in kwargs:
+        return kwargs['range'][0], kwargs['range'][1]
+    elif 'date' in kwargs:
+        return kwargs['date'], kwargs['date']
+    return None, None
+
+
+def get_play_stats(plays):
+    # Play-derived per-player stats (shootout goals, overtime goals), tallied in one
+    # pass over the game's play list. Returns {player_id: Counter}.
+    play_stats = defaultdict(Counter)
+    for play in plays:
+        if play['result']['event'] != 'Goal' or 'players' not in play:
+            continue
+        period_type = play['about']['periodType']
+        for player in play['players']:
+            if player['playerType'] != 'Scorer':
+                continue
+            player_id = player['player']['id']
+            if period_type == 'SHOOTOUT':
+                play_stats[player_id]['shootout_goals'] += 1
+            elif period_type == 'OVERTIME':
+                play_stats[player_id]['overtime_goals'] += 1
+    return play_stats
+
+
 def join_dataframes(dataframes, cols, d):
     # Join all the dataframes from the same date to get one row per date.
     # Left dataframe cannot have empty columns.
@@ -0,0 +1,175 @@
+import pandas as pd
+from datetime import datetime
+
+GAME_LINES = 'Game Lines'
+MONEYLINE = 'Moneyline'
+SPREADS = ('Point Spread', 'Puck Line', 'Runline')
+TOTAL = 'Total'
+
+MARKET_COLUMNS = ['EventId', 'EventDescription', 'EventStartTime', 'Group', 'Market', 'Period', 'OutcomeType',
+                  'Outcome', 'OddsAmerican', 'OddsDecimal', 'Handicap']
+
+
+class EventOdds:
+    """
+    Every market of a Bovada event (Game Lines, Alternative Lines, Score
+    Props, player props, etc.), indexed by (group, market, period, outcome
+    type), e.g. ('Game Lines', 'Moneyline', 'Match', 'H').
+
+    The markets are indexed by (group, market, period) in a single pass over
+    displayGroups -> markets. A market's outcomes are grouped by type the
+    first time it is looked up, so an event with hundreds of prop markets
+    costs little more than its game lines. Lookups are dict hits instead of
+    nested scans, and the outcomes are Bovada's own dicts, so nothing is
+    copied.
+
+    Parameters
+    ----------
+    event : dict
+        Dict that contains the betting event data.
+    """
+
+    def __init__(self, event):
+        self._event_id = event.get('id')
+        self._event_description = event['description']
+        self._event_start_time = datetime.fromtimestamp(event['startTime'] / 1000)
+        self._markets = {}
+        self._outcomes = {}
+
+        self._index_markets(event)
+
+    def _index_markets(self, event):
+        markets = self._markets
+        for display_group in event.get('displayGroups', []):
+            group = display_group['description']
+            for market in display_group.get('markets', []):
+                markets.setdefault((group, market['description'], market['period']['description']), market)
+
+    def _get_market_outcomes(self, key):
+        # {outcome type: outcomes} of a market, grouped on first use.
+        outcomes = self._outcomes.get(key)
+        if outcomes is None:
+            outcomes = {}
+            market = self._markets.get(key)
+            if market is not None:
+                for outcome in market.get('outcomes', []):
+                    outcomes.setdefault(outcome.get('type'), []).append(outcome)
+            self._outcomes[key] = outcomes
+        return outcomes
+
+    @property
+    def event_id(self):
+        return self._event_id
+
+    @property
+    def event_description(self):
+        return self._event_description
+
+    @property
+    def event_start_time(self):
+        return self._event_start_time
+
+    @property
+    def markets(self):
+        """
+        (group, market, period) of every market, in the payload's order.
+        """
+        return list(self._markets)
+
+    def get_outcomes(self, group, market, period, outcome_type):
+        """
+        Outcomes of a type in a market ('A'/'H' for away/home, 'O'/'U' for
+        over/under). Props can have several outcomes of one type.
+        """
+        return self._get_market_outcomes((group, market, period)).get(outcome_type, [])
+
+    def get_outcome(self, group, market, period, outcome_type):
+        outcomes = self._get_market_outcomes((group, market, period)).get(outcome_type)
+        return outcomes[0] if outcomes else None
+
+    def _get_rows(self):
+        rows = []
+        for (group, market, period), market_json in self._markets.items():
+            for outcome in market_json.get('outcomes', []):
+                price = outcome.get('price', {})
+                rows.append((self._event_id, self._event_description, self._event_start_time, group, market,
+                             period, outcome.get('type'), outcome.get('description'), price.get('american'),
+                             price.get('decimal'), price.get('handicap')))
+        return rows
+
+    @property
+    def dataframe(self):
+        """
+        One row per outcome of every market (MARKET_COLUMNS).
+        """
+        return pd.DataFrame(self._get_rows(), columns=MARKET_COLUMNS)
+
+
+def set_game_lines(record, odds, period='Match', sides=('away', 'home'), team_name='team_name'):
+    """
+    Sets a GameOdds' game lines from the event's EventOdds: the A and H
+    outcomes' _{side}_team_name, _{side}_moneyline_odds_american,
+    _{side}_moneyline_odds_decimal and _{side}_handicap (point spread, puck
+    line or runline), and _over_under.
+
+    Parameters
+    ----------
+    record : object
+        GameOdds (or MatchOdds) to set the attributes on.
+
+    odds : EventOdds
+        The event's odds.
+
+    period : string
+        Period of the full-game markets, e.g. 'Match' or 'Game'.
+
+    sides : tuple (string)
+        Attribute prefixes of the A and H outcomes, e.g. ('team1', 'team2').
+
+    team_name : string
+        Suffix of the team name attributes, e.g. 'name' for _team1_name.
+    """
+    for side, outcome_type in zip(sides, ('A', 'H')):
+        moneyline = odds.get_outcome(GAME_LINES, MONEYLINE, period, outcome_type)
+        if moneyline is not None:
+            setattr(record, f'_{side}_{team_name}', moneyline['description'])
+            setattr(record, f'_{side}_moneyline_odds_american', moneyline['price'].get('american'))
+            setattr(record, f'_{side}_moneyline_odds_decimal', moneyline['price'].get('decimal'))
+        for market in SPREADS:
+            spread = odds.get_outcome(GAME_LINES, market, period, outcome_type)
+            if spread is not None:
+                setattr(record, f'_{side}_handicap', spread['price'].get('handicap'))
+                break
+    total = odds.get_outcome(GAME_LINES, TOTAL, period, 'O')
+    if total is not None:
+        setattr(record, '_over_under', total['price'].get('handicap'))
+
+
+def get_game_events(odds_json, upcoming_only=False, all_items=False):
+    """
+    Game events of a Bovada payload, skipping season-long bets (i.e.
+    Atlantic Division - Odds to Win) and, with upcoming_only, games that
+    have started. Only the first item, the league's own events, is read
+    unless all_items is set (e.g. for the CSGO items of the esports payload).
+    """
+    now = datetime.now()
+    events = []
+    for item in odds_json if all_items else odds_json[:1]:
+        for event in item['events']:
+            if event['type'] != 'GAMEEVENT':
+                continue
+            if upcoming_only and datetime.fromtimestamp(event['startTime'] / 1000) < now:
+                continue
+            events.append(event)
+    return events
+
+
+def build_market_dataframe(events_odds):
+    """
+    Every market of several events (EventOdds) in one DataFrame, one row per
+    outcome.
+    """
+    rows = []
+    for odds in events_odds:
+        rows.extend(odds._get_rows())
+    return pd.DataFrame(rows, columns=MARKET_COLUMNS)
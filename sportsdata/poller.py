@@ -0,0 +1,381 @@
+import json
+import numpy as np
+import os
+from .client import get_client
+from .csgo.constants import CSGO_ODDS_URL
+from .csgo.odds import get_csgo_items
+from .constants import ODDS_HISTORY_PATH, ODDS_POLL_INTERVAL, ODDS_FLUSH_INTERVAL
+from .mlb.constants import MLB_ODDS_URL
+from .nba.constants import NBA_ODDS_URL
+from .nfl.constants import NFL_ODDS_URL
+from .nhl.constants import NHL_ODDS_URL
+from .odds import GAME_LINES, MONEYLINE, SPREADS, TOTAL, get_game_events
+from .xfl.constants import XFL_ODDS_URL
+from datetime import datetime, timezone
+from time import monotonic, sleep, time
+from uuid import uuid4
+
+ODDS_URLS = {
+    'nfl': NFL_ODDS_URL,
+    'mlb': MLB_ODDS_URL,
+    'nba': NBA_ODDS_URL,
+    'nhl': NHL_ODDS_URL,
+    'xfl': XFL_ODDS_URL,
+    'csgo': CSGO_ODDS_URL
+}
+
+# Sports whose odds url has other items too, and the function that picks theirs.
+ODDS_ITEMS = {
+    'csgo': get_csgo_items
+}
+
+# Game Lines markets whose prices are tracked.
+LINE_MARKETS = (MONEYLINE, TOTAL) + SPREADS
+
+# Tables under the poller's path, each partitioned by sport and date:
+# path/prices/sport=mlb/date=2020-07-24/part-*.parquet.
+PRICES = 'prices'
+OUTCOMES = 'outcomes'
+PARTITION_FILENAME = 'part-0.parquet'
+
+
+def _get_prices_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ('Timestamp', pa.timestamp('ms', tz='UTC')),
+        ('EventId', pa.int64()),
+        ('OutcomeId', pa.int64()),
+        ('OddsAmerican', pa.int32()),
+        ('OddsDecimal', pa.float64()),
+        ('Handicap', pa.float32())
+    ])
+
+
+def _get_outcomes_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ('OutcomeId', pa.int64()),
+        ('EventId', pa.int64()),
+        ('EventDescription', pa.string()),
+        ('EventStartTime', pa.timestamp('ms', tz='UTC')),
+        ('Market', pa.string()),
+        ('Period', pa.string()),
+        ('OutcomeType', pa.string()),
+        ('Outcome', pa.string()),
+        ('FirstSeen', pa.timestamp('ms', tz='UTC'))
+    ])
+
+
+class OddsPoller:
+    """
+    Polls every sport's Bovada odds on a schedule and records line movement:
+    the moneyline, spread (point spread, puck line or runline) and total
+    prices of every period, including games that have started.
+
+    Each poll is compared with the previous one, and only the outcomes whose
+    price or handicap changed are kept, as rows of (Timestamp, EventId,
+    OutcomeId, OddsAmerican, OddsDecimal, Handicap). An outcome that leaves
+    the board gets a row with null prices. The first poll records every
+    price, so each run of the poller starts from a full snapshot.
+
+    - A payload that is byte-for-byte the same as the sport's previous one
+      is not parsed at all, and payloads are parsed with orjson when it is
+      installed.
+    - Only the Game Lines markets are walked, not the props.
+    - Changes are buffered and written every flush_interval seconds as
+      Parquet, to path/prices (the time series) and path/outcomes (the
+      event, market, period and name of each outcome, written once), both
+      partitioned by sport and UTC date. The part files of a day are
+      compacted into one file, sorted by outcome and time, once the day is
+      over.
+
+    Requests go through the shared client, so they are rate limited and
+    retried, but never served from the response cache. A sport whose
+    request fails, or whose payload cannot be parsed (e.g. an HTML
+    maintenance page or an event without an id), keeps its previous prices
+    until the next poll.
+
+        OddsPoller('odds').run()
+
+    Parameters
+    ----------
+    path : string
+        Directory of the odds history.
+
+    sports : list (strings)
+        Sports to poll ('nfl', 'mlb', 'nba', 'nhl', 'xfl', 'csgo'). None
+        polls all of them.
+
+    interval : float
+        Seconds between the start of two polls.
+
+    flush_interval : float
+        Seconds between writes of the buffered changes.
+    """
+
+    def __init__(self, path=ODDS_HISTORY_PATH, sports=None, interval=ODDS_POLL_INTERVAL,
+                 flush_interval=ODDS_FLUSH_INTERVAL):
+        self._path = path
+        self._sports = list(ODDS_URLS) if sports is None else sports
+        self._interval = interval
+        self._flush_interval = flush_interval
+        self._loads = _get_decoder()
+        self._contents = {}
+        self._prices = {sport: {} for sport in self._sports}
+        self._price_rows = {sport: [] for sport in self._sports}
+        self._outcome_rows = {sport: [] for sport in self._sports}
+        self._dates = set()
+        self._flushed_at = monotonic()
+
+        for sport in self._sports:
+            if sport not in ODDS_URLS:
+                raise ValueError(f'No odds URL for sport {sport}.')
+
+    def run(self, polls=None):
+        """
+        Polls until interrupted (or polls times), then writes what is
+        buffered.
+        """
+        count = 0
+        try:
+            while polls is None or count < polls:
+                started = monotonic()
+                self.poll()
+                count += 1
+                if monotonic() - self._flushed_at >= self._flush_interval:
+                    self.flush()
+                if polls is None or count < polls:
+                    sleep(max(0, self._interval - (monotonic() - started)))
+        except KeyboardInterrupt:
+            print('Stopping odds poller.')
+        finally:
+            self.flush()
+
+    def poll(self):
+        """
+        Fetches every sport once and buffers the prices that changed. Returns
+        the number of changed prices.
+        """
+        changes = 0
+        for sport in self._sports:
+            try:
+                content = get_client().request('GET', ODDS_URLS[sport]).content
+                if content == self._contents.get(sport):
+                    continue
+                items = self._loads(content)
+                if sport in ODDS_ITEMS:
+                    items = ODDS_ITEMS[sport](items)
+                events = get_game_events(items, all_items=sport in ODDS_ITEMS)
+                changes += self._update(sport, events, int(time() * 1000))
+            except Exception as e:
+                print(f'Error getting {sport.upper()} odds: {e}')
+                continue
+            # Only remembered once parsed, so a bad payload is not skipped as unchanged if it comes again.
+            self._contents[sport] = content
+        return changes
+
+    def _update(self, sport, events, timestamp):
+        # Nothing is buffered until the whole payload is parsed, so a malformed event leaves no partial poll.
+        previous = self._prices[sport]
+        current = {}
+        price_rows, outcome_rows = [], []
+        event_ids = set()
+        for event in events:
+            event_id = int(event['id'])
+            event_ids.add(event_id)
+            for display_group in event.get('displayGroups', []):
+                if display_group['description'] != GAME_LINES:
+                    continue
+                for market in display_group.get('markets', []):
+                    if market['description'] not in LINE_MARKETS:
+                        continue
+                    for outcome in market.get('outcomes', []):
+                        price = outcome.get('price', {})
+                        outcome_id = int(outcome['id'])
+                        value = (price.get('american'), price.get('decimal'), price.get('handicap'))
+                        current[outcome_id] = (event_id, value)
+                        known = previous.get(outcome_id)
+                        if known is None:
+                            outcome_rows.append((outcome_id, event_id, event['description'], event['startTime'],
+                                                 market['description'], market['period']['description'],
+                                                 outcome.get('type'), outcome.get('description'), timestamp))
+                        if known is None or known[1] != value:
+                            price_rows.append((timestamp, event_id, outcome_id, _parse_american(value[0]),
+                                               _parse_float(value[1]), _parse_float(value[2])))
+
+        for outcome_id, (event_id, value) in previous.items():
+            if outcome_id in current:
+                continue
+            if value is not None:
+                price_rows.append((timestamp, event_id, outcome_id, None, None, None))
+            # Outcomes of events still on the board are kept, so they are not described again if they come back.
+            if event_id in event_ids:
+                current[outcome_id] = (event_id, None)
+        self._prices[sport] = current
+        self._price_rows[sport].extend(price_rows)
+        self._outcome_rows[sport].extend(outcome_rows)
+        return len(price_rows)
+
+    def flush(self):
+        """
+        Writes the buffered changes, and compacts the days that are over.
+        """
+        today = datetime.now(timezone.utc).date().isoformat()
+        for sport in self._sports:
+            price_rows, self._price_rows[sport] = self._price_rows[sport], []
+            outcome_rows, self._outcome_rows[sport] = self._outcome_rows[sport], []
+            if len(price_rows) > 0:
+                self._write(PRICES, sport, _get_prices_table(price_rows), [row[0] for row in price_rows])
+            if len(outcome_rows) > 0:
+                self._write(OUTCOMES, sport, _get_outcomes_table(outcome_rows), [row[-1] for row in outcome_rows])
+        for table, sport, date in sorted(self._dates):
+            if date < today:
+                compact_odds_history(self._path, table, sport, date)
+                self._dates.discard((table, sport, date))
+        self._flushed_at = monotonic()
+
+    def _write(self, table_name, sport, table, timestamps):
+        import pyarrow.parquet as pq
+
+        dates = np.array([_get_date(timestamp) for timestamp in timestamps])
+        for date in dict.fromkeys(dates):
+            directory = _get_partition_directory(self._path, table_name, sport, date)
+            os.makedirs(directory, exist_ok=True)
+            # Written under a temporary name first so readers never see a partial file.
+            temp_path = os.path.join(directory, f'.{uuid4().hex}.tmp')
+            pq.write_table(table.take(np.flatnonzero(dates == date)), temp_path)
+            os.replace(temp_path, os.path.join(directory, f'part-{uuid4().hex}.parquet'))
+            self._dates.add((table_name, sport, date))
+
+
+def compact_odds_history(path, table_name, sport, date):
+    """
+    Merges the part files of a day of the odds history into one file, sorted
+    by outcome and time (which is also what compresses best). Outcomes that
+    were described more than once (across runs of the poller) keep their
+    first description.
+
+    Parameters
+    ----------
+    path : string
+        Directory of the odds history.
+
+    table_name : string
+        'prices' or 'outcomes'.
+
+    sport : string
+        'mlb', 'nhl', etc.
+
+    date : string
+        UTC date in 'YYYY-MM-DD' format.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    directory = _get_partition_directory(path, table_name, sport, date)
+    filenames = sorted(filename for filename in os.listdir(directory) if filename.endswith('.parquet'))
+    if filenames == [PARTITION_FILENAME]:
+        return
+    table = pa.concat_tables(pq.read_table(os.path.join(directory, filename)) for filename in filenames)
+    if table_name == PRICES:
+        table = table.sort_by([('OutcomeId', 'ascending'), ('Timestamp', 'ascending')])
+    else:
+        table = table.sort_by([('OutcomeId', 'ascending'), ('FirstSeen', 'ascending')])
+        outcome_ids = table.column('OutcomeId').to_numpy()
+        first = np.ones(len(outcome_ids), dtype=bool)
+        first[1:] = outcome_ids[1:] != outcome_ids[:-1]
+        table = table.filter(pa.array(first))
+    temp_path = os.path.join(directory, f'.{uuid4().hex}.tmp')
+    pq.write_table(table, temp_path)
+    for filename in filenames:
+        os.remove(os.path.join(directory, filename))
+    os.replace(temp_path, os.path.join(directory, PARTITION_FILENAME))
+
+
+def read_odds_history(path, sport, start_date=None, end_date=None):
+    """
+    Loads the line movement of a sport: one row per price change, with the
+    event, market, period and name of each outcome joined in.
+
+    Parameters
+    ----------
+    path : string
+        Directory of the odds history.
+
+    sport : string
+        'mlb', 'nhl', etc.
+
+    start_date, end_date : string
+        Inclusive UTC date bounds ('YYYY-MM-DD' format).
+    """
+    prices = _read_table(path, PRICES, sport, _get_prices_schema(), start_date, end_date)
+    # Outcomes are described on the day they are first seen, which can be before start_date.
+    outcomes = _read_table(path, OUTCOMES, sport, _get_outcomes_schema(), None, end_date)
+    outcomes = outcomes.sort_values('FirstSeen').drop_duplicates('OutcomeId').drop(columns=['EventId', 'FirstSeen'])
+    movement = prices.merge(outcomes, on='OutcomeId', how='left')
+    return movement.sort_values(['EventId', 'OutcomeId', 'Timestamp'], ignore_index=True)
+
+
+def _read_table(path, table_name, sport, schema, start_date, end_date):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    directory = os.path.join(path, table_name, f'sport={sport}')
+    if not os.path.exists(directory):
+        return schema.empty_table().to_pandas()
+    partition_schema = pa.schema([('date', pa.string())])
+    dataset = ds.dataset(directory, schema=pa.unify_schemas([schema, partition_schema]), format='parquet',
+                         partitioning=ds.partitioning(partition_schema, flavor='hive'))
+    expression = None
+    if start_date is not None:
+        expression = ds.field('date') >= start_date
+    if end_date is not None:
+        condition = ds.field('date') <= end_date
+        expression = condition if expression is None else expression & condition
+    return dataset.to_table(columns=schema.names, filter=expression).to_pandas()
+
+
+def _get_prices_table(rows):
+    import pyarrow as pa
+
+    schema = _get_prices_schema()
+    return pa.table([pa.array(values, field.type) for values, field in zip(zip(*rows), schema)], schema=schema)
+
+
+def _get_outcomes_table(rows):
+    import pyarrow as pa
+
+    schema = _get_outcomes_schema()
+    return pa.table([pa.array(values, field.type) for values, field in zip(zip(*rows), schema)], schema=schema)
+
+
+def _parse_american(value):
+    # Bovada's American odds are strings like '-110', '+150' and 'EVEN'.
+    if value is None:
+        return None
+    if value == 'EVEN':
+        return 100
+    return int(value)
+
+
+def _parse_float(value):
+    return None if value is None else float(value)
+
+
+def _get_date(timestamp):
+    return datetime.fromtimestamp(timestamp / 1000, timezone.utc).date().isoformat()
+
+
+def _get_partition_directory(path, table_name, sport, date):
+    return os.path.join(path, table_name, f'sport={sport}', f'date={date}')
+
+
+def _get_decoder():
+    # orjson is optional. It parses Bovada's payloads several times faster than json.
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
@@ -0,0 +1,300 @@
+import numpy as np
+import pandas as pd
+
+MULTIPLICATIVE = 'multiplicative'
+SHIN = 'shin'
+
+# Columns that identify a market (and the snapshot it is from) in the odds tables: the
+# market_dataframes of GamesOdds (odds.MARKET_COLUMNS) and poller.read_odds_history.
+MARKET_KEYS = ['EventId', 'Group', 'Market', 'Period', 'Timestamp']
+
+# Columns that identify an outcome across snapshots. Handicap is part of it, so a spread or
+# total is only compared with itself at the same line.
+OUTCOME_KEYS = ['EventId', 'Group', 'Market', 'Period', 'OutcomeType', 'Outcome', 'Handicap']
+HISTORY_OUTCOME_KEYS = ['OutcomeId', 'Handicap']
+
+SHIN_TOLERANCE = 1e-12
+SHIN_MAX_ITERATIONS = 1000
+
+
+def american_to_decimal(american):
+    """
+    Decimal odds of American odds, e.g. -110 -> 1.909 and +150 -> 2.5.
+    Accepts numbers or Bovada's strings ('-110', '+150', 'EVEN'). Missing or
+    unparseable odds are NaN.
+    """
+    american = _to_float(american)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(american > 0, 1 + american / 100, 1 - 100 / american)
+
+
+def get_decimal_odds(dataframe):
+    """
+    Decimal odds of every row of an odds table. They are computed from
+    OddsAmerican where it is set, since Bovada rounds OddsDecimal to two
+    places (-110 is 1.91 rather than 1.909), and read from OddsDecimal
+    otherwise.
+    """
+    decimal = np.full(len(dataframe), np.nan)
+    if 'OddsDecimal' in dataframe.columns:
+        decimal = _to_float(dataframe['OddsDecimal'])
+    if 'OddsAmerican' in dataframe.columns:
+        american = american_to_decimal(dataframe['OddsAmerican'])
+        decimal = np.where(np.isnan(american), decimal, american)
+    return decimal
+
+
+def get_implied_probabilities(decimal_odds):
+    """
+    Probabilities implied by decimal odds (1 / odds), vig included.
+    """
+    with np.errstate(divide='ignore'):
+        return 1 / np.asarray(decimal_odds, dtype=np.float64)
+
+
+def get_hold(implied, markets):
+    """
+    The book's hold (theoretical margin) of the market of every outcome:
+    1 - 1 / (sum of the market's implied probabilities). -110/-110 holds
+    4.5%.
+
+    Parameters
+    ----------
+    implied : ndarray
+        Implied probability of each outcome.
+
+    markets : ndarray (ints)
+        Market of each outcome, numbered from 0 (e.g. get_market_codes).
+    """
+    total = np.bincount(markets, implied)
+    with np.errstate(divide='ignore'):
+        return (1 - 1 / total)[markets]
+
+
+def get_fair_probabilities(implied, markets, method=MULTIPLICATIVE):
+    """
+    No-vig probabilities of every outcome, which sum to 1 within a market.
+
+    - 'multiplicative' divides each implied probability by the market's
+      total, removing the vig in proportion to the price.
+    - 'shin' uses Shin's model of a book that prices in a share of insider
+      money. It takes more of the vig off long shots than off favorites,
+      which matches the favorite-longshot bias. Two-outcome markets are
+      solved in closed form and larger ones iteratively, all markets at
+      once.
+
+    Markets with a single outcome or a missing price get NaN.
+
+    Parameters
+    ----------
+    implied : ndarray
+        Implied probability of each outcome.
+
+    markets : ndarray (ints)
+        Market of each outcome, numbered from 0 (e.g. get_market_codes).
+
+    method : string
+        'multiplicative' or 'shin'.
+    """
+    implied = np.asarray(implied, dtype=np.float64)
+    count = np.bincount(markets)
+    total = np.bincount(markets, implied)
+    if method == MULTIPLICATIVE:
+        fair = implied / total[markets]
+    elif method == SHIN:
+        fair = _get_shin_probabilities(implied, markets, count, total)
+    else:
+        raise ValueError(f'Unknown vig removal method {method!r} (supported: {MULTIPLICATIVE}, {SHIN})')
+    return np.where(count[markets] > 1, fair, np.nan)
+
+
+def _get_shin_probabilities(implied, markets, count, total):
+    # Solves each market's insider share z, then p = (sqrt(z^2 + 4(1 - z) q^2 / Q) - z) / (2(1 - z)).
+    share = implied ** 2 / total[markets]
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # Two outcomes: z = (Q - 1)(d^2 - Q) / (Q(d^2 - 1)), with d = q1 - q2.
+        difference = 2 * np.bincount(markets, implied ** 2) - total ** 2
+        z = np.where(count == 2, (total - 1) * (difference - total) / (total * (difference - 1)), 0.0)
+
+        # More outcomes: iterate z = (sum(sqrt(z^2 + 4(1 - z) q^2 / Q)) - 2) / (n - 2) to a fixed point.
+        # Only the markets that have not converged yet are iterated, renumbered from 0.
+        rows = np.flatnonzero(count[markets] > 2)
+        ids, local = np.unique(markets[rows], return_inverse=True)
+        local_share = share[rows]
+        local_z = np.zeros(len(ids))
+        for _ in range(SHIN_MAX_ITERATIONS):
+            if len(ids) == 0:
+                break
+            row_z = local_z[local]
+            root = np.sqrt(row_z ** 2 + 4 * (1 - row_z) * local_share)
+            updated = (np.bincount(local, root, len(ids)) - 2) / (count[ids] - 2)
+            # NaN (a missing price) counts as converged.
+            converged = ~(np.abs(updated - local_z) >= SHIN_TOLERANCE)
+            z[ids[converged]] = updated[converged]
+            remaining = ~converged
+            kept = remaining[local]
+            ids, local_z, local_share = ids[remaining], updated[remaining], local_share[kept]
+            local = (np.cumsum(remaining) - 1)[local[kept]]
+        z[ids] = local_z
+
+        z = z[markets]
+        return (np.sqrt(z ** 2 + 4 * (1 - z) * share) - z) / (2 * (1 - z))
+
+
+def get_market_codes(dataframe, market_columns=None):
+    """
+    Numbers the markets of an odds table from 0, one per distinct value of
+    market_columns (by default the MARKET_KEYS the table has, so the same
+    market in two snapshots are two markets).
+    """
+    if market_columns is None:
+        market_columns = [column for column in MARKET_KEYS if column in dataframe.columns]
+    return dataframe.groupby(market_columns, sort=False, dropna=False).ngroup().to_numpy()
+
+
+def get_probabilities(dataframe, market_columns=None, method=MULTIPLICATIVE):
+    """
+    Implied and no-vig probabilities of every outcome of an odds table
+    (GamesOdds.market_dataframes, poller.read_odds_history or
+    get_market_snapshots), as a DataFrame with dataframe's index and
+    ImpliedProbability, FairProbability, FairOddsDecimal and Hold columns.
+
+    Each market is expected to be one line, e.g. a point spread's two sides,
+    as in Bovada's Game Lines.
+
+    Parameters
+    ----------
+    dataframe : DataFrame
+        Odds table with OddsAmerican and/or OddsDecimal.
+
+    market_columns : list (strings)
+        Columns that identify a market. None uses MARKET_KEYS.
+
+    method : string
+        Vig removal method, 'multiplicative' or 'shin'.
+    """
+    markets = get_market_codes(dataframe, market_columns)
+    implied = get_implied_probabilities(get_decimal_odds(dataframe))
+    fair = get_fair_probabilities(implied, markets, method)
+    with np.errstate(divide='ignore'):
+        fair_odds = 1 / fair
+    return pd.DataFrame({
+        'ImpliedProbability': implied,
+        'FairProbability': fair,
+        'FairOddsDecimal': fair_odds,
+        'Hold': get_hold(implied, markets)
+    }, index=dataframe.index)
+
+
+def add_probabilities(dataframe, market_columns=None, method=MULTIPLICATIVE):
+    """
+    Returns a copy of dataframe with the columns of get_probabilities added.
+    """
+    return pd.concat([dataframe, get_probabilities(dataframe, market_columns, method)], axis=1)
+
+
+def get_moneyline_probabilities(dataframe, sides=('Away', 'Home'), method=MULTIPLICATIVE):
+    """
+    Implied and no-vig moneyline probabilities of every game of a
+    GamesOdds.dataframes (one row per game), as a DataFrame with
+    dataframe's index and AwayImpliedProbability, AwayFairProbability,
+    HomeImpliedProbability, HomeFairProbability and MoneylineHold columns.
+
+    Parameters
+    ----------
+    dataframe : DataFrame
+        GamesOdds.dataframes.
+
+    sides : tuple (strings)
+        Column prefixes of the two sides, e.g. ('Team1', 'Team2') for CSGO.
+
+    method : string
+        Vig removal method, 'multiplicative' or 'shin'.
+    """
+    # Stacked side by side so each game is a two-outcome market: rows 2i and 2i + 1.
+    decimal = np.column_stack([american_to_decimal(dataframe[f'{side}MoneylineOddsAmerican']) for side in sides])
+    implied = get_implied_probabilities(decimal).ravel()
+    markets = np.repeat(np.arange(len(dataframe)), len(sides))
+    fair = get_fair_probabilities(implied, markets, method).reshape(-1, len(sides))
+    implied = implied.reshape(-1, len(sides))
+    columns = {}
+    for i, side in enumerate(sides):
+        columns[f'{side}ImpliedProbability'] = implied[:, i]
+        columns[f'{side}FairProbability'] = fair[:, i]
+    columns['MoneylineHold'] = get_hold(implied.ravel(), markets)[::len(sides)]
+    return pd.DataFrame(columns, index=dataframe.index)
+
+
+def add_moneyline_probabilities(dataframe, sides=('Away', 'Home'), method=MULTIPLICATIVE):
+    """
+    Returns a copy of dataframe with the columns of
+    get_moneyline_probabilities added.
+    """
+    return pd.concat([dataframe, get_moneyline_probabilities(dataframe, sides, method)], axis=1)
+
+
+def get_market_snapshots(history, market_columns=('EventId', 'Market', 'Period')):
+    """
+    Turns the line movement of poller.read_odds_history (the outcomes that
+    changed at each poll) into full snapshots of the markets: at every
+    Timestamp a market changed, the latest price of each of its outcomes.
+    Outcomes that are off the board at that time are left out.
+    """
+    market_columns = list(market_columns)
+    times = history[market_columns + ['Timestamp']].drop_duplicates()
+    outcomes = history.drop_duplicates('OutcomeId').drop(columns=['Timestamp'])
+    grid = times.merge(outcomes[market_columns + ['OutcomeId']], on=market_columns).sort_values('Timestamp')
+    prices = history[['Timestamp', 'OutcomeId', 'OddsAmerican', 'OddsDecimal', 'Handicap']].sort_values('Timestamp')
+    snapshots = pd.merge_asof(grid, prices, on='Timestamp', by='OutcomeId')
+    descriptions = outcomes.drop(columns=market_columns + ['OddsAmerican', 'OddsDecimal', 'Handicap'])
+    snapshots = snapshots.merge(descriptions, on='OutcomeId', how='left')
+    snapshots = snapshots[snapshots['OddsDecimal'].notna() | snapshots['OddsAmerican'].notna()]
+    return snapshots.sort_values(market_columns + ['Timestamp', 'OutcomeId'], ignore_index=True)
+
+
+def get_consensus(dataframe, outcome_columns=None, market_columns=None, method=MULTIPLICATIVE, statistic='mean'):
+    """
+    Consensus no-vig price of every outcome across the snapshots of an odds
+    table, e.g. GamesOdds.market_dataframes collected over a day with a
+    Timestamp column, or get_market_snapshots. Returns a DataFrame indexed
+    by outcome_columns with ConsensusProbability, ConsensusOddsDecimal and
+    Snapshots (the number of prices it is based on).
+
+    Parameters
+    ----------
+    dataframe : DataFrame
+        Odds table with one row per outcome and snapshot.
+
+    outcome_columns : list (strings)
+        Columns that identify an outcome across snapshots. None uses
+        HISTORY_OUTCOME_KEYS for tables with an OutcomeId and OUTCOME_KEYS
+        otherwise.
+
+    market_columns : list (strings)
+        Columns that identify a market in a snapshot. None uses MARKET_KEYS.
+
+    method : string
+        Vig removal method, 'multiplicative' or 'shin'.
+
+    statistic : string
+        How the snapshots are combined, 'mean' or 'median'.
+    """
+    if outcome_columns is None:
+        keys = HISTORY_OUTCOME_KEYS if 'OutcomeId' in dataframe.columns else OUTCOME_KEYS
+        outcome_columns = [column for column in keys if column in dataframe.columns]
+    probabilities = get_probabilities(dataframe, market_columns, method)['FairProbability']
+    grouped = probabilities.groupby([dataframe[column] for column in outcome_columns], sort=False, dropna=False)
+    consensus = grouped.agg(statistic)
+    return pd.DataFrame({
+        'ConsensusProbability': consensus,
+        'ConsensusOddsDecimal': 1 / consensus,
+        'Snapshots': grouped.count()
+    })
+
+
+def _to_float(values):
+    # Bovada's odds are strings ('-110', '+150', 'EVEN', '1.91'); the odds history's are numbers.
+    values = pd.Series(values, copy=False)
+    if not pd.api.types.is_numeric_dtype(values.dtype):
+        values = pd.to_numeric(values.replace('EVEN', '100'), errors='coerce')
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
@@ -0,0 +1,70 @@
+import asyncio
+from threading import Lock
+from time import monotonic, sleep
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Each call to acquire() takes one token, blocking only when the bucket is
+    empty, so idle time is spent only when the budget would be exceeded.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added to the bucket per second.
+
+    burst : int
+        Maximum number of tokens the bucket can hold.
+    """
+
+    def __init__(self, rate, burst=1):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._last = monotonic()
+        self._lock = Lock()
+
+    def _take(self):
+        # Takes a token if one is available. Returns the seconds to wait otherwise.
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self._rate
+
+    def acquire(self):
+        wait = self._take()
+        while wait > 0:
+            sleep(wait)
+            wait = self._take()
+
+
+class AsyncRateLimiter(RateLimiter):
+    """
+    Token bucket for coroutines. acquire() must be awaited and yields to the
+    event loop instead of blocking the thread.
+    """
+
+    async def acquire(self):
+        wait = self._take()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._take()
+
+
+def get_host_limiter(limiters, host):
+    """
+    Returns the limiter for a host from a {domain: limiter} dict, matching the
+    host itself, then each parent domain (www.hltv.org -> hltv.org).
+    """
+    parts = host.split('.')
+    for i in range(len(parts)):
+        domain = '.'.join(parts[i:])
+        if domain in limiters:
+            return limiters[domain]
+    return None
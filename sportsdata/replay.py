@@ -0,0 +1,117 @@
+import atexit
+import hashlib
+import json
+import zipfile
+from threading import Lock
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+
+class ResponseArchive:
+    """
+    Zip archive of recorded HTTP responses, for offline runs and benchmarks.
+
+    In record mode every response body the client receives is written as a
+    deflated zip entry. In replay mode the client reads responses back from
+    the archive and never touches the network. A request that was not
+    recorded raises LookupError.
+
+    A URL requested several times (e.g. odds polled in a loop) keeps every
+    response. They are replayed in the order they were recorded, and the last
+    one is repeated once the sequence runs out.
+
+    Parameters
+    ----------
+    path : string
+        Path of the .zip archive.
+
+    mode : string
+        'record' (overwrites the archive) or 'replay'.
+    """
+
+    def __init__(self, path, mode):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f'Invalid archive mode: {mode}')
+        self._path = path
+        self._mode = mode
+        self._lock = Lock()
+        self._zip = None
+        self._entries = {}  # key -> [zip entry names], in recorded order
+        self._replayed = {}  # key -> number of responses replayed so far
+
+        self._open()
+
+    def _open(self):
+        if self._mode == RECORD:
+            setattr(self, '_zip', zipfile.ZipFile(self._path, 'w', zipfile.ZIP_DEFLATED))
+            # The zip's central directory is only written on close.
+            atexit.register(self.close)
+            return
+        setattr(self, '_zip', zipfile.ZipFile(self._path, 'r'))
+        for info in self._zip.infolist():
+            key = info.filename.split('/')[0]
+            self._entries.setdefault(key, []).append(info)
+
+    @property
+    def mode(self):
+        return self._mode
+
+    def _get_key(self, method, url, body):
+        digest = hashlib.sha1(f'{method} {url}'.encode())
+        if body is not None:
+            digest.update(body if isinstance(body, bytes) else json.dumps(body, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def record(self, method, url, body, content, content_type):
+        key = self._get_key(method, url, body)
+        with self._lock:
+            entries = self._entries.setdefault(key, [])
+            info = zipfile.ZipInfo(f'{key}/{len(entries)}')
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.comment = json.dumps({'method': method, 'url': url, 'content_type': content_type}).encode()
+            self._zip.writestr(info, content)
+            entries.append(info)
+
+    def replay(self, method, url, body):
+        """
+        Returns (content, content_type) of the next recorded response for a request.
+        """
+        key = self._get_key(method, url, body)
+        with self._lock:
+            if key not in self._entries:
+                raise LookupError(f'No recorded response for {method} {url} in {self._path}')
+            entries = self._entries[key]
+            i = self._replayed.get(key, 0)
+            self._replayed[key] = i + 1
+            info = entries[min(i, len(entries) - 1)]
+            content = self._zip.read(info)
+        return content, json.loads(info.comment)['content_type']
+
+    def close(self):
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                setattr(self, '_zip', None)
+
+
+def get_request_body(kwargs):
+    # The part of a request's kwargs that identifies it besides method and URL (POST payloads).
+    return kwargs.get('json', kwargs.get('data'))
+
+
+_archives = {}
+
+
+def open_archive(path, mode):
+    """
+    Returns the archive for a path, opening it on first use. The blocking and
+    asyncio clients share one instance so a recording run writes a single file.
+    """
+    archive = _archives.get(path)
+    if archive is None or archive.mode != mode or archive._zip is None:
+        if archive is not None:
+            archive.close()
+        archive = ResponseArchive(path, mode)
+        _archives[path] = archive
+    return archive
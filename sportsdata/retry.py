@@ -0,0 +1,138 @@
+import random
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic, time
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request to a host whose circuit breaker is open.
+    """
+    pass
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Delays grow exponentially with "full jitter" (a random delay between 0 and
+    backoff * 2 ** attempt), so that workers that failed together do not retry
+    together. A 429/503 with a Retry-After header waits as long as the server
+    asked instead. Only idempotent requests (GET, HEAD) are retried, so a POST
+    is never sent twice.
+
+    Parameters
+    ----------
+    retries : int
+        Number of retries after the first attempt.
+
+    backoff : float
+        Base delay in seconds.
+
+    backoff_max : float
+        Longest delay in seconds, including Retry-After.
+
+    statuses : tuple (ints)
+        HTTP status codes that are retried.
+    """
+
+    def __init__(self, retries, backoff, backoff_max, statuses):
+        self._retries = retries
+        self._backoff = backoff
+        self._backoff_max = backoff_max
+        self._statuses = statuses
+
+    def should_retry(self, method, attempt, status=None):
+        """
+        Whether to retry after a failed attempt (0-based). status is None when
+        the request failed without a response (connection error or timeout).
+        """
+        if method not in ('GET', 'HEAD') or attempt >= self._retries:
+            return False
+        return status is None or status in self._statuses
+
+    def get_delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self._backoff_max)
+        return random.uniform(0, min(self._backoff_max, self._backoff * 2 ** attempt))
+
+
+def _parse_retry_after(value):
+    # Retry-After is either a number of seconds or an HTTP date.
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After `threshold` consecutive failures (connection errors, timeouts, 5xx)
+    the circuit opens and requests to the host fail immediately with
+    CircuitOpenError. Once `reset_timeout` seconds have passed, a single trial
+    request is let through: success closes the circuit, failure opens it again.
+
+    Parameters
+    ----------
+    host : string
+        Host the breaker guards, used in error messages.
+
+    threshold : int
+        Consecutive failures that open the circuit.
+
+    reset_timeout : float
+        Seconds the circuit stays open before a trial request.
+    """
+
+    def __init__(self, host, threshold, reset_timeout):
+        self._host = host
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = Lock()
+
+    def check(self):
+        """
+        Raises CircuitOpenError if a request to the host should not be sent.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._trial or monotonic() - self._opened_at < self._reset_timeout:
+                raise CircuitOpenError(f'Circuit open for {self._host} after {self._failures} consecutive failures')
+            self._trial = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self._threshold:
+                self._opened_at = monotonic()
+            self._trial = False
+
+    def release_trial(self):
+        """
+        Ends a trial request that raised something other than a connection
+        error or timeout (e.g. a broken chunked response or an interrupt).
+        The circuit opens again, so the next trial waits for reset_timeout
+        instead of the host being locked out. Does nothing outside a trial.
+        """
+        with self._lock:
+            if self._trial:
+                self._opened_at = monotonic()
+                self._trial = False
@@ -0,0 +1,236 @@
+import numpy as np
+import pandas as pd
+from .util import build_dataframe_from_columns
+
+_EMPTY = {}
+_MISSING = object()
+
+
+class Field:
+    """
+    One output column of a record type and where its value comes from.
+
+    Parameters
+    ----------
+    attribute : string
+        Name of the record's attribute, e.g. '_at_bats'.
+
+    column : string
+        Name of the output column, e.g. 'AtBats'.
+
+    source : string
+        Name of the JSON object the value is read from, passed to
+        Schema.extract (e.g. 'batting'). None for values the record's parser
+        computes itself.
+
+    path : string
+        Dotted key path of the value within the source, e.g. 'person.id'.
+
+    converter : callable
+        Applied to the value when it is present.
+
+    default : object
+        Value used when the path is missing from the source. A field with a
+        default is optional.
+
+    optional : bool
+        Whether the path may be missing from the source, in which case the
+        field is set to its default (None unless one is given). The paths
+        of other fields are required: a source without them raises KeyError.
+
+    dtype : string
+        pandas dtype of the column in build_dataframe, e.g. 'Int16',
+        'boolean', 'category' or 'datetime64[ns]' (parsed from ISO 8601
+        strings). None leaves the dtype to pandas' inference.
+    """
+
+    def __init__(self, attribute, column, source=None, path=None, converter=None, default=None, dtype=None,
+                 optional=False):
+        self.attribute = attribute
+        self.column = column
+        self.source = source
+        self.path = path
+        self.converter = converter
+        self.default = default
+        self.dtype = dtype
+        self.optional = optional or default is not None
+
+
+class Schema:
+    """
+    Field mapping of a record type, declared once as a list of Fields and
+    compiled into plain Python functions when the schema is created:
+
+    - extract(source, record, data) sets every field read from one source
+      with direct attribute stores. Nested dicts shared by several paths are
+      looked up once. Required paths are indexed directly and raise
+      KeyError when missing; optional ones fall back to their defaults.
+    - get_fields(record) returns the record's {column: value} dict.
+    - build_dataframe(records) builds a DataFrame straight from the records'
+      attributes, one list per column, without a dict per record. Columns
+      with a dtype are converted to it: nullable ints and booleans,
+      categoricals for low-cardinality strings and datetimes.
+
+    Parameters
+    ----------
+    fields : list (Field)
+        The record's fields, in output column order.
+    """
+
+    def __init__(self, fields):
+        self._fields = fields
+        self._attributes = tuple(field.attribute for field in fields)
+        self._columns = tuple(field.column for field in fields)
+        self._dtypes = {field.column: field.dtype for field in fields if field.dtype is not None}
+        self._extractors = {}
+        self._reset = None
+        self._get_fields = None
+        self._get_columns = None
+
+        self._compile()
+
+    def _compile(self):
+        sources = []
+        for field in self._fields:
+            if field.source is not None and field.source not in sources:
+                sources.append(field.source)
+        for source in sources:
+            self._extractors[source] = _compile_extractor([field for field in self._fields
+                                                           if field.source == source])
+        setattr(self, '_reset', _compile_function(
+            'reset', 'record', [f'record.{attribute} = None' for attribute in self._attributes]))
+        setattr(self, '_get_fields', _compile_function(
+            'get_fields', 'record', ['return {'] +
+            [f'    {column!r}: record.{attribute},' for attribute, column in zip(self._attributes, self._columns)] +
+            ['}']))
+        setattr(self, '_get_columns', _compile_function(
+            'get_columns', 'records', ['return {'] +
+            [f'    {column!r}: [record.{attribute} for record in records],'
+             for attribute, column in zip(self._attributes, self._columns)] + ['}']))
+
+    @property
+    def attributes(self):
+        return self._attributes
+
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def dtypes(self):
+        return self._dtypes
+
+    def reset(self, record):
+        """
+        Sets every field of a record to None.
+        """
+        self._reset(record)
+
+    def extract(self, source, record, data):
+        """
+        Sets the fields read from a source (e.g. 'batting') on a record from
+        that source's JSON object.
+        """
+        self._extractors[source](record, data)
+
+    def get_fields(self, record):
+        return self._get_fields(record)
+
+    def get_columns(self, records, typed=False):
+        """
+        Returns {column: list of values} for a list of records. With typed,
+        the columns that have a dtype are converted to pandas arrays of it.
+        """
+        columns = self._get_columns(records)
+        if typed:
+            for column, dtype in self._dtypes.items():
+                columns[column] = _to_array(columns[column], dtype)
+        return columns
+
+    def build_dataframe(self, records, index=None):
+        """
+        Same columns and index as util.build_dataframe on each record's
+        get_fields(), with the fields' dtypes applied.
+        """
+        if len(records) == 0:
+            return pd.DataFrame()
+        return build_dataframe_from_columns(self.get_columns(records, True), len(records), index)
+
+
+def _to_array(values, dtype):
+    # Categoricals and nullable ints are built from their codes/values and
+    # masks directly, which is several times faster than pandas' inference.
+    if dtype == 'category':
+        codes = {None: -1}
+        indexes = [codes.setdefault(value, len(codes) - 1) for value in values]
+        del codes[None]
+        # Sorted categories, as pandas orders them.
+        categories = sorted(codes)
+        lookup = np.full(len(categories) + 1, -1, dtype=np.int32)
+        lookup[[codes[category] for category in categories]] = np.arange(len(categories))
+        return pd.Categorical.from_codes(lookup[np.array(indexes, dtype=np.int32)], categories)
+    if dtype.startswith('Int'):
+        mask = np.array([value is None for value in values], dtype=bool)
+        if mask.any():
+            values = [0 if value is None else value for value in values]
+        return pd.arrays.IntegerArray(np.array(values, dtype=dtype.lower()), mask)
+    if dtype.startswith('datetime64'):
+        # Records keep datetimes as ISO 8601 strings; None becomes NaT.
+        return pd.to_datetime(values, format='ISO8601').astype(dtype).array
+    return pd.array(values, dtype=dtype)
+
+
+def _compile_extractor(fields):
+    # Required paths (and the nested dicts on the way to them) are indexed
+    # directly, so a payload missing one raises KeyError. Optional paths use
+    # .get(), with an empty dict for missing nested dicts.
+    namespace = {'_EMPTY': _EMPTY, '_MISSING': _MISSING}
+    required = set()
+    for field in fields:
+        if not field.optional:
+            keys = tuple(field.path.split('.'))
+            required.update(keys[:i] for i in range(1, len(keys)))
+
+    lines = []
+    variables = {(): 'data'}
+
+    def get_variable(keys):
+        # Local variable holding the nested dict at keys, looked up once per call.
+        if keys not in variables:
+            parent = get_variable(keys[:-1])
+            variables[keys] = f'node{len(variables)}'
+            if keys in required:
+                lines.append(f'{variables[keys]} = {parent}[{keys[-1]!r}]')
+            else:
+                lines.append(f'{variables[keys]} = {parent}.get({keys[-1]!r}, _EMPTY)')
+        return variables[keys]
+
+    for i, field in enumerate(fields):
+        keys = tuple(field.path.split('.'))
+        parent = get_variable(keys[:-1])
+        converter = f'converter{i}'
+        if field.converter is not None:
+            namespace[converter] = field.converter
+        if not field.optional:
+            value = f'{parent}[{keys[-1]!r}]'
+            if field.converter is not None:
+                value = f'{converter}({value})'
+            lines.append(f'record.{field.attribute} = {value}')
+            continue
+        default = 'None'
+        if field.default is not None:
+            default = f'default{i}'
+            namespace[default] = field.default
+        if field.converter is None:
+            lines.append(f'record.{field.attribute} = {parent}.get({keys[-1]!r}, {default})')
+        else:
+            lines.append(f'value = {parent}.get({keys[-1]!r}, _MISSING)')
+            lines.append(f'record.{field.attribute} = {default} if value is _MISSING else {converter}(value)')
+    return _compile_function('extract', 'record, data', lines, namespace)
+
+
+def _compile_function(name, args, lines, namespace=None):
+    namespace = dict(namespace or {})
+    body = '\n'.join('    ' + line for line in lines) or '    pass'
+    exec(f'def {name}({args}):\n{body}\n', namespace)
+    return namespace[name]
@@ -1,6 +1,6 @@
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
+from ..client import get_json
+from ..util import build_dataframe
 from datetime import datetime
 from dateutil import tz
 
@@ -36,9 +36,8 @@ class Match:
         setattr(self, '_surface_type', 'todo')
         setattr(self, '_ten_venue_id', 'todo')
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'TenMatchId': self._ten_match_id,
             'MatchDateTime': self._match_date_time,
             'MatchDate': self._match_date,
@@ -51,7 +50,10 @@ class Match:
             'SurfaceType': self._surface_type,
             'TenVenueId': self._ten_venue_id
         }
-        return pd.DataFrame([fields_to_include], index=[self._ten_match_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._ten_match_id])
 
 
 class Matches:
@@ -78,12 +80,10 @@ class Matches:
 
     def _get_matches(self, start_date, end_date):
         url = f'https://www.ultimatetennisstatistics.com/tournamentEvents'
-        matches = requests.get(url, verify=VERIFY_REQUESTS).json()
+        matches = get_json(url)
         # TODO
 
     @property
     def dataframes(self):
-        frames = []
-        for match in self.__iter__():
-            frames.append(match.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([match._get_fields() for match in self],
+                               [match._ten_match_id for match in self])
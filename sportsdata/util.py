@@ -1,4 +1,8 @@
-from datetime import datetime
+import numpy as np
+import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from dateutil import tz
 
 # def get_season_by_date_range(date_strings, seasons):
@@ -26,53 +30,108 @@ from dateutil import tz
 #             return season['start_date'], season['end_date']
 #     print('Unable to find start and end dates for ' + season)
 
+_JSON_TYPES = {str, int, bool, type(None)}
+
+
 def utc_to_pst(utc):
     from_zone = tz.gettz('UTC')
     to_zone = tz.gettz('America/Los_Angeles')
     pst = utc.replace(tzinfo=from_zone).astimezone(to_zone).replace(tzinfo=None)
     return pst
 
-def set_odds(GameOdds, odds):
-    setattr(GameOdds, '_event_description', odds['description'])
-    setattr(GameOdds, '_event_start_time', datetime.fromtimestamp(odds['startTime']/1000))
-
-    # Game Lines, Alternative Lines, Score Props, etc.
-    for display_group in odds['displayGroups']:
-        if display_group['description'] == 'Game Lines':
-            # Moneyline, Point Spread, Total
-            for market in display_group['markets']:
-                if market['description'] == 'Moneyline' and market['period']['description'] == 'Match':
-                    get_moneyline(GameOdds, market)
-                if market['description'] in ['Point Spread', 'Puck Line'] and market['period']['description'] == 'Match':
-                    get_point_spread(GameOdds, market)
-                if market['description'] == 'Total' and market['period']['description'] == 'Match':
-                    get_totals(GameOdds, market)
-
-
-def get_moneyline(GameOdds, market):
-    for outcome in market['outcomes']:
-        if outcome['type'] == 'A':
-            setattr(GameOdds, '_away_team_name', outcome['description'])
-            setattr(GameOdds, '_away_moneyline_american', outcome['price']['american'])
-            setattr(GameOdds, '_away_moneyline_decimal', outcome['price']['decimal'])
-        if outcome['type'] == 'H':
-            setattr(GameOdds, '_home_team_name', outcome['description'])
-            setattr(GameOdds, '_home_moneyline_american', outcome['price']['american'])
-            setattr(GameOdds, '_home_moneyline_decimal', outcome['price']['decimal'])
-
-
-def get_point_spread(GameOdds, market):
-    for outcome in market['outcomes']:
-        if outcome['type'] == 'A':
-            setattr(GameOdds, '_away_handicap', outcome['price']['handicap'])
-        if outcome['type'] == 'H':
-            setattr(GameOdds, '_home_handicap', outcome['price']['handicap'])
-
-
-def get_totals(GameOdds, market):
-    for outcome in market['outcomes']:
-        if outcome['description'] == 'Over':
-            # totals['Over'] = outcome['price']['handicap']
-            setattr(GameOdds, '_over_under', outcome['price']['handicap'])
-        # if outcome['description'] == 'Under':
-            # totals['Under'] = outcome['price']['handicap']
+
+def build_dataframe(records, index=None):
+    """
+    Builds one DataFrame from a list of record field dicts (each record's
+    _get_fields()), column by column.
+
+    The result has the same columns, dtypes and index as concatenating each
+    record's one-row dataframe, without creating a frame per record. A column
+    that holds None anywhere stays object dtype with None in it, as it does
+    when one-row frames are concatenated, instead of becoming NaN.
+
+    Parameters
+    ----------
+    records : list (dicts)
+        Field dicts, all with the same keys.
+
+    index : list
+        Index value per record. None gives every row index 0, like the
+        one-row frames built with index=None.
+    """
+    if len(records) == 0:
+        return pd.DataFrame()
+    return build_dataframe_from_columns({key: [record[key] for record in records] for key in records[0]},
+                                        len(records), index)
+
+
+def build_dataframe_from_columns(columns, length, index=None):
+    """
+    Builds a DataFrame from {column: list of values}, with the same dtypes and
+    index as build_dataframe. length is the number of rows. Columns that are
+    already pandas arrays keep their dtype.
+    """
+    for key, values in columns.items():
+        if isinstance(values, list) and any(value is None for value in values):
+            # An object Series keeps None; a list or ndarray would be inferred as str/float.
+            columns[key] = pd.Series(values, dtype=object)
+    dataframe = pd.DataFrame(columns)
+    dataframe.index = [0] * length if index is None else index
+    return dataframe
+
+
+def iter_map(function, items, max_workers=1):
+    """
+    Yields function(item) for each item, in order, as soon as each result is
+    ready. With max_workers > 1 the calls run on that many threads, and at
+    most 2 * max_workers results are pending at once, so a long list of items
+    is never held in memory all at once.
+
+    Parameters
+    ----------
+    function : callable
+        Called with one item, e.g. GameBoxscore with a game ID.
+
+    items : iterable
+        Items to call the function with.
+
+    max_workers : int
+        Number of calls to run concurrently (default 1, i.e. one at a time).
+    """
+    if max_workers <= 1:
+        yield from map(function, items)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(function, item))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # The consumer stopped early: calls that have not started are dropped.
+            for future in pending:
+                future.cancel()
+
+
+def to_json_safe(fields):
+    """
+    Returns a copy of a record's field dict (its _get_fields()) that can be
+    passed straight to json.dumps or requests' json=: datetimes and dates
+    become ISO 8601 strings, NaN becomes None and numpy scalars become
+    Python ones.
+    """
+    dic = {}
+    for key, value in fields.items():
+        if type(value) in _JSON_TYPES:
+            pass
+        elif isinstance(value, float) and value != value:
+            value = None
+        elif isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        elif isinstance(value, np.generic):
+            value = value.item()
+        dic[key] = value
+    return dic
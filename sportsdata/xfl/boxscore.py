@@ -1,5 +1,7 @@
 import pandas as pd
 import requests
+from ..schema import Field, Schema
+from ..util import to_json_safe
 from .constants import CURRENT_SEASON
 from .scoring import ScoringPlays
 from .util import get_game_ids_by_season_and_week
@@ -11,6 +13,84 @@ from selenium import webdriver
 from time import sleep
 
 
+def _split(separator, i):
+    return lambda value: value.split(separator)[i]
+
+
+def _get_down(i):
+    # 'Third Down': '4/11 (36%)'
+    return lambda value: value.split()[0].split('/')[i]
+
+
+def _get_team_fields(team):
+    # Away and home columns only differ by their prefix.
+    prefix = team.capitalize()
+    stats = [
+        ('first_downs', 'FirstDowns', 'Total First Downs', None),
+        ('rush_attempts', 'RushAttempts', 'Attempts', None),
+        ('rush_yards', 'RushYards', 'Net Rushing Yards', None),
+        ('rush_touchdowns', 'RushTouchdowns', 'TD Rushing-Passing-Defensive', _split('-', 0)),
+        ('pass_completions', 'PassCompletions', 'Completed/Attempts', _split('/', 0)),
+        ('pass_attempts', 'PassAttempts', 'Completed/Attempts', lambda value: value.split('/')[1].split()[0]),
+        ('pass_yards', 'PassYards', 'Net Passing Yards', None),
+        ('interceptions', 'Interceptions', 'Interceptions', None),
+        ('times_sacked', 'TimesSacked', 'Sacks/Yards', _split('/', 0)),  # todo-check this is correct
+        ('yards_lost_from_sacks', 'YardsLostFromSacks', 'Sacks/Yards', _split('/', 1)),  # todo-check this is correct
+        # todo- net pass yards?
+        ('fumbles_lost', 'FumblesLost', 'Fumbles Lost', None),
+        ('turnovers', 'Turnovers', 'Turnovers', None),
+        ('penalty_yards', 'PenaltyYards', 'Penalty Yards', None),  # yards from penalties?
+        ('total_yards', 'TotalYards', 'Total Net Yards', None),
+        ('third_down_conversions', 'ThirdDownConversions', 'Third Down', _get_down(0)),
+        ('third_down_attempts', 'ThirdDownAttempts', 'Third Down', _get_down(1)),
+        ('fourth_down_conversions', 'FourthDownConversions', 'Fourth Down', _get_down(0)),
+        ('fourth_down_attempts', 'FourthDownAttempts', 'Fourth Down', _get_down(1))
+    ]
+    return [Field(f'_{team}_{attribute}', f'{prefix}{column}', team, key, converter)
+            for attribute, column, key, converter in stats]
+
+
+PLAYER_BOXSCORE_SCHEMA = Schema([
+    # Field('_xfl_player_id', 'XflPlayerId'),
+    Field('_player_name', 'PlayerName', 'box', 'PlayerName'),
+    Field('_xfl_game_id', 'XflGameId', 'box', 'XflGameId'),
+    Field('_season', 'Season'),
+    # Field('_away_team_id', 'AwayTeamId'),
+    Field('_away_team', 'AwayTeam', 'box', 'AwayTeam'),
+    # Field('_home_team_id', 'HomeTeamId'),
+    Field('_home_team', 'HomeTeam', 'box', 'HomeTeam'),
+    Field('_is_away', 'IsAway', 'box', 'IsAway'),
+    Field('_team_result', 'TeamResult', 'box', 'TeamResult'),
+    Field('_result_note', 'ResultNote'),
+    Field('_overtime', 'Overtime'),
+    Field('_passing_completions', 'PassingCompletions', 'passing', 'PassingCompletions'),
+    Field('_passing_attempts', 'PassingAttempts', 'passing', 'PassingAttempts'),
+    Field('_passing_completion_pct', 'PassingCompletionPct', 'passing', 'PassingCompletionPct'),
+    Field('_passing_yards', 'PassingYards', 'passing', 'PassingYards'),
+    Field('_passing_long', 'PassingLong', 'passing', 'PassingLong'),
+    Field('_passing_touchdowns', 'PassingTouchdowns', 'passing', 'PassingTouchdowns'),
+    Field('_passing_interceptions', 'PassingInterceptions', 'passing', 'PassingInterceptions'),
+    Field('_passing_rating', 'PassingRating', 'passing', 'PassingRating'),
+    Field('_rushing_attempts', 'RushingAttempts', 'rushing', 'RushingAttempts'),
+    Field('_rushing_yards', 'RushingYards', 'rushing', 'RushingYards'),
+    Field('_rushing_average', 'RushingAverage', 'rushing', 'RushingAverage'),
+    Field('_rushing_long', 'RushingLong', 'rushing', 'RushingLong'),
+    Field('_rushing_touchdowns', 'RushingTouchdowns', 'rushing', 'RushingTouchdowns'),
+    Field('_receiving_targets', 'ReceivingTargets', 'receiving', 'ReceivingTargets'),
+    Field('_receptions', 'Receptions', 'receiving', 'Receptions'),
+    Field('_receiving_yards', 'ReceivingYards', 'receiving', 'ReceivingYards'),
+    Field('_receiving_average', 'ReceivingAverage', 'receiving', 'ReceivingAverage'),
+    Field('_receiving_long', 'ReceivingLong', 'receiving', 'ReceivingLong'),
+    Field('_receiving_touchdowns', 'ReceivingTouchdowns', 'receiving', 'ReceivingTouchdowns'),
+    Field('_one_point_conversions', 'OnePointConversions'),
+    Field('_two_point_conversions', 'TwoPointConversions'),
+    Field('_three_point_conversions', 'ThreePointConversions')
+])
+
+GAME_BOXSCORE_SCHEMA = Schema([Field('_xfl_game_id', 'XflGameId')] + _get_team_fields('away') +
+                              _get_team_fields('home'))
+
+
 class PlayerBoxscore:
     """
     Player's boxscore data from an individual XFL game.
@@ -24,70 +104,21 @@ class PlayerBoxscore:
         Object that contains scoring play information.
     """
     def __init__(self, box_json, scoring_plays):
-        # self._xfl_player_id = None
-        self._player_name = None
-        self._xfl_game_id = None
-        self._season = None
+        PLAYER_BOXSCORE_SCHEMA.reset(self)
         self._away_team_id = None
         self._home_team_id = None
-        self._is_away = None
-        self._team_result = None
-        self._result_note = None
-        self._overtime = None
-        self._passing_completions = None
-        self._passing_attempts = None
-        self._passing_completion_pct = None
-        self._passing_yards = None
-        self._passing_long = None
-        self._passing_touchdowns = None
-        self._passing_interceptions = None
-        self._passing_rating = None
-        self._rushing_attempts = None
-        self._rushing_yards = None
-        self._rushing_average = None
-        self._rushing_long = None
-        self._rushing_touchdowns = None
-        self._receiving_targets = None
-        self._receptions = None
-        self._receiving_yards = None
-        self._receiving_average = None
-        self._receiving_long = None
-        self._receiving_touchdowns = None
 
         self._parse_boxscore(box_json, scoring_plays)
 
     def _parse_boxscore(self, box, scoring_plays):
-        setattr(self, '_player_name', box['PlayerName'])
-        setattr(self, '_xfl_game_id', box['XflGameId'])
-        setattr(self, '_away_team', box['AwayTeam'])
-        setattr(self, '_home_team', box['HomeTeam'])
-        setattr(self, '_is_away', box['IsAway'])
-        setattr(self, '_team_result', box['TeamResult'])
-
+        PLAYER_BOXSCORE_SCHEMA.extract('box', self, box)
+        # Players without passing, rushing or receiving stats keep None for those columns.
         if 'PassingAttempts' in box:
-            setattr(self, '_passing_completions', box['PassingCompletions'])
-            setattr(self, '_passing_attempts', box['PassingAttempts'])
-            setattr(self, '_passing_completion_pct', box['PassingCompletionPct'])
-            setattr(self, '_passing_yards', box['PassingYards'])
-            setattr(self, '_passing_long', box['PassingLong'])
-            setattr(self, '_passing_touchdowns', box['PassingTouchdowns'])
-            setattr(self, '_passing_interceptions', box['PassingInterceptions'])
-            setattr(self, '_passing_rating', box['PassingRating'])
-
+            PLAYER_BOXSCORE_SCHEMA.extract('passing', self, box)
         if 'RushingAttempts' in box:
-            setattr(self, '_rushing_attempts', box['RushingAttempts'])
-            setattr(self, '_rushing_yards', box['RushingYards'])
-            setattr(self, '_rushing_average', box['RushingAverage'])
-            setattr(self, '_rushing_long', box['RushingLong'])
-            setattr(self, '_rushing_touchdowns', box['RushingTouchdowns'])
-
+            PLAYER_BOXSCORE_SCHEMA.extract('rushing', self, box)
         if 'ReceivingTargets' in box:
-            setattr(self, '_receiving_targets', box['ReceivingTargets'])
-            setattr(self, '_receptions', box['Receptions'])
-            setattr(self, '_receiving_yards', box['ReceivingYards'])
-            setattr(self, '_receiving_average', box['ReceivingAverage'])
-            setattr(self, '_receiving_long', box['ReceivingLong'])
-            setattr(self, '_receiving_touchdowns', box['ReceivingTouchdowns'])
+            PLAYER_BOXSCORE_SCHEMA.extract('receiving', self, box)
 
         setattr(self, '_one_point_conversions', self._get_point_conversions(box['PlayerName'], scoring_plays, 1))
         setattr(self, '_two_point_conversions', self._get_point_conversions(box['PlayerName'], scoring_plays, 2))
@@ -102,51 +133,16 @@ class PlayerBoxscore:
                 conversions += 1
         return conversions
 
+    def _get_fields(self):
+        return PLAYER_BOXSCORE_SCHEMA.get_fields(self)
+
     @property
     def dataframe(self):
-        fields_to_include = {
-            # 'XflPlayerId': self._xfl_player_id,
-            'PlayerName': self._player_name,
-            'XflGameId': self._xfl_game_id,
-            'Season': self._season,
-            # 'AwayTeamId': self._away_team_id,
-            'AwayTeam': self._away_team,
-            # 'HomeTeamId': self._home_team_id,
-            'HomeTeam': self._home_team,
-            'IsAway': self._is_away,
-            'TeamResult': self._team_result,
-            'ResultNote': self._result_note,
-            'Overtime': self._overtime,
-            'PassingCompletions': self._passing_completions,
-            'PassingAttempts': self._passing_attempts,
-            'PassingCompletionPct': self._passing_completion_pct,
-            'PassingYards': self._passing_yards,
-            'PassingLong': self._passing_long,
-            'PassingTouchdowns': self._passing_touchdowns,
-            'PassingInterceptions': self._passing_interceptions,
-            'PassingRating': self._passing_rating,
-            'RushingAttempts': self._rushing_attempts,
-            'RushingYards': self._rushing_yards,
-            'RushingAverage': self._rushing_average,
-            'RushingLong': self._rushing_long,
-            'RushingTouchdowns': self._rushing_touchdowns,
-            'ReceivingTargets': self._receiving_targets,
-            'Receptions': self._receptions,
-            'ReceivingYards': self._receiving_yards,
-            'ReceivingAverage': self._receiving_average,
-            'ReceivingLong': self._receiving_long,
-            'ReceivingTouchdowns': self._receiving_touchdowns,
-            'OnePointConversions': self._one_point_conversions,
-            'TwoPointConversions': self._two_point_conversions,
-            'ThreePointConversions': self._three_point_conversions,
-        }
-        return pd.DataFrame([fields_to_include], index=None)
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class PlayerBoxscores:
@@ -303,10 +299,7 @@ class PlayerBoxscores:
 
     @property
     def dataframes(self):
-        frames = []
-        for boxscore in self.__iter__():
-            frames.append(boxscore.dataframe)
-        return pd.concat(frames)
+        return PLAYER_BOXSCORE_SCHEMA.build_dataframe(self._boxscores)
 
     @property
     def to_dicts(self):
@@ -329,7 +322,7 @@ class GameBoxscore:
         The Selenium web driver used to scrape XFL's website.
     """
     def __init__(self, game_id, wd):
-        self._xfl_game_id = None
+        GAME_BOXSCORE_SCHEMA.reset(self)
         self._season = None
         self._game_date_time = None
         self._game_date = None
@@ -337,56 +330,22 @@ class GameBoxscore:
         self._game_status = None
         self._away_team_id = None
         self._away_points = None
-        self._away_first_downs = None
-        self._away_rush_attempts = None
-        self._away_rush_yards = None
-        self._away_rush_touchdowns = None
-        self._away_pass_completions = None
-        self._away_pass_attempts = None
-        self._away_pass_yards = None
         self._away_pass_touchdowns = None
-        self._away_interceptions = None
-        self._away_times_sacked = None
-        self._away_yards_lost_from_sacks = None
         self._away_net_pass_yards = None
-        self._away_total_yards = None
         self._away_fumbles = None
-        self._away_fumbles_lost = None
-        self._away_turnovers = None
         self._away_penalties = None
         self._away_yards_from_penalties = None
-        self._away_third_down_conversions = None
-        self._away_third_down_attempts = None
-        self._away_fourth_down_conversions = None
-        self._away_fourth_down_attempts = None
         self._away_time_of_possession = None
         self._away_record_wins = None
         self._away_record_losses = None
         self._away_record_pct = None
         self._home_team_id = None
         self._home_points = None
-        self._home_first_downs = None
-        self._home_rush_attempts = None
-        self._home_rush_yards = None
-        self._home_rush_touchdowns = None
-        self._home_pass_completions = None
-        self._home_pass_attempts = None
-        self._home_pass_yards = None
         self._home_pass_touchdowns = None
-        self._home_interceptions = None
-        self._home_times_sacked = None
-        self._home_yards_lost_from_sacks = None
         self._home_net_pass_yards = None
-        self._home_total_yards = None
         self._home_fumbles = None
-        self._home_fumbles_lost = None
-        self._home_turnovers = None
         self._home_penalties = None
         self._home_yards_from_penalties = None
-        self._home_third_down_conversions = None
-        self._home_third_down_attempts = None
-        self._home_fourth_down_conversions = None
-        self._home_fourth_down_attempts = None
         self._home_time_of_possession = None
         self._home_team_record_wins = None
         self._home_team_record_losses = None
@@ -425,99 +384,22 @@ class GameBoxscore:
                 home_stats[col] = home_value
 
         setattr(self, '_xfl_game_id', game_id)
-        setattr(self, '_away_first_downs', away_stats['Total First Downs'])
-        setattr(self, '_away_rush_attempts', away_stats['Attempts'])
-        setattr(self, '_away_rush_yards', away_stats['Net Rushing Yards'])
-        setattr(self, '_away_rush_touchdowns', away_stats['TD Rushing-Passing-Defensive'].split('-')[0])
-        setattr(self, '_away_pass_completions', away_stats['Completed/Attempts'].split('/')[0])
-        setattr(self, '_away_pass_attempts', away_stats['Completed/Attempts'].split('/')[1].split()[0])
-        setattr(self, '_away_pass_yards', away_stats['Net Passing Yards'])
-        setattr(self, '_away_interceptions', away_stats['Interceptions'])
-        setattr(self, '_away_times_sacked', away_stats['Sacks/Yards'].split('/')[0])  # todo-check this is correct
-        setattr(self, '_away_yards_lost_from_sacks',
-                away_stats['Sacks/Yards'].split('/')[1])  # todo-check this is correct
-        # todo- net pass yards?
-        setattr(self, '_away_fumbles_lost', away_stats['Fumbles Lost'])
-        setattr(self, '_away_turnovers', away_stats['Turnovers'])
-        setattr(self, '_away_penalty_yards', away_stats['Penalty Yards'])  # yards from penalties?
-        setattr(self, '_away_total_yards', away_stats['Total Net Yards'])
-        setattr(self, '_away_third_down_conversions', away_stats['Third Down'].split()[0].split('/')[0])
-        setattr(self, '_away_third_down_attempts', away_stats['Third Down'].split()[0].split('/')[1])
-        setattr(self, '_away_fourth_down_conversions', away_stats['Fourth Down'].split()[0].split('/')[0])
-        setattr(self, '_away_fourth_down_attempts', away_stats['Fourth Down'].split()[0].split('/')[1])
-
-        setattr(self, '_home_first_downs', home_stats['Total First Downs'])
-        setattr(self, '_home_rush_attempts', home_stats['Attempts'])
-        setattr(self, '_home_rush_yards', home_stats['Net Rushing Yards'])
-        setattr(self, '_home_rush_touchdowns', home_stats['TD Rushing-Passing-Defensive'].split('-')[0])
-        setattr(self, '_home_pass_completions', home_stats['Completed/Attempts'].split('/')[0])
-        setattr(self, '_home_pass_attempts', home_stats['Completed/Attempts'].split('/')[1].split()[0])
-        setattr(self, '_home_pass_yards', home_stats['Net Passing Yards'])
-        setattr(self, '_home_interceptions', home_stats['Interceptions'])
-        setattr(self, '_home_times_sacked', home_stats['Sacks/Yards'].split('/')[0])  # todo-check this is correct
-        setattr(self, '_home_yards_lost_from_sacks',
-                home_stats['Sacks/Yards'].split('/')[1])  # todo-check this is correct
-        # todo- net pass yards?
-        setattr(self, '_home_fumbles_lost', home_stats['Fumbles Lost'])
-        setattr(self, '_home_turnovers', home_stats['Turnovers'])
-        setattr(self, '_home_penalty_yards', home_stats['Penalty Yards'])  # yards from penalties?
-        setattr(self, '_home_total_yards', home_stats['Total Net Yards'])
-        setattr(self, '_home_third_down_conversions', home_stats['Third Down'].split()[0].split('/')[0])
-        setattr(self, '_home_third_down_attempts', home_stats['Third Down'].split()[0].split('/')[1])
-        setattr(self, '_home_fourth_down_conversions', home_stats['Fourth Down'].split()[0].split('/')[0])
-        setattr(self, '_home_fourth_down_attempts', home_stats['Fourth Down'].split()[0].split('/')[1])
+        GAME_BOXSCORE_SCHEMA.extract('away', self, away_stats)
+        GAME_BOXSCORE_SCHEMA.extract('home', self, home_stats)
 
         setattr(self, '_players', PlayerBoxscores(self, wd))
         setattr(self, '_scoring_plays', ScoringPlays(self, wd)) #todo
 
+    def _get_fields(self):
+        return GAME_BOXSCORE_SCHEMA.get_fields(self)
+
     @property
     def dataframe(self):
-        fields_to_include = {
-            'XflGameId': self._xfl_game_id,
-
-            'AwayFirstDowns': self._away_first_downs,
-            'AwayRushAttempts': self._away_rush_attempts,
-            'AwayRushYards': self._away_rush_yards,
-            'AwayRushTouchdowns': self._away_rush_touchdowns,
-            'AwayPassCompletions': self._away_pass_completions,
-            'AwayPassAttempts': self._away_pass_attempts,
-            'AwayPassYards': self._away_pass_yards,
-            'AwayInterceptions': self._away_interceptions,
-            'AwayTimesSacked': self._away_times_sacked,
-            'AwayYardsLostFromSacks': self._away_yards_lost_from_sacks,
-            'AwayFumblesLost': self._away_fumbles_lost,
-            'AwayTurnovers': self._away_turnovers,
-            'AwayPenaltyYards': self._away_penalty_yards,
-            'AwayTotalYards': self._away_total_yards,
-            'AwayThirdDownConversions': self._away_third_down_conversions,
-            'AwayThirdDownAttempts': self._away_third_down_attempts,
-            'AwayFourthDownConversions': self._away_fourth_down_conversions,
-            'AwayFourthDownAttempts': self._away_fourth_down_attempts,
-            'HomeFirstDowns': self._home_first_downs,
-            'HomeRushAttempts': self._home_rush_attempts,
-            'HomeRushYards': self._home_rush_yards,
-            'HomeRushTouchdowns': self._home_rush_touchdowns,
-            'HomePassCompletions': self._home_pass_completions,
-            'HomePassAttempts': self._home_pass_attempts,
-            'HomePassYards': self._home_pass_yards,
-            'HomeInterceptions': self._home_interceptions,
-            'HomeTimesSacked': self._home_times_sacked,
-            'HomeYardsLostFromSacks': self._home_yards_lost_from_sacks,
-            'HomeFumblesLost': self._home_fumbles_lost,
-            'HomeTurnovers': self._home_turnovers,
-            'HomePenaltyYards': self._home_penalty_yards,
-            'HomeTotalYards': self._home_total_yards,
-            'HomeThirdDownConversions': self._home_third_down_conversions,
-            'HomeThirdDownAttempts': self._home_third_down_attempts,
-            'HomeFourthDownConversions': self._home_fourth_down_conversions,
-            'HomeFourthDownAttempts': self._home_fourth_down_attempts
-        }
-        return pd.DataFrame([fields_to_include], index=[self._xfl_game_id])
+        return pd.DataFrame([self._get_fields()], index=[self._xfl_game_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
+        dic = to_json_safe(self._get_fields())
         dic['AwayPlayers'] = self._away_players.to_dicts
         dic['HomePlayers'] = self._home_players.to_dicts
         return dic
@@ -572,18 +454,14 @@ class GameBoxscores:
 
     @property
     def dataframes(self):
-        frames = []
-        for game in self.__iter__():
-            frames.append(game.dataframe)
-        return pd.concat(frames)
+        return GAME_BOXSCORE_SCHEMA.build_dataframe(self._games, [game._xfl_game_id for game in self])
 
     @property
     def player_dataframes(self):
-        frames = []
+        records = []
         for game in self._boxscores:
-            players = game._players.dataframes
-            frames.append(players)
-        return pd.concat(frames)
+            records.extend(game._players)
+        return PLAYER_BOXSCORE_SCHEMA.build_dataframe(records)
 
     @property
     def to_dicts(self):
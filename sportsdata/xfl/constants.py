@@ -9,4 +9,6 @@ ROSTER_URLS = [
     {'team_id': 8, 'url': 'https://www.xfl.com/en-US/teams/tampa-bay/vipers-articles/tampa-bay-vipers-roster'}
 ]
 
-CURRENT_SEASON = 2020
\ No newline at end of file
+CURRENT_SEASON = 2020
+
+XFL_ODDS_URL = 'https://www.bovada.lv/services/sports/event/v2/events/A/description/football/xfl'
@@ -1,7 +1,7 @@
 # TODO: setup nba player classes
 import pandas as pd
-import requests
-from ..constants import VERIFY_REQUESTS
+from ..client import get_text
+from ..util import build_dataframe, to_json_safe
 from .constants import ROSTER_URLS
 from pyquery import PyQuery as pq
 from time import sleep
@@ -49,9 +49,8 @@ class Player:
         setattr(self, '_college', td_list[5 + offset].text())
         setattr(self, '_xfl_team_id', team_id)
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'XflPlayerId': self._xfl_player_id,
             'FullName': self._full_name,
             'Position': self._position,
@@ -61,13 +60,14 @@ class Player:
             'JerseyNumber': self._jersey_number,
             'College': self._college
         }
-        return pd.DataFrame([fields_to_include], index=[self._xfl_player_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._xfl_player_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class Players:
@@ -91,7 +91,7 @@ class Players:
 
     def _get_players(self):
         for roster in ROSTER_URLS:
-            roster_html = pq(roster['url'])
+            roster_html = pq(get_text(roster['url']))
             table = list(roster_html('table').items())[0]
             first_row = True
             for tr in table('tr').items():
@@ -103,10 +103,8 @@ class Players:
 
     @property
     def dataframes(self):
-        frames = []
-        for player in self.__iter__():
-            frames.append(player.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([player._get_fields() for player in self],
+                               [player._xfl_player_id for player in self])
 
     @property
     def to_dicts(self):
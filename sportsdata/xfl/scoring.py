@@ -1,4 +1,5 @@
 import pandas as pd
+from ..util import build_dataframe, to_json_safe
 
 
 class ScoringPlay:
@@ -58,9 +59,8 @@ class ScoringPlay:
         setattr(self, '_end_away_score', end_away_score)
         setattr(self, '_end_home_score', end_home_score)
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'XflGameId': self._xfl_game_id,
             'XflTeamAbbrev': self._xfl_team_abbrev,
             'Quarter': self._quarter,
@@ -73,13 +73,14 @@ class ScoringPlay:
             'EndAwayScore': self._end_away_score,
             'EndHomeScore': self._end_home_score,
         }
-        return pd.DataFrame([fields_to_include], index=None)
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=None)
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
         
 
 class ScoringPlays:
@@ -114,10 +115,7 @@ class ScoringPlays:
 
     @property
     def dataframes(self):
-        frames = []
-        for scoring_play in self.__iter__():
-            frames.append(scoring_play.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([scoring_play._get_fields() for scoring_play in self])
 
     @property
     def to_dicts(self):
@@ -1,5 +1,6 @@
 import pandas as pd
-import requests
+from ..client import get_json
+from ..util import build_dataframe, to_json_safe
 from time import sleep
 
 
@@ -22,7 +23,7 @@ class GameWeather:
     def _get_game_weather(self, game):
         darksky_url = 'todo'
         print('Getting weather data from ' + darksky_url)
-        weather = requests.get(darksky_url, verify=VERIFY_REQUESTS).json()
+        weather = get_json(darksky_url)
         setattr(self, '_xfl_game_id', game['xflGameId'])
         setattr(self, '_weather_date_time', datetime.fromtimestamp(weather['currently']['time']).isoformat())
         setattr(self, '_apparent_temperature': weather['currently']['apparentTemperature'])
@@ -34,9 +35,8 @@ class GameWeather:
         setattr(self, '_wind_bearing': weather['currently']['windBearing'])
         setattr(self, '_wind_speed': weather['currently']['windSpeed'])
 
-    @property
-    def dataframe(self):
-        fields_to_include = {
+    def _get_fields(self):
+        return {
             'XflGameId': self._xfl_game_id,
             'WeatherDateTime': self._weather_date_time,
             'ApparentTemperature': self._apparent_temperature,
@@ -48,13 +48,14 @@ class GameWeather:
             'WindBearing': self._wind_bearing,
             'WindSpeed': self._wind_speed
         }
-        return pd.DataFrame([fields_to_include], index=[self._xfl_game_id])
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([self._get_fields()], index=[self._xfl_game_id])
 
     @property
     def to_dict(self):
-        dataframe = self.dataframe
-        dic = dataframe.to_dict('records')[0]
-        return dic
+        return to_json_safe(self._get_fields())
 
 
 class GameWeathers:
@@ -72,7 +73,7 @@ class GameWeathers:
     def _get_game_weathers(self, week):
         url = 'todo'
         print('Getting game data from ' + url)
-        response = requests.get(url, verify=VERIFY_REQUESTS).json()
+        response = get_json(url)
         games = response['data']
         for game in games:
             if now > datetime.strptime(game['gameDateTime'], '%Y-%m-%dT%H:%M:%S'):
@@ -83,10 +84,8 @@ class GameWeathers:
 
     @property
     def dataframes(self):
-        frames = []
-        for weather in self.__iter__():
-            frames.append(weather.dataframe)
-        return pd.concat(frames)
+        return build_dataframe([weather._get_fields() for weather in self],
+                               [weather._xfl_game_id for weather in self])
 
     @property
     def to_dicts(self):
@@ -0,0 +1,30 @@
+import asyncio
+import pytest
+from sportsdata.aclient import AsyncClient
+
+pytest.importorskip('aiohttp')
+
+
+def test_session_closed_when_loop_shuts_down():
+    client = AsyncClient(rate_limits={})
+
+    async def get_session():
+        session, _, _ = await client._get_session()
+        return session
+
+    first = asyncio.run(get_session())
+    second = asyncio.run(get_session())
+    assert first is not second
+    assert first.closed and second.closed
+    assert len(client._sessions) == 0
+
+
+def test_close_closes_session_of_running_loop():
+    client = AsyncClient(rate_limits={})
+
+    async def close_session():
+        session, _, _ = await client._get_session()
+        await client.close()
+        return session
+
+    assert asyncio.run(close_session()).closed
@@ -0,0 +1,195 @@
+import gzip
+import json
+import pandas as pd
+import pytest
+from concurrent.futures import Future
+from sportsdata import backfill, bulk
+from sportsdata.backfill import Backfill, CsvSink, PostSink
+
+# Game IDs of each date of the fake sport.
+GAMES = {
+    '10/01/2019': [1, 2],
+    '10/02/2019': [],
+    '10/03/2019': [3],
+    '10/04/2019': [4, 5, 6],
+}
+
+
+class FakeModule:
+    """
+    Stands in for a sport's boxscore module: get_game_ids_by_dates,
+    GameBoxscore and GameBoxscores, without any request.
+    """
+
+    def __init__(self):
+        self.schedules = []
+        self.fetched = []
+        self.failing = set()
+        module = self
+
+        class GameBoxscore:
+            def __init__(self, game_id):
+                module.fetched.append(game_id)
+                if game_id in module.failing:
+                    raise RuntimeError(f'game {game_id} is down')
+                self._game_id = game_id
+                self._season = 2019
+
+            @property
+            def to_dict(self):
+                return {'GameId': self._game_id}
+
+        class GameBoxscores:
+            def __init__(self, boxscores):
+                self._boxscores = boxscores
+
+            def __iter__(self):
+                return iter(self._boxscores)
+
+            @property
+            def to_dicts(self):
+                return [boxscore.to_dict for boxscore in self]
+
+            @property
+            def dataframes(self):
+                return pd.DataFrame(self.to_dicts).set_index('GameId')
+
+            @property
+            def player_dataframes(self):
+                return pd.DataFrame({'GameId': [boxscore._game_id for boxscore in self], 'PlayerId': 7})
+
+            @property
+            def pbp_dataframes(self):
+                return pd.DataFrame({'GameId': [boxscore._game_id for boxscore in self], 'Event': 'Goal'})
+
+        self.GameBoxscore = GameBoxscore
+        self.GameBoxscores = GameBoxscores
+
+    def get_game_ids_by_dates(self, start_date, end_date):
+        assert start_date == end_date
+        self.schedules.append(start_date)
+        return GAMES[start_date]
+
+
+class RecordingSink:
+    def __init__(self):
+        self.writes = []
+        self.closed = 0
+
+    def write(self, sport, date, game_boxscores):
+        self.writes.append((date, [boxscore._game_id for boxscore in game_boxscores]))
+
+    def close(self):
+        self.closed += 1
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    module = FakeModule()
+    monkeypatch.setitem(backfill.BACKFILL_SPORTS, 'mlb', module)
+    return module
+
+
+def _backfill(tmp_path, sinks, **kwargs):
+    return Backfill('mlb', '10/01/2019', '10/04/2019', sinks, str(tmp_path / 'checkpoint.db'), **kwargs)
+
+
+def test_resume_after_failure(fake, tmp_path):
+    sink = RecordingSink()
+    fake.failing = {5}
+    failed = _backfill(tmp_path, [sink]).run()
+    assert [(date, game_id, attempts) for date, game_id, attempts, _ in failed] == [('2019-10-04', 5, 1)]
+    assert 'RuntimeError: game 5 is down' in failed[0][3]
+    assert sink.writes == [('2019-10-01', [1, 2]), ('2019-10-03', [3]), ('2019-10-04', [4, 6])]
+    assert sink.closed == 1
+
+    # Still failing: only the date with the failed game is revisited, and nothing is rewritten.
+    fake.schedules, fake.fetched, sink.writes = [], [], []
+    failed = _backfill(tmp_path, [sink]).run()
+    assert [(date, game_id, attempts) for date, game_id, attempts, _ in failed] == [('2019-10-04', 5, 2)]
+    assert (fake.schedules, fake.fetched, sink.writes) == (['10/04/2019'], [5], [])
+
+    # The retry succeeds and the date is rewritten whole.
+    fake.failing = set()
+    fake.schedules, fake.fetched = [], []
+    assert _backfill(tmp_path, [sink]).run() == []
+    assert fake.schedules == ['10/04/2019']
+    assert sink.writes == [('2019-10-04', [4, 5, 6])]
+
+    fake.schedules = []
+    assert _backfill(tmp_path, [sink]).run() == []
+    assert fake.schedules == []
+
+
+def test_csv_sink_writes_each_table_by_date(fake, tmp_path):
+    _backfill(tmp_path, [CsvSink(str(tmp_path / 'csv'))]).run()
+    directory = tmp_path / 'csv' / 'mlb' / '2019'
+    games = pd.read_csv(directory / 'game_boxscores' / '2019-10-04_game_boxscores.csv')
+    assert games['GameId'].tolist() == [4, 5, 6]
+    players = pd.read_csv(directory / 'player_boxscores' / '2019-10-01_player_boxscores.csv')
+    assert players.columns.tolist() == ['GameId', 'PlayerId'] and players['GameId'].tolist() == [1, 2]
+    assert (directory / 'play_by_plays' / '2019-10-03_pbp.csv').exists()
+    assert not (directory / 'game_boxscores' / '2019-10-02_game_boxscores.csv').exists()
+
+
+def test_post_sink_sends_gzipped_batches_and_only_retried_games(fake, tmp_path, monkeypatch):
+    posts = []
+
+    def post(url, data, headers, **kwargs):
+        assert headers['Content-Encoding'] == 'gzip'
+        posts.append((url, json.loads(gzip.decompress(data))))
+
+    monkeypatch.setattr(bulk, 'post', post)
+    sink = PostSink('https://localhost/api/', batch_size=2)
+    fake.failing = {5}
+    _backfill(tmp_path, [sink]).run()
+    assert all(url == 'https://localhost/api/mlb/boxscores' for url, _ in posts)
+    assert [[record['GameId'] for record in batch] for _, batch in posts] == [[1, 2], [3], [4, 6]]
+    assert sink._posters == {}
+
+    posts.clear()
+    fake.failing = set()
+    _backfill(tmp_path, [sink]).run()
+    assert [batch for _, batch in posts] == [[{'GameId': 5}]]
+
+
+class InlineExecutor:
+    # Runs the shards of a sharded backfill in this process, one after the other.
+    def __init__(self, max_workers, mp_context=None, initializer=None, initargs=()):
+        self.shards = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def submit(self, function, sport, days, *args):
+        self.shards.append([day.isoformat() for day, _ in days])
+        future = Future()
+        future.set_result(function(sport, days, *args))
+        return future
+
+
+def test_shards_cover_every_date_once(fake, tmp_path, monkeypatch):
+    executors = []
+
+    def executor(*args, **kwargs):
+        executors.append(InlineExecutor(*args, **kwargs))
+        return executors[-1]
+
+    monkeypatch.setattr(backfill, 'ProcessPoolExecutor', executor)
+    monkeypatch.setattr(backfill, 'BACKFILL_SHARDS_PER_PROCESS', 1)
+    sink = RecordingSink()
+    assert _backfill(tmp_path, [sink], processes=3).run() == []
+    dates = ['2019-10-01', '2019-10-02', '2019-10-03', '2019-10-04']
+    shards = executors[0].shards
+    assert len(shards) == 3 and sum(shards, []) == dates
+    assert fake.schedules == ['10/01/2019', '10/02/2019', '10/03/2019', '10/04/2019']
+    assert sorted(fake.fetched) == [1, 2, 3, 4, 5, 6]
+    assert [date for date, _ in sink.writes] == ['2019-10-01', '2019-10-03', '2019-10-04']
+
+    # Every date is complete, so another sharded run has nothing to do.
+    fake.schedules = []
+    assert _backfill(tmp_path, [sink], processes=3).run() == []
+    assert fake.schedules == [] and len(executors) == 1
@@ -0,0 +1,72 @@
+import gzip
+import json
+import pytest
+from sportsdata import bulk
+from sportsdata.bulk import BulkPoster
+from threading import Event, Lock, Thread
+
+
+def test_batches_are_gzipped_json(monkeypatch):
+    posts = []
+    monkeypatch.setattr(bulk, 'post', lambda url, data, headers, **kwargs: posts.append((url, data, headers, kwargs)))
+    with BulkPoster('https://localhost/api/mlb/boxscores', batch_size=2, verify=False) as poster:
+        poster.send_all({'GameId': game_id} for game_id in range(5))
+    assert [json.loads(gzip.decompress(data)) for _, data, _, _ in posts] == [
+        [{'GameId': 0}, {'GameId': 1}], [{'GameId': 2}, {'GameId': 3}], [{'GameId': 4}]]
+    url, _, headers, kwargs = posts[0]
+    assert url == 'https://localhost/api/mlb/boxscores'
+    assert headers == {'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}
+    assert kwargs == {'verify': False}
+
+
+def test_uncompressed_bodies(monkeypatch):
+    posts = []
+    monkeypatch.setattr(bulk, 'post', lambda url, data, headers, **kwargs: posts.append((data, headers)))
+    with BulkPoster('https://localhost/api/', compress_level=None) as poster:
+        poster.send({'GameId': 1})
+    assert posts == [(b'[{"GameId":1}]', {'Content-Type': 'application/json'})]
+
+
+def test_send_blocks_while_max_in_flight_batches_are_sent(monkeypatch):
+    lock = Lock()
+    release = Event()
+    state = {'in_flight': 0, 'max_in_flight': 0, 'posted': 0}
+
+    def post(url, data, **kwargs):
+        with lock:
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        release.wait(5)
+        with lock:
+            state['in_flight'] -= 1
+            state['posted'] += 1
+
+    monkeypatch.setattr(bulk, 'post', post)
+    poster = BulkPoster('https://localhost/api/', batch_size=1, max_in_flight=2)
+    sent = []
+
+    def produce():
+        for game_id in range(5):
+            poster.send({'GameId': game_id})
+            sent.append(game_id)
+
+    producer = Thread(target=produce)
+    producer.start()
+    producer.join(0.3)
+    # Two batches are in flight and the third send waits for a free slot.
+    assert producer.is_alive() and sent == [0, 1] and state['in_flight'] == 2
+    release.set()
+    producer.join(5)
+    poster.close()
+    assert sent == [0, 1, 2, 3, 4] and state['posted'] == 5 and state['max_in_flight'] == 2
+
+
+def test_failed_batch_raises_from_flush(monkeypatch):
+    def post(url, data, **kwargs):
+        raise ConnectionError('refused')
+
+    monkeypatch.setattr(bulk, 'post', post)
+    poster = BulkPoster('https://localhost/api/', batch_size=1)
+    poster.send({'GameId': 1})
+    with pytest.raises(ConnectionError):
+        poster.close()
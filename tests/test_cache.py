@@ -0,0 +1,86 @@
+import requests
+from datetime import date, timedelta
+from sportsdata import cache as cache_module
+from sportsdata.cache import ResponseCache
+from sportsdata.client import Client
+from sportsdata.constants import CACHE_FOREVER, CACHE_TTLS
+from sportsdata.mlb.constants import MLB_SCHEDULE_URL
+
+
+def test_schedule_ttl_is_long_only_for_past_dates(tmp_path):
+    cache = ResponseCache(str(tmp_path), 1024, CACHE_TTLS)
+    yesterday = (date.today() - timedelta(days=1)).strftime('%m/%d/%Y')
+    today = date.today().strftime('%m/%d/%Y')
+    assert cache.get_ttl(MLB_SCHEDULE_URL.format(start_date='10/16/2019', end_date='10/30/2019')) == 6 * 60 * 60
+    assert cache.get_ttl(MLB_SCHEDULE_URL.format(start_date='2019-10-16', end_date='2019-10-30')) == 6 * 60 * 60
+    assert cache.get_ttl(MLB_SCHEDULE_URL.format(start_date=yesterday, end_date=yesterday)) == 6 * 60 * 60
+    assert cache.get_ttl(MLB_SCHEDULE_URL.format(start_date=yesterday, end_date=today)) == 5 * 60
+    assert cache.get_ttl('https://example.com/api/v1/schedule?sportId=1') == 5 * 60
+    cache.close()
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, 'time', _Clock())
+    cache = ResponseCache(str(tmp_path), 10, [])
+    cache.set('a', b'aaaa', None, 60)
+    cache.set('b', b'bbbb', None, 60)
+    assert cache.get('a') == (b'aaaa', None)  # a is now more recent than b
+    cache.set('c', b'cccc', 'text/plain', CACHE_FOREVER)
+    assert cache.get('b') is None
+    assert cache.get('a') == (b'aaaa', None) and cache.get('c') == (b'cccc', 'text/plain')
+    cache.close()
+
+
+def test_expired_entries_are_evicted_first(tmp_path, monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache_module, 'time', clock)
+    cache = ResponseCache(str(tmp_path), 10, [])
+    cache.set('old', b'1111', None, CACHE_FOREVER)
+    cache.set('expiring', b'2222', None, 5)
+    clock.now += 10
+    cache.set('new', b'3333', None, 60)
+    assert [row[0] for row in cache._conn.execute('SELECT url FROM responses ORDER BY url')] == ['new', 'old']
+    cache.close()
+
+
+def test_not_modified_reuses_cached_body(tmp_path, monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache_module, 'time', clock)
+    client = Client(rate_limits={}, cache_directory=str(tmp_path), cache_ttls=[(r'example\.com', 60)])
+    requests_sent = []
+
+    def request(method, url, headers=None, **kwargs):
+        requests_sent.append(dict(headers or {}))
+        response = requests.Response()
+        response.url = url
+        if headers and headers.get('If-None-Match') == '"v1"':
+            response.status_code = 304
+            return response
+        response.status_code = 200
+        response._content = b'{"games": 1}'
+        response.headers.update({'Content-Type': 'application/json', 'ETag': '"v1"'})
+        return response
+
+    monkeypatch.setattr(client._session, 'request', request)
+    url = 'https://example.com/api/v1/teams'
+    assert client.get(url).json() == {'games': 1}
+    assert client.get(url).json() == {'games': 1}
+    assert requests_sent == [{}]  # Fresh: served from the cache
+
+    clock.now += 120
+    response = client.get(url)
+    assert response.status_code == 200 and response.json() == {'games': 1}
+    assert requests_sent[1] == {'If-None-Match': '"v1"'}
+    # The 304 made the entry fresh again.
+    client.get(url)
+    assert len(requests_sent) == 2
+    client.close()
@@ -0,0 +1,54 @@
+import pytest
+import sqlite3
+from sportsdata import bulk
+from sportsdata.backfill import PostSink
+from sportsdata.changes import ChangeIndex
+
+
+def _game(goals, plays):
+    return {'NhlGameId': 2019020001, 'HomeGoals': goals,
+            'AwayPlayers': [{'NhlPlayerId': 1, 'Goals': 0}],
+            'HomePlayers': [{'NhlPlayerId': 2, 'Goals': goals}],
+            'PlayByPlay': [{'Event': event} for event in plays]}
+
+
+def _get_changes(index, game):
+    return index.get_changes('nhl', [game], 'NhlGameId', 'NhlPlayerId')
+
+
+def test_unchanged_records_are_skipped(tmp_path):
+    index = ChangeIndex(str(tmp_path / 'changes.db'))
+    changes, hashes = _get_changes(index, _game(1, ['Faceoff', 'Goal']))
+    assert changes == [_game(1, ['Faceoff', 'Goal'])]
+    assert len(hashes) == 5  # Game, 2 players, 2 plays
+
+    # Nothing is saved until the records are delivered.
+    assert _get_changes(index, _game(1, ['Faceoff', 'Goal']))[0] == changes
+    index.save('nhl', hashes)
+    assert _get_changes(index, _game(1, ['Faceoff', 'Goal'])) == ([], [])
+
+    # A stat correction sends the game's fields with only the changed player and the new play.
+    changes, hashes = _get_changes(index, _game(2, ['Faceoff', 'Goal', 'Goal']))
+    assert changes == [{'NhlGameId': 2019020001, 'HomeGoals': 2, 'AwayPlayers': [],
+                        'HomePlayers': [{'NhlPlayerId': 2, 'Goals': 2}], 'PlayByPlay': [{'Event': 'Goal'}]}]
+    assert sorted((kind, key) for _, kind, key, _ in hashes) == [('game', '2019020001'), ('play', '2'),
+                                                                 ('player', '2')]
+    index.close()
+
+
+def test_post_sink_closes_change_index(tmp_path, monkeypatch):
+    posts = []
+    monkeypatch.setattr(bulk, 'post', lambda url, data, **kwargs: posts.append(data))
+
+    class Games:
+        to_dicts = [_game(1, ['Goal'])]
+
+    sink = PostSink('https://localhost/api/', change_index_path=str(tmp_path / 'changes.db'))
+    sink.write('nhl', '2019-10-02', Games())
+    sink.write('nhl', '2019-10-02', Games())
+    assert len(posts) == 1  # The second write has no changes
+    index = sink._change_index
+    sink.close()
+    assert sink._change_index is None and sink._posters == {}
+    with pytest.raises(sqlite3.ProgrammingError):
+        index.get_hashes('nhl', 2019020001)
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+from sportsdata.export import merge_partitioned, read_partitioned, write_partitioned
+
+pytest.importorskip('pyarrow')
+
+
+def _read(path):
+    return read_partitioned(str(path)).sort_values('GameId').to_dict('records')
+
+
+def test_write_partitioned_upserts_by_key(tmp_path):
+    write_partitioned(str(tmp_path), {'GameId': [1], 'Runs': [3]}, [(2019, '2019-07-04')], 'GameId')
+    write_partitioned(str(tmp_path), {'GameId': [2], 'Runs': [5]}, [(2019, '2019-07-04')], 'GameId')
+    write_partitioned(str(tmp_path), {'GameId': [1, 1], 'Runs': [4, 4]}, [(2019, '2019-07-04')] * 2, 'GameId')
+    assert [(row['GameId'], row['Runs']) for row in _read(tmp_path)] == [(1, 4), (1, 4), (2, 5)]
+
+
+def test_write_partitioned_without_key_replaces_date(tmp_path):
+    write_partitioned(str(tmp_path), {'GameId': [1], 'Runs': [3]}, [(2019, '2019-07-04')])
+    write_partitioned(str(tmp_path), {'GameId': [2], 'Runs': [5]}, [(2019, '2019-07-04')])
+    assert [row['GameId'] for row in _read(tmp_path)] == [2]
+
+
+def test_merge_partitioned_upserts_by_key(tmp_path):
+    path, source = tmp_path / 'path', tmp_path / 'source'
+    write_partitioned(str(path), {'GameId': [1, 2], 'Runs': [3, 5]}, [(2019, '2019-07-04')] * 2, 'GameId')
+    write_partitioned(str(source), {'GameId': [2, 3], 'Runs': [6, 7]},
+                      [(2019, '2019-07-04'), (2019, '2019-07-05')], 'GameId')
+    merge_partitioned(str(path), str(source), 'GameId')
+    assert [(row['GameId'], row['Runs']) for row in _read(path)] == [(1, 3), (2, 6), (3, 7)]
+    assert not source.exists()
+
+
+def test_typed_columns_round_trip(tmp_path):
+    first = {'GameId': pd.array([1, 2], dtype='Int32'), 'Runs': pd.array([3, None], dtype='Int8'),
+             'Team': pd.Categorical(['BOS', 'NYY']), 'Win': pd.array([True, None], dtype='boolean'),
+             'Decision': pd.Categorical([None, None], categories=[]),
+             'GameDateTime': pd.array(['2019-07-04T19:10:00', '2019-07-04T13:05:00'], dtype='datetime64[ns]')}
+    second = dict(first, GameId=pd.array([3], dtype='Int32'), Runs=pd.array([7], dtype='Int8'),
+                  Team=pd.Categorical(['TB']), Win=pd.array([False], dtype='boolean'),
+                  Decision=pd.Categorical(['W']), GameDateTime=pd.array([None], dtype='datetime64[ns]'))
+    write_partitioned(str(tmp_path), first, [(2019, '2019-07-04')] * 2, 'GameId')
+    write_partitioned(str(tmp_path), second, [(2019, '2019-07-05')], 'GameId')
+    dataframe = read_partitioned(str(tmp_path)).sort_values('GameId', ignore_index=True)
+    assert {column: str(dataframe[column].dtype) for column in first} == {
+        'GameId': 'Int32', 'Runs': 'Int8', 'Team': 'category', 'Win': 'boolean', 'Decision': 'category',
+        'GameDateTime': 'datetime64[ns]'}
+    assert dataframe['Runs'].tolist() == [3, pd.NA, 7]
+    assert dataframe['Team'].tolist() == ['BOS', 'NYY', 'TB']
+    assert dataframe['Decision'].isna().tolist() == [True, True, False]
+    assert dataframe['GameDateTime'].iloc[0] == pd.Timestamp('2019-07-04T19:10:00')
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sportsdata.fantasy import add_fantasy_points, get_fantasy_points
+
+
+def _points(rows, sport):
+    return get_fantasy_points(pd.DataFrame(rows), sport).to_dict('records')
+
+
+def test_nhl_hat_trick_and_shutout():
+    skater = {'SkaterGoals': 3, 'SkaterAssists': 1, 'SkaterShots': 6, 'SkaterBlocked': 1, 'SkaterPowerPlayGoals': 1,
+              'SkaterPowerPlayAssists': 0, 'SkaterShortHandedGoals': 0, 'SkaterShortHandedAssists': 0,
+              'SkaterShootoutGoals': 0, 'GoalieGoals': None, 'GoalieAssists': None, 'GoalieSaves': None,
+              'GoalieGoalsAgainst': None, 'GoalieDecision': None, 'OnlyGoalie': False, 'Overtime': False}
+    goalie = {'SkaterGoals': None, 'SkaterAssists': None, 'SkaterShots': None, 'SkaterBlocked': None,
+              'SkaterPowerPlayGoals': None, 'SkaterPowerPlayAssists': None, 'SkaterShortHandedGoals': None,
+              'SkaterShortHandedAssists': None, 'SkaterShootoutGoals': None, 'GoalieGoals': 0, 'GoalieAssists': 0,
+              'GoalieSaves': 30, 'GoalieGoalsAgainst': 0, 'GoalieDecision': 'W', 'OnlyGoalie': True,
+              'Overtime': False}
+    skater_points, goalie_points = _points([skater, goalie], 'nhl')
+    # DK: 3 * 8.5 + 5 + 6 * 1.5 + 1.3, and the goals, shots and points bonuses.
+    # FD: 3 * 12 + 8 + 6 * 1.6 + 1.6 + 0.5 for the power play goal.
+    # Yahoo: 3 * 6 + 4 + 6 * 0.5 + 0.5 + 2 for the power play goal.
+    assert skater_points == pytest.approx({'DraftKingsFp': 49.8, 'FanDuelFp': 55.7, 'YahooFp': 27.5})
+    # Win and 30 saves, plus each website's shutout bonus.
+    assert goalie_points == pytest.approx({'DraftKingsFp': 6 + 21 + 4, 'FanDuelFp': 12 + 24 + 8,
+                                           'YahooFp': 5 + 9 + 3})
+
+
+def test_nba_triple_double():
+    row = {'Points': 20, 'ThreePointFieldGoals': 2, 'Rebounds': 10, 'Assists': 11, 'Steals': 1, 'Blocks': 0,
+           'Turnovers': 3}
+    # DK: 20 + 1 + 12.5 + 16.5 + 2 - 1.5, plus the double-double and triple-double bonuses.
+    assert _points([row], 'nba') == [pytest.approx({'DraftKingsFp': 55, 'FanDuelFp': 48.5, 'YahooFp': 49.5})]
+
+
+def test_mlb_batter_and_pitchers():
+    columns = ['Hits', 'Doubles', 'Triples', 'HomeRuns', 'RunsBattedIn', 'Runs', 'BasesOnBalls', 'HitByPitch',
+               'StolenBases', 'InningsPitched', 'PitchedStrikeouts', 'PitchingWin', 'EarnedRuns', 'AllowedHits',
+               'AllowedBasesOnBalls', 'BattersHitByPitch', 'CompleteGame', 'Shutout', 'QualityStart']
+    batter = [3, 1, 0, 1, 3, 2, 1, 0, 1] + [None] * 10
+    starter = [None] * 9 + ['6.1', 7, True, 2, 5, 2, 1, False, False, True]
+    no_hitter = [None] * 9 + ['9.0', 10, True, 0, 0, 0, 0, True, True, True]
+    dataframe = pd.DataFrame([batter, starter, no_hitter], columns=columns).astype(
+        {'PitchingWin': 'boolean', 'CompleteGame': 'boolean', 'Shutout': 'boolean', 'QualityStart': 'boolean'})
+    points = get_fantasy_points(dataframe, 'mlb').to_dict('records')
+    # A single, a double and a home run, 3 RBIs, 2 runs, a walk and a stolen base.
+    assert points[0] == pytest.approx({'DraftKingsFp': 35, 'FanDuelFp': 46.9, 'YahooFp': 34.5})
+    # 19 outs (6.1 innings), 7 strikeouts, a win, 2 earned runs, 5 hits, 2 walks and a hit batter.
+    assert points[1] == pytest.approx({'DraftKingsFp': 23.45, 'FanDuelFp': 44, 'YahooFp': 38})
+    # DK adds the complete game, shutout and no-hitter bonuses, FD the quality start.
+    assert points[2] == pytest.approx({'DraftKingsFp': 54.25, 'FanDuelFp': 67, 'YahooFp': 61})
+
+
+def test_add_fantasy_points_keeps_index_and_websites():
+    dataframe = pd.DataFrame({'Points': [10, np.nan], 'ThreePointFieldGoals': 0, 'Rebounds': 0, 'Assists': 0,
+                              'Steals': 0, 'Blocks': 0, 'Turnovers': 0}, index=['a', 'b'])
+    result = add_fantasy_points(dataframe, 'nba', websites=['fd'])
+    assert result.index.tolist() == ['a', 'b']
+    assert result['FanDuelFp'].tolist() == [10, 0]
+    assert 'DraftKingsFp' not in result
+    with pytest.raises(ValueError):
+        get_fantasy_points(dataframe, 'cricket')
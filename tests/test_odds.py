@@ -0,0 +1,19 @@
+from sportsdata.nba.odds import GamesOdds
+from time import time
+
+
+def _event(event_id, markets=True):
+    outcomes = [{'id': str(event_id * 10 + i), 'description': f'Team {side}', 'type': side[0],
+                 'price': {'american': '-110', 'decimal': '1.91'}} for i, side in enumerate(('Away', 'Home'))]
+    groups = [{'description': 'Game Lines', 'markets': [
+        {'description': 'Moneyline', 'period': {'description': 'Match'}, 'outcomes': outcomes}]}]
+    return {'id': str(event_id), 'description': f'Game {event_id}', 'startTime': int(time() + 3600) * 1000,
+            'type': 'GAMEEVENT', 'displayGroups': groups if markets else []}
+
+
+def test_nba_odds_skip_events_without_moneyline_and_other_items():
+    payload = [{'path': [], 'events': [_event(1), _event(2, markets=False)]},
+               {'path': [], 'events': [_event(3)]}]
+    odds = GamesOdds(payload)
+    assert [game._event_description for game in odds] == ['Game 1']
+    assert odds.to_dicts[0]['AwayTeamName'] == 'Team Away'
@@ -0,0 +1,53 @@
+import json
+import pytest
+from sportsdata import poller
+
+pytest.importorskip('pyarrow')
+
+
+def _event(event_id, american='-110'):
+    outcomes = [{'id': str(event_id * 10 + i), 'description': side, 'type': side[0],
+                 'price': {'american': american, 'decimal': '1.91'}} for i, side in enumerate(('Away', 'Home'))]
+    return {'id': str(event_id), 'description': f'Game {event_id}', 'startTime': 1700000000000, 'type': 'GAMEEVENT',
+            'displayGroups': [{'description': 'Game Lines', 'markets': [
+                {'description': 'Moneyline', 'period': {'description': 'Match'}, 'outcomes': outcomes}]}]}
+
+
+class _Response:
+    def __init__(self, content):
+        self.content = content
+
+
+class _Client:
+    def __init__(self, payloads):
+        self._payloads = payloads
+
+    def request(self, method, url):
+        return _Response(self._payloads.pop(0))
+
+
+def _poll(monkeypatch, tmp_path, sport, payloads):
+    odds_poller = poller.OddsPoller(str(tmp_path), sports=[sport])
+    monkeypatch.setattr(poller, 'get_client', lambda: _Client(payloads))
+    return [odds_poller.poll() for _ in range(len(payloads))], odds_poller
+
+
+def test_malformed_payload_does_not_stop_poller(monkeypatch, tmp_path):
+    good = json.dumps([{'path': [], 'events': [_event(1)]}]).encode()
+    moved = json.dumps([{'path': [], 'events': [_event(1, '-120')]}]).encode()
+    missing_id = [{'path': [], 'events': [_event(1, '-130')]}]
+    del missing_id[0]['events'][0]['displayGroups'][0]['markets'][0]['outcomes'][1]['id']
+    payloads = [good, b'<html>Down for maintenance</html>', json.dumps(missing_id).encode(), good, moved]
+    changes, odds_poller = _poll(monkeypatch, tmp_path, 'nba', payloads)
+    # The bad payloads change nothing and buffer nothing; the same good payload is still unchanged.
+    assert changes == [2, 0, 0, 0, 2]
+    odds_poller.flush()
+    history = poller.read_odds_history(str(tmp_path), 'nba')
+    assert sorted(history['OddsAmerican'].tolist()) == [-120, -120, -110, -110]
+
+
+def test_csgo_polls_only_csgo_items(monkeypatch, tmp_path):
+    payload = [{'path': [{'description': 'CS:GO - BLAST'}], 'events': [_event(1)]},
+               {'path': [{'description': 'Dota 2'}], 'events': [_event(2)]}]
+    changes, _ = _poll(monkeypatch, tmp_path, 'csgo', [json.dumps(payload).encode()])
+    assert changes == [2]
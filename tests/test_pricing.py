@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sportsdata.pricing import (MULTIPLICATIVE, SHIN, american_to_decimal, get_fair_probabilities, get_hold,
+                                get_implied_probabilities, get_probabilities)
+
+
+def _shin_reference(implied):
+    # Bisects Shin's z so that the market's probabilities sum to 1, one market at a time.
+    implied = np.asarray(implied, dtype=np.float64)
+    share = implied ** 2 / implied.sum()
+
+    def probabilities(z):
+        return (np.sqrt(z ** 2 + 4 * (1 - z) * share) - z) / (2 * (1 - z))
+
+    low, high = 0.0, 0.999
+    for _ in range(200):
+        z = (low + high) / 2
+        if probabilities(z).sum() > 1:
+            low = z
+        else:
+            high = z
+    return probabilities((low + high) / 2)
+
+
+def test_american_to_decimal():
+    assert american_to_decimal(['-110', '+150', 'EVEN', None]) == pytest.approx([1 + 100 / 110, 2.5, 2, np.nan],
+                                                                                nan_ok=True)
+
+
+def test_hold_of_even_line():
+    implied = get_implied_probabilities(american_to_decimal([-110, -110]))
+    assert implied == pytest.approx([110 / 210, 110 / 210])
+    assert get_hold(implied, np.array([0, 0])) == pytest.approx([0.04545, 0.04545], abs=1e-5)
+
+
+@pytest.mark.parametrize('method', [MULTIPLICATIVE, SHIN])
+def test_fair_probabilities_sum_to_one(method):
+    # Two moneylines and a three-way market, out of order.
+    american = [-150, -200, 130, 170, 250, 120, 210]
+    markets = np.array([0, 1, 0, 1, 2, 2, 2])
+    fair = get_fair_probabilities(get_implied_probabilities(american_to_decimal(american)), markets, method)
+    assert np.bincount(markets, fair) == pytest.approx([1, 1, 1])
+    assert fair[0] > fair[2] and fair[3] < fair[1]
+
+
+def test_multiplicative_is_proportional():
+    implied = np.array([0.6, 0.5])
+    assert get_fair_probabilities(implied, np.array([0, 0])) == pytest.approx([0.6 / 1.1, 0.5 / 1.1])
+
+
+def test_shin_closed_form_and_iterative_solver_match_reference():
+    two = get_implied_probabilities(american_to_decimal([-300, 240]))
+    three = get_implied_probabilities(american_to_decimal([-150, 280, 400]))
+    markets = np.array([0, 0, 1, 1, 1])
+    fair = get_fair_probabilities(np.concatenate([two, three]), markets, SHIN)
+    assert fair[:2] == pytest.approx(_shin_reference(two), abs=1e-9)
+    assert fair[2:] == pytest.approx(_shin_reference(three), abs=1e-9)
+    # Shin takes more of the vig off the long shot than the multiplicative method does.
+    assert fair[1] < get_fair_probabilities(two, np.array([0, 0]))[1]
+
+
+@pytest.mark.parametrize('method', [MULTIPLICATIVE, SHIN])
+def test_single_outcomes_and_missing_prices_are_nan(method):
+    implied = np.array([0.55, np.nan, 0.8, 0.5, 0.55])
+    fair = get_fair_probabilities(implied, np.array([0, 0, 1, 2, 2]), method)
+    assert np.isnan(fair[:3]).all() and fair[3:].sum() == pytest.approx(1)
+
+
+def test_get_probabilities_of_odds_table():
+    table = pd.DataFrame({
+        'EventId': ['1', '1', '2', '2'], 'Group': 'Game Lines', 'Market': 'Moneyline', 'Period': 'Game',
+        'OddsAmerican': ['-110', '-110', 'EVEN', None], 'OddsDecimal': ['1.91', '1.91', '2.0', '1.8']
+    }, index=[10, 11, 12, 13])
+    probabilities = get_probabilities(table)
+    assert probabilities.index.tolist() == [10, 11, 12, 13]
+    assert probabilities['FairProbability'].tolist() == pytest.approx([0.5, 0.5, 1.8 / 3.8, 2 / 3.8])
+    assert probabilities['Hold'].iloc[0] == pytest.approx(1 / 22)
+    assert probabilities['FairOddsDecimal'].iloc[0] == pytest.approx(2)
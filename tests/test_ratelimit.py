@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+from sportsdata import ratelimit
+from sportsdata.ratelimit import AsyncRateLimiter, RateLimiter, get_host_limiter
+
+
+class _Clock:
+    # Fake monotonic clock; sleeping advances it and records the wait.
+    def __init__(self):
+        self.now = 100.0
+        self.waits = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.waits.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ratelimit, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(ratelimit, 'sleep', clock.sleep)
+    return clock
+
+
+def test_burst_then_waits_at_rate(clock):
+    limiter = RateLimiter(2.0, 3)
+    for _ in range(5):
+        limiter.acquire()
+    # Three tokens at once, then one every 0.5 seconds.
+    assert clock.waits == [0.5, 0.5]
+    clock.now += 0.75
+    limiter.acquire()
+    assert clock.waits == [0.5, 0.5]
+    limiter.acquire()
+    assert clock.waits == [0.5, 0.5, 0.25]
+
+
+def test_idle_time_refills_up_to_burst(clock):
+    limiter = RateLimiter(1.0, 2)
+    limiter.acquire()
+    limiter.acquire()
+    clock.now += 60
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.waits == [1.0]
+
+
+def test_async_limiter_waits_on_the_event_loop(clock, monkeypatch):
+    async def sleep(seconds):
+        clock.sleep(seconds)
+
+    monkeypatch.setattr(ratelimit.asyncio, 'sleep', sleep)
+    limiter = AsyncRateLimiter(4.0, 1)
+
+    async def acquire(count):
+        for _ in range(count):
+            await limiter.acquire()
+
+    asyncio.run(acquire(3))
+    assert clock.waits == [0.25, 0.25]
+
+
+def test_host_limiter_matches_parent_domains():
+    limiters = {'hltv.org': RateLimiter(0.2), 'statsapi.mlb.com': RateLimiter(2.0, 4)}
+    assert get_host_limiter(limiters, 'www.hltv.org') is limiters['hltv.org']
+    assert get_host_limiter(limiters, 'statsapi.mlb.com') is limiters['statsapi.mlb.com']
+    assert get_host_limiter(limiters, 'mlb.com') is None
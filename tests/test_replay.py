@@ -0,0 +1,47 @@
+import pytest
+import requests
+from sportsdata.client import Client
+from sportsdata.replay import RECORD, REPLAY, ResponseArchive
+
+
+def _client(path, mode, monkeypatch, responses=None):
+    client = Client(rate_limits={}, archive_path=str(path), archive_mode=mode)
+
+    def request(method, url, **kwargs):
+        if responses is None:
+            raise AssertionError(f'{method} {url} was sent while replaying')
+        response = requests.Response()
+        response.status_code = 200
+        response._content = responses.pop(0)
+        response.headers['Content-Type'] = 'application/json'
+        return response
+
+    monkeypatch.setattr(client._session, 'request', request)
+    return client
+
+
+def test_record_and_replay_round_trip(tmp_path, monkeypatch):
+    path = tmp_path / 'responses.zip'
+    client = _client(path, RECORD, monkeypatch, [b'{"odds": 1}', b'{"odds": 2}', b'{"id": 7}', b'{"id": 8}'])
+    url = 'https://www.bovada.lv/services/sports/event/v2/events/A/description/hockey/nhl'
+    assert client.get(url).json() == {'odds': 1}
+    assert client.get(url).json() == {'odds': 2}
+    assert client.post('https://localhost/api/games', json={'GameId': 1}).json() == {'id': 7}
+    assert client.post('https://localhost/api/games', json={'GameId': 2}).json() == {'id': 8}
+    client._archive.close()
+
+    client = _client(path, REPLAY, monkeypatch)
+    # Responses of a URL are replayed in recorded order, and the last one is repeated.
+    assert [client.get(url).json() for _ in range(3)] == [{'odds': 1}, {'odds': 2}, {'odds': 2}]
+    assert client.get(url).headers['Content-Type'] == 'application/json'
+    # POSTs are told apart by their body.
+    assert client.post('https://localhost/api/games', json={'GameId': 2}).json() == {'id': 8}
+    assert client.post('https://localhost/api/games', json={'GameId': 1}).json() == {'id': 7}
+    with pytest.raises(LookupError):
+        client.get('https://example.com/not-recorded')
+    client._archive.close()
+
+
+def test_invalid_mode(tmp_path):
+    with pytest.raises(ValueError):
+        ResponseArchive(str(tmp_path / 'responses.zip'), 'rewind')
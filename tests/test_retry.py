@@ -0,0 +1,50 @@
+import pytest
+import requests
+from sportsdata.client import Client
+from sportsdata.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from time import sleep
+
+
+def test_release_trial_reopens_circuit():
+    breaker = CircuitBreaker('example.com', 1, 0.05)
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    sleep(0.06)
+    breaker.check()  # Trial request
+    breaker.release_trial()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    sleep(0.06)
+    breaker.check()
+    breaker.record_success()
+    breaker.check()
+
+
+def test_release_trial_outside_trial_does_nothing():
+    breaker = CircuitBreaker('example.com', 2, 60)
+    breaker.record_failure()
+    breaker.release_trial()
+    breaker.check()
+
+
+def test_unexpected_error_on_trial_does_not_lock_out_host(monkeypatch):
+    client = Client(rate_limits={}, retry_policy=RetryPolicy(0, 0, 0, ()), breaker_threshold=1, breaker_reset=0.05)
+    errors = [requests.ConnectionError('refused'), requests.exceptions.ChunkedEncodingError('broken')]
+
+    def request(method, url, **kwargs):
+        if errors:
+            raise errors.pop(0)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{}'
+        return response
+
+    monkeypatch.setattr(client._session, 'request', request)
+    with pytest.raises(requests.ConnectionError):
+        client.request('GET', 'https://example.com/a')
+    sleep(0.06)
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        client.request('GET', 'https://example.com/a')
+    sleep(0.06)
+    assert client.request('GET', 'https://example.com/a').status_code == 200
@@ -0,0 +1,74 @@
+import pytest
+from sportsdata.mlb import boxscore as mlb_boxscore
+from sportsdata.nhl import boxscore as nhl_boxscore
+from sportsdata.nhl.playbyplay import Play
+from sportsdata.schema import Field, Schema
+
+
+class Record:
+    __slots__ = ('_id', '_name', '_goals', '_shots', '_decision')
+
+
+SCHEMA = Schema([
+    Field('_id', 'Id', 'box', 'person.id'),
+    Field('_name', 'Name', 'box', 'person.fullName', str.upper),
+    Field('_goals', 'Goals', 'box', 'stats.goals', default=0),
+    Field('_shots', 'Shots', 'box', 'stats.shots', int, optional=True),
+    Field('_decision', 'Decision')
+])
+
+
+def _extract(data):
+    record = Record()
+    SCHEMA.reset(record)
+    SCHEMA.extract('box', record, data)
+    return SCHEMA.get_fields(record)
+
+
+def test_extract_reads_paths_and_converts():
+    data = {'person': {'id': 8471214, 'fullName': 'Alex Ovechkin'}, 'stats': {'goals': 2, 'shots': '7'}}
+    assert _extract(data) == {'Id': 8471214, 'Name': 'ALEX OVECHKIN', 'Goals': 2, 'Shots': 7, 'Decision': None}
+
+
+def test_missing_optional_paths_get_defaults():
+    assert _extract({'person': {'id': 1, 'fullName': 'a'}}) == {
+        'Id': 1, 'Name': 'A', 'Goals': 0, 'Shots': None, 'Decision': None}
+
+
+def test_missing_required_path_raises():
+    with pytest.raises(KeyError):
+        _extract({'person': {'id': 1}, 'stats': {'goals': 2, 'shots': 7}})
+    with pytest.raises(KeyError):
+        _extract({'stats': {'goals': 2}})
+
+
+def test_nhl_play_goals():
+    play = Play(2019020001, {
+        'result': {'event': 'Goal', 'description': 'Goal'},
+        'about': {'period': 1, 'periodType': 'REGULAR', 'periodTime': '05:00', 'periodTimeRemaining': '15:00',
+                  'dateTime': '2019-10-02T23:10:00Z', 'goals': {'away': 0, 'home': 1}}
+    })
+    assert (play._away_goals, play._home_goals) == (0, 1)
+
+
+def _game_without_venue_id(schema):
+    # Builds a 'game' source with every path of the schema set, except the venue's id.
+    game = {}
+    for field in schema._fields:
+        if field.source == 'game' and field.path != 'gameData.venue.id':
+            *parents, key = field.path.split('.')
+            node = game
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[key] = '1'
+    return game
+
+
+@pytest.mark.parametrize('module', [mlb_boxscore, nhl_boxscore])
+def test_game_without_venue_id(module):
+    schema = module.GAME_BOXSCORE_SCHEMA
+    game = module.GameBoxscore.__new__(module.GameBoxscore)
+    schema.reset(game)
+    schema.extract('game', game, _game_without_venue_id(schema))
+    fields = schema.get_fields(game)
+    assert fields['MlbVenueId' if module is mlb_boxscore else 'NhlVenueId'] is None
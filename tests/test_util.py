@@ -0,0 +1,40 @@
+import json
+import numpy as np
+import pandas as pd
+from datetime import date, datetime
+from sportsdata.util import build_dataframe, to_json_safe
+
+
+RECORDS = [
+    {'GameId': 1, 'Team': 'BOS', 'Goals': 3, 'Pct': 0.5, 'Win': True, 'Decision': None},
+    {'GameId': 2, 'Team': 'NYR', 'Goals': 1, 'Pct': None, 'Win': False, 'Decision': 'L'},
+]
+
+
+def test_build_dataframe_matches_concatenated_rows():
+    expected = pd.concat([pd.DataFrame([record], index=[record['GameId']]) for record in RECORDS])
+    dataframe = build_dataframe(RECORDS, [record['GameId'] for record in RECORDS])
+    pd.testing.assert_frame_equal(dataframe, expected)
+    assert dataframe.dtypes.drop('Team').to_dict() == {'GameId': np.int64, 'Goals': np.int64, 'Pct': object,
+                                                       'Win': bool, 'Decision': object}
+    assert pd.api.types.is_string_dtype(dataframe['Team'])
+    # Columns with None keep it instead of turning it into NaN.
+    assert dataframe['Pct'].tolist() == [0.5, None] and dataframe['Decision'].tolist() == [None, 'L']
+
+
+def test_build_dataframe_default_index_and_empty():
+    assert build_dataframe(RECORDS).index.tolist() == [0, 0]
+    assert build_dataframe([]).empty
+
+
+def test_to_json_safe():
+    fields = {'GameId': np.int32(7), 'Pct': np.float64(0.25), 'Missing': float('nan'), 'Win': np.bool_(True),
+              'Team': 'BOS', 'Decision': None, 'GameDate': date(2019, 10, 2),
+              'GameDateTime': datetime(2019, 10, 2, 23, 10), 'Timestamp': pd.Timestamp('2019-10-02T23:10:00Z')}
+    safe = to_json_safe(fields)
+    assert safe == {'GameId': 7, 'Pct': 0.25, 'Missing': None, 'Win': True, 'Team': 'BOS', 'Decision': None,
+                    'GameDate': '2019-10-02', 'GameDateTime': '2019-10-02T23:10:00',
+                    'Timestamp': '2019-10-02T23:10:00+00:00'}
+    assert type(safe['GameId']) is int and type(safe['Win']) is bool
+    assert json.loads(json.dumps(safe)) == safe
+    assert fields['GameId'] == np.int32(7)  # The record's dict is not changed